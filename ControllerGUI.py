@@ -163,10 +163,6 @@ FUNCTIONS DEFINED IN THIS FILE:
 ================================================================================
 """
 
-# ============================================================================
-# Imports and Configuration
-# ============================================================================
-
 # ============================================================================
 # Imports and Configuration
 # ============================================================================
@@ -176,12 +172,21 @@ import threading  # For future use if needed
 import platform   # Cross-platform OS detection and adaptation
 import configparser
 import os
+import queue
+import re
+import sys
 import traceback
 import json
 import csv
+import math
 from typing import List, Dict, Any
 from communications import ControllerComm
-from numeric_keypad import NumericKeypad
+from numeric_keypad import NumericKeypad, format_display_value
+from numba_kernels import poll_pipeline
+try:
+    import numpy as np
+except ImportError:
+    np = None
 try:
     import openpyxl  # Used for DataPipe Excel ingest
     HAS_OPENPYXL = True
@@ -227,7 +232,6 @@ JOG_STEP_DEFAULT_DEG = 1.0
 # =====================
 # Example: { 'A': {'pulses': 20000, 'degrees': 360, 'scaling': 20000/360}, ... }
 # Read axis parameters from controller_config.ini
-import configparser
 INI_PATH = os.path.join(os.path.dirname(__file__), 'controller_config.ini')
 # Default descriptors per servo; editable per-tab and echoed on ALL tab
 DEFAULT_SERVO_DESCRIPTIONS = {
@@ -347,6 +351,71 @@ for axis in 'ABCDEFGH':
             'decel_max': float(axis_ini[section].get('decel_max', '180')),
             'description': axis_ini[section].get('description', DEFAULT_SERVO_DESCRIPTIONS.get(ord(axis)-64, '')),
         }
+
+# [CHANGE 2026-10-15 19:20:00 -04:00] Structure-of-arrays view of AXIS_UNITS for the polling hot path.
+# One float64 array per field, indexed 0-7 (axes A-H); AXIS_UNITS stays the dict for everything else.
+# Falls back to plain lists when NumPy is not installed.
+def _axis_field_array(values):
+    """Pack 8 per-axis floats as a float64 array (or a list without NumPy)."""
+    return np.array(values, dtype=np.float64) if np is not None else list(values)
+
+# [CHANGE 2026-10-15 22:05:00 -04:00] Last confirmed setpoints as one 8 x 6 float table instead of
+# 8 dicts; NaN marks "never confirmed". Indexed [servo_num - 1][FIELD_IDX[field]] either way.
+SETPOINT_FIELDS = ('speed', 'accel', 'decel', 'abs_pos', 'rel_pos', 'jog_amount')
+FIELD_IDX = {field: j for j, field in enumerate(SETPOINT_FIELDS)}
+
+def _new_setpoint_table():
+    """8 x len(SETPOINT_FIELDS) float64 array of NaN (nested lists without NumPy)."""
+    if np is not None:
+        return np.full((8, len(SETPOINT_FIELDS)), np.nan, dtype=np.float64)
+    return [[math.nan] * len(SETPOINT_FIELDS) for _ in range(8)]
+
+def get_last_setpoint(window, servo_num, field):
+    """Last confirmed setpoint for a servo field as a float, or None if none was confirmed."""
+    table = getattr(window, '_last_setpoints', None)
+    if table is None:
+        return None
+    val = float(table[servo_num - 1][FIELD_IDX[field]])
+    return val if math.isfinite(val) else None
+
+AXIS_CONFIGURED = [axis in AXIS_UNITS for axis in 'ABCDEFGH']
+AXIS_MIN = _axis_field_array([AXIS_UNITS.get(axis, {}).get('min', 0.0) for axis in 'ABCDEFGH'])
+AXIS_MAX = _axis_field_array([AXIS_UNITS.get(axis, {}).get('max', 0.0) for axis in 'ABCDEFGH'])
+
+def _pulses_per_degree(units):
+    """Scaling if set, else pulses/degrees; never <= 0 (same rule as the position display)."""
+    ppd = units.get('scaling') or (units.get('pulses', 0) / max(units.get('degrees', 1), 1e-9))
+    return ppd if ppd > 0 else 1
+
+# [CHANGE 2026-10-15 21:20:00 -04:00] Pulses per output degree (pulses-per-degree * gearbox) per axis,
+# the one divisor for pulses <-> degrees; AXIS_INDEX maps 'A'..'H' to 0..7.
+# [CHANGE 2026-10-16 00:00:00 -04:00] Single table for the display and setpoint/DataPipe paths, with
+# the reciprocal derived from it so both directions use the same rule.
+AXIS_INDEX = {axis: idx for idx, axis in enumerate('ABCDEFGH')}
+AXIS_SCALE_GEAR = _axis_field_array([
+    _pulses_per_degree(AXIS_UNITS.get(axis, {})) * (AXIS_UNITS.get(axis, {}).get('gearbox', 1) or 1)
+    for axis in 'ABCDEFGH'
+])
+# [CHANGE 2026-10-15 19:55:00 -04:00] Degrees per pulse, so the polling path multiplies instead of dividing.
+AXIS_INV_SG = _axis_field_array([1.0 / float(v) for v in AXIS_SCALE_GEAR])
+# [CHANGE 2026-10-15 20:30:00 -04:00] Soft limits widened by the readback tolerance, for poll_pipeline.
+AXIS_SOFT_MIN = _axis_field_array([float(v) - LIMIT_SOFT_TOLERANCE_DEG for v in AXIS_MIN])
+AXIS_SOFT_MAX = _axis_field_array([float(v) + LIMIT_SOFT_TOLERANCE_DEG for v in AXIS_MAX])
+# [CHANGE 2026-10-15 20:15:00 -04:00] Reused per-tick buffers for the batched pulses -> degrees conversion.
+POLL_RAW_PULSES = _axis_field_array([float('nan')] * 8)
+POLL_DEGREES = _axis_field_array([float('nan')] * 8)
+
+
+# [CHANGE 2026-10-15 19:25:00 -04:00] One bounds check for a whole batch of values (ALL sequence setpoints).
+def validate_axis_values(vals, lo=AXIS_MIN, hi=AXIS_MAX):
+    """
+    Elementwise lo <= vals <= hi for equal-length 1-D sequences.
+    NaN entries (unused slots) pass. Returns a bool array (list without NumPy).
+    """
+    if np is not None:
+        v = np.asarray(vals, dtype=np.float64)
+        return np.isnan(v) | ((v >= np.asarray(lo, dtype=np.float64)) & (v <= np.asarray(hi, dtype=np.float64)))
+    return [v != v or lo_k <= v <= hi_k for v, lo_k, hi_k in zip(vals, lo, hi)]
 # ============================================================================
 
 
@@ -355,8 +424,10 @@ for axis in 'ABCDEFGH':
 # ============================================================================
 
 # Cross-platform compatibility flags
-IS_WINDOWS = platform.system() == "Windows"      # Windows development environment
-IS_RASPBERRY_PI = platform.system() == "Linux" and platform.machine().startswith('arm')  # Pi deployment
+# [CHANGE 2026-10-16 00:45:00 -04:00] Query platform.system() once; downstream code uses SYSTEM.
+SYSTEM = platform.system()
+IS_WINDOWS = SYSTEM == "Windows"      # Windows development environment
+IS_RASPBERRY_PI = SYSTEM == "Linux" and platform.machine().startswith('arm')  # Pi deployment
 
 GLOBAL_FONT = ('Courier New', 10)
 POSITION_LABEL_FONT = ('Courier New', 10, 'bold')
@@ -370,57 +441,150 @@ PENDING_INPUT_BG = '#FFFACD'
 # ============================================================================
 # Utility Functions
 # ============================================================================
-def format_display_value(val):
-    """Display ints without decimals; otherwise one decimal place."""
-    try:
-        fval = round(float(val), 1)
-        if fval.is_integer():
-            return str(int(fval))
-        return f"{fval:.1f}"
-    except Exception:
-        return str(val)
-
-
 def pulses_to_degrees(raw_val, axis_letter):
     """Convert controller pulses to degrees using scaling and gearbox."""
     try:
-        axis_units = AXIS_UNITS.get(axis_letter, {})
-        scaling = axis_units.get('scaling', 1) or 1
-        gearbox = axis_units.get('gearbox', 1) or 1
-        return float(raw_val) / (scaling * gearbox)
+        # [CHANGE 2026-10-15 21:20:00 -04:00] Divisor from the precomputed AXIS_SCALE_GEAR table.
+        return float(raw_val) / float(AXIS_SCALE_GEAR[AXIS_INDEX[axis_letter]])
     except Exception:
         return None
 
 
+def pulses_to_degrees_all(raw_vals):
+    """Convert 8 per-axis pulse values (A-H order) to degrees in one step; NaN stays NaN."""
+    if np is not None:
+        return np.asarray(raw_vals, dtype=np.float64) / AXIS_SCALE_GEAR
+    return [float(raw) / denom for raw, denom in zip(raw_vals, AXIS_SCALE_GEAR)]
+
+
 def bind_jog_press_release(window):
     """Bind mouse press/release for jog CW/CCW buttons to synthesize events."""
     # [CHANGE 2026-03-24 13:36:00 -04:00] Safety: disable press/release jog bindings to avoid hold-runaway behavior.
     return
 
 
-def set_pending_highlight(window, servo_num, field):
+def _element(window, key):
+    """Cached element for key, falling back to window[key] for keys not in ELEMENTS."""
+    element = ELEMENTS.get(key)
+    return element if element is not None else window[key]
+
+
+# [CHANGE 2026-10-15 22:20:00 -04:00] Status light + text are only pushed to Tk when they change;
+# repeated "Enabled"/"At Max Limit" updates from polling and button handlers become no-ops.
+_status_shown = [('Disabled', 'gray')] * 8  # (text, color) last drawn per servo, matches the layout
+
+
+def set_status_indicator(window, servo_num, text, color):
+    """Update S{n}_status_light/status_text to (text, color) unless already showing it."""
+    state = (text, color)
+    if _status_shown[servo_num - 1] == state:
+        return
+    _status_shown[servo_num - 1] = state
+    keys = SERVO_KEYS[servo_num]
+    _element(window, keys['status_light']).update('●', text_color=color)
+    _element(window, keys['status_text']).update(text, text_color=color)
+
+
+# [CHANGE 2026-10-15 22:30:00 -04:00] Degrees and pulses share one Text ('<deg> DEG / <pul> PUL');
+# each caller supplies the part it knows and the other is kept from the last draw.
+_actual_pos_shown = [('0', '0') for _ in range(8)]  # (deg text, pulses text) per servo
+
+
+def set_actual_position(window, servo_num, deg=None, pulses=None):
+    """Update the S{n}_actual_pos readout; None leaves that half unchanged."""
+    old_deg, old_pulses = _actual_pos_shown[servo_num - 1]
+    state = (old_deg if deg is None else str(deg), old_pulses if pulses is None else str(pulses))
+    if state == _actual_pos_shown[servo_num - 1]:
+        return
+    _actual_pos_shown[servo_num - 1] = state
+    _element(window, SERVO_KEYS[servo_num]['actual_pos']).update(f'{state[0]} DEG / {state[1]} PUL')
+
+
+# [CHANGE 2026-10-15 23:00:00 -04:00] Setpoint input backgrounds are only pushed to Tk when the color
+# changes; the poll path re-evaluates the abs_pos highlight on every new position.
+_input_bg_shown = {}  # input key -> background color last applied
+
+
+def _set_input_bg(element, key, color):
+    """Apply a background color to a setpoint input unless it already has it."""
+    if _input_bg_shown.get(key) != color:
+        element.update(background_color=color)
+        _input_bg_shown[key] = color
+
+
+# [CHANGE 2026-10-15 21:45:00 -04:00] Optional values: a caller holding the current read()'s values dict
+# (with the input unchanged since that read) passes it so the text is a dict hit, not a Tk get().
+def set_pending_highlight(window, servo_num, field, values=None):
     """Set field background to yellow if current value differs from last confirmed setpoint."""
     try:
         key = f'S{servo_num}_{field}'
-        current = window[key].get()
+        element = _element(window, key)
+        current = values[key] if values is not None and key in values else element.get()
         if not current or current in ('-', '.'):  # nothing meaningful
-            window[key].update(background_color=DEFAULT_INPUT_BG)
+            _set_input_bg(element, key, DEFAULT_INPUT_BG)
             return False
-        if not hasattr(window, '_last_setpoints') or not window._last_setpoints:
-            window[key].update(background_color=PENDING_INPUT_BG)
+        if getattr(window, '_last_setpoints', None) is None:
+            _set_input_bg(element, key, PENDING_INPUT_BG)
             return True
-        last_val = window._last_setpoints[servo_num - 1].get(field)
+        last_val = window._last_setpoints[servo_num - 1][FIELD_IDX[field]]
         try:
             current_val = float(current)
-            pending = (last_val is None) or abs(current_val - float(last_val)) > 1e-6
+            pending = not math.isfinite(last_val) or abs(current_val - last_val) > 1e-6
         except Exception:
             pending = True
-        window[key].update(background_color=PENDING_INPUT_BG if pending else DEFAULT_INPUT_BG)
+        _set_input_bg(element, key, PENDING_INPUT_BG if pending else DEFAULT_INPUT_BG)
         return pending
     except Exception:
         return False
 
 
+# [CHANGE 2026-10-15 21:05:00 -04:00] Keystroke bursts in a numeric input are coalesced into one
+# highlight recompute HIGHLIGHT_DEBOUNCE_MS after the last change; the recompute is skipped when
+# neither the text nor the confirmed setpoint changed since the last one.
+HIGHLIGHT_DEBOUNCE_MS = 150
+_pending_debounce = {}      # input key -> Tk after() id
+_last_highlight_state = {}  # input key -> (text, last confirmed setpoint) at last recompute
+
+
+def _apply_input_highlight(window, servo_num, field):
+    """Recompute the pending/target highlight for one input (runs from the Tk after() callback)."""
+    key = f'S{servo_num}_{field}'
+    _pending_debounce.pop(key, None)
+    try:
+        text = _element(window, key).get()
+        confirmed = get_last_setpoint(window, servo_num, field)
+    except Exception:
+        return
+    state = (text, confirmed)
+    if _last_highlight_state.get(key) == state:
+        return
+    _last_highlight_state[key] = state
+    if field == 'abs_pos':
+        update_setpoint_highlight(window, servo_num, values={key: text})
+    else:
+        set_pending_highlight(window, servo_num, field, {key: text})
+
+
+def schedule_input_highlight(window, servo_num, field):
+    """Restart the debounce timer for one input; the highlight updates once typing pauses."""
+    key = f'S{servo_num}_{field}'
+    tk_root = getattr(window, 'TKroot', None)
+    if tk_root is None:
+        _apply_input_highlight(window, servo_num, field)
+        return
+    prev = _pending_debounce.pop(key, None)
+    if prev is not None:
+        try:
+            tk_root.after_cancel(prev)
+        except Exception:
+            pass
+    try:
+        # Arguments go through after() itself; no per-keystroke closure is created
+        _pending_debounce[key] = tk_root.after(HIGHLIGHT_DEBOUNCE_MS, _apply_input_highlight, window, servo_num, field)
+    except Exception:
+        _apply_input_highlight(window, servo_num, field)
+
+
 def _axis_letter_for_index(idx: int) -> str:
     """Map 1-based axis index to Galil axis letter (A-H)."""
     letters = AXIS_LETTERS
@@ -431,13 +595,12 @@ def _axis_letter_for_index(idx: int) -> str:
 
 def _clamp_and_convert_deg_to_pulses(axis_letter: str, deg_val: float) -> Dict[str, Any]:
     """Clamp degrees to axis limits, convert to pulses using scaling and gearbox."""
-    axis_units = AXIS_UNITS.get(axis_letter, {})
-    min_val = axis_units.get('min', NUMERIC_LIMITS['abs_pos'][0])
-    max_val = axis_units.get('max', NUMERIC_LIMITS['abs_pos'][1])
-    clamped_deg = max(min_val, min(max_val, deg_val))
-    scaling = axis_units.get('scaling', 1) or 1
-    gearbox = axis_units.get('gearbox', 1) or 1
-    pulses = int(round(clamped_deg * scaling * gearbox))
+    # [CHANGE 2026-10-15 22:40:00 -04:00] Called once per DataPipe row per axis: bounds and
+    # scaling*gearbox come from the per-axis tables instead of AXIS_UNITS dict lookups.
+    # [CHANGE 2026-10-16 00:05:00 -04:00] Bounds are the shared AXIS_MIN/AXIS_MAX limit tables.
+    idx = AXIS_INDEX[axis_letter]
+    clamped_deg = max(float(AXIS_MIN[idx]), min(float(AXIS_MAX[idx]), deg_val))
+    pulses = int(round(clamped_deg * AXIS_SCALE_GEAR[idx]))
     return {'deg': clamped_deg, 'pulses': pulses}
 
 
@@ -697,10 +860,8 @@ def prepare_pvt_payload(rows_deg: List[List[float]], sample_ms: float):
             series_deg.append(conv['deg'])
             series_pulses.append(conv['pulses'])
         vel_deg = _derive_velocities_deg(series_deg, sample_ms)
-        axis_units = AXIS_UNITS.get(axis_letter, {})
-        scale = axis_units.get('scaling', 1) or 1
-        gearbox = axis_units.get('gearbox', 1) or 1
-        vel_pulses = [int(round(v * scale * gearbox)) for v in vel_deg]
+        scale_gear = float(AXIS_SCALE_GEAR[AXIS_INDEX[axis_letter]])
+        vel_pulses = [int(round(v * scale_gear)) for v in vel_deg]
         axis_payload[axis_letter] = {
             'deg': series_deg,
             'pulses': series_pulses,
@@ -761,7 +922,7 @@ def send_pvt_payload(comm, payload, window=None):
     for c in cmds:
         result = comm.send_command(c)
         if window and 'DEBUG_LOG' in window.AllKeysDict:
-            window['DEBUG_LOG'].print(f"[PVT_CMD] {c} -> {result}")
+            ELEMENTS['DEBUG_LOG'].print(f"[PVT_CMD] {c} -> {result}")
         if result is False:
             raise RuntimeError(f'Controller rejected command: {c}')
 
@@ -915,8 +1076,8 @@ def save_motion_defaults_from_values(values):
 def apply_startup_motion_defaults(window):
     """Apply remembered speed/accel/decel or fallback defaults at program startup."""
     remembered = load_motion_defaults().get('servos', {})
-    if not hasattr(window, '_last_setpoints') or not window._last_setpoints or len(window._last_setpoints) != 8:
-        window._last_setpoints = [{f: None for f in ['speed', 'accel', 'decel', 'abs_pos', 'rel_pos', 'jog_amount']} for _ in range(8)]
+    if getattr(window, '_last_setpoints', None) is None:
+        window._last_setpoints = _new_setpoint_table()
 
     def _is_blank_or_zero(raw):
         s = str(raw).strip()
@@ -968,17 +1129,17 @@ def apply_startup_motion_defaults(window):
                 window[decel_key].update(decel_fmt)
 
         try:
-            window._last_setpoints[i - 1]['speed'] = float(speed_fmt)
+            window._last_setpoints[i - 1][FIELD_IDX['speed']] = float(speed_fmt)
         except Exception:
-            window._last_setpoints[i - 1]['speed'] = STARTUP_SPEED_DEFAULT
+            window._last_setpoints[i - 1][FIELD_IDX['speed']] = STARTUP_SPEED_DEFAULT
         try:
-            window._last_setpoints[i - 1]['accel'] = float(accel_fmt)
+            window._last_setpoints[i - 1][FIELD_IDX['accel']] = float(accel_fmt)
         except Exception:
-            window._last_setpoints[i - 1]['accel'] = STARTUP_ACCEL_DECEL_DEFAULT
+            window._last_setpoints[i - 1][FIELD_IDX['accel']] = STARTUP_ACCEL_DECEL_DEFAULT
         try:
-            window._last_setpoints[i - 1]['decel'] = float(decel_fmt)
+            window._last_setpoints[i - 1][FIELD_IDX['decel']] = float(decel_fmt)
         except Exception:
-            window._last_setpoints[i - 1]['decel'] = STARTUP_ACCEL_DECEL_DEFAULT
+            window._last_setpoints[i - 1][FIELD_IDX['decel']] = STARTUP_ACCEL_DECEL_DEFAULT
 
     # [CHANGE 2026-03-24 11:19:00 -04:00] Recompute midpoint speed labels after startup defaults are applied.
     for i in range(1, 9):
@@ -991,21 +1152,33 @@ def apply_startup_motion_defaults(window):
 # Command Mapping Dictionaries
 # -----------------------------
 # GALIL_COMMAND_MAP: Maps GUI actions to Galil controller commands (A-H axes)
-GALIL_COMMAND_MAP = {}
+# [CHANGE 2026-10-15 22:00:00 -04:00] Split by kind so dispatch never needs a callable() check:
+# STATIC_CMD holds fixed command strings, PARAM_CMD holds formatters that take the pulse value.
+STATIC_CMD = {}
+PARAM_CMD = {}
 AXIS_LETTERS = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
 for i in range(1, 9):
     axis_letter = AXIS_LETTERS[i-1]
-    GALIL_COMMAND_MAP[f'S{i}_enable'] = f'SH{axis_letter}'
-    GALIL_COMMAND_MAP[f'S{i}_disable'] = f'MO{axis_letter}'
-    GALIL_COMMAND_MAP[f'S{i}_clear_faults'] = f'CF{axis_letter}'
-    GALIL_COMMAND_MAP[f'S{i}_start'] = f'BG{axis_letter}'
-    GALIL_COMMAND_MAP[f'S{i}_stop'] = f'ST{axis_letter}'
-    GALIL_COMMAND_MAP[f'S{i}_jog'] = (lambda speed, axis=axis_letter: f'JG{axis}={speed};BG{axis}')
-    GALIL_COMMAND_MAP[f'S{i}_speed'] = (lambda value, axis=axis_letter: f'SP{axis}={value}')
-    GALIL_COMMAND_MAP[f'S{i}_accel'] = (lambda value, axis=axis_letter: f'AC{axis}={value}')
-    GALIL_COMMAND_MAP[f'S{i}_decel'] = (lambda value, axis=axis_letter: f'DC{axis}={value}')
-    GALIL_COMMAND_MAP[f'S{i}_abs_pos'] = (lambda value, axis=axis_letter: f'PA{axis}={value}')
-    GALIL_COMMAND_MAP[f'S{i}_rel_pos'] = (lambda value, axis=axis_letter: f'PR{axis}={value}')
+    STATIC_CMD[f'S{i}_enable'] = f'SH{axis_letter}'
+    STATIC_CMD[f'S{i}_disable'] = f'MO{axis_letter}'
+    STATIC_CMD[f'S{i}_clear_faults'] = f'CF{axis_letter}'
+    STATIC_CMD[f'S{i}_start'] = f'BG{axis_letter}'
+    STATIC_CMD[f'S{i}_stop'] = f'ST{axis_letter}'
+    # [CHANGE 2026-10-15 20:55:00 -04:00] Parametric commands are bound str.format methods of templates
+    # specialized per axis here, instead of 40 closures.
+    PARAM_CMD[f'S{i}_jog'] = f'JG{axis_letter}={{}};BG{axis_letter}'.format
+    PARAM_CMD[f'S{i}_speed'] = f'SP{axis_letter}={{}}'.format
+    PARAM_CMD[f'S{i}_accel'] = f'AC{axis_letter}={{}}'.format
+    PARAM_CMD[f'S{i}_decel'] = f'DC{axis_letter}={{}}'.format
+    PARAM_CMD[f'S{i}_abs_pos'] = f'PA{axis_letter}={{}}'.format
+    PARAM_CMD[f'S{i}_rel_pos'] = f'PR{axis_letter}={{}}'.format
+GALIL_COMMAND_MAP = {**STATIC_CMD, **PARAM_CMD}
+# [CHANGE 2026-10-15 23:15:00 -04:00] Per-axis config by 0-based servo index, for handlers that
+# already hold servo_num and would otherwise go servo -> letter -> AXIS_UNITS dict.
+AXIS_UNITS_BY_IDX = tuple(AXIS_UNITS.get(axis, {}) for axis in AXIS_LETTERS)
+# [CHANGE 2026-10-15 23:30:00 -04:00] Zero-position commands built once per axis; the click handler
+# indexes by servo number instead of formatting a command string per press.
+ZERO_POS_CMD = tuple(f"DP{axis}=0" for axis in AXIS_LETTERS)
 
 # Galil only
 COMMAND_MAP = GALIL_COMMAND_MAP
@@ -1064,6 +1237,17 @@ except Exception as comm_error:
     print(f'[ERROR] Failed to initialize controller communications: {error_details}')
 
 
+# [CHANGE 2026-10-15 19:45:00 -04:00] Setpoint rows are materialized from one template per servo
+# instead of five hand-written rows; only the S{n}_ key prefix varies between tabs.
+# (label, field, unit, default text)
+SERVO_FIELD_ROWS = (
+    ('Speed:', 'speed', 'DPS ', '10'),
+    ('Acceleration:', 'accel', 'DPS²', ''),
+    ('Deceleration:', 'decel', 'DPS²', ''),
+    ('Absolute Position (DEG):', 'abs_pos', 'DEG ', ''),
+    ('Relative Position (DEG):', 'rel_pos', 'DEG ', ''),
+)
+
 def build_servo_tab(servo_num):
 ###############################################################################
     """
@@ -1076,6 +1260,22 @@ def build_servo_tab(servo_num):
     """
     axis_letter = AXIS_LETTERS[servo_num - 1]
     desc_default = AXIS_UNITS.get(axis_letter, {}).get('description', DEFAULT_SERVO_DESCRIPTIONS.get(servo_num, ''))
+    field_rows = []
+    for label, field, unit, default in SERVO_FIELD_ROWS:
+        key = f'S{servo_num}_{field}'
+        row = [
+            sg.Text(label, size=(18,1), font=GLOBAL_FONT),
+            sg.Input(default, key=key, size=(10,1), font=GLOBAL_FONT, enable_events=True),
+            sg.Text(unit, font=GLOBAL_FONT),
+            sg.Button('OK', key=f'{key}_ok', size=(4,1), font=GLOBAL_FONT, button_color=('white', 'green')),
+        ]
+        if field == 'speed':
+            row += [
+                sg.Text(' @mid:', font=GLOBAL_FONT, pad=((10,2),(0,0))),
+                sg.Text('—', key=f'S{servo_num}_mid_speed', size=(10,1), font=GLOBAL_FONT, text_color='blue'),
+                sg.Text('DPS', font=GLOBAL_FONT),
+            ]
+        field_rows.append(row)
     layout = [
         [sg.Text(f'Servo {servo_num}', font=POSITION_LABEL_FONT),
          sg.Text('●', key=f'S{servo_num}_status_light', font=('Courier New', 16), text_color='gray'),
@@ -1107,36 +1307,8 @@ def build_servo_tab(servo_num):
                 tooltip='When checked, show OK popup before sending setpoints.',
             ),
         ],
-          [sg.Text('Speed:', size=(18,1), font=GLOBAL_FONT),
-            sg.Input('10', key=f'S{servo_num}_speed', size=(10,1), font=GLOBAL_FONT, enable_events=True),
-                sg.Text('DPS ', font=GLOBAL_FONT),
-            sg.Button('⌨', key=f'S{servo_num}_speed_keypad', size=(2,1), font=GLOBAL_FONT),
-            sg.Button('OK', key=f'S{servo_num}_speed_ok', size=(4,1), font=GLOBAL_FONT, button_color=('white', 'green')),
-            sg.Text(' @mid:', font=GLOBAL_FONT, pad=((10,2),(0,0))),
-            sg.Text('—', key=f'S{servo_num}_mid_speed', size=(10,1), font=GLOBAL_FONT, text_color='blue'),
-            sg.Text('DPS', font=GLOBAL_FONT)],
-        [sg.Text('Acceleration:', size=(18,1), font=GLOBAL_FONT),
-         sg.Input(key=f'S{servo_num}_accel', size=(10,1), font=GLOBAL_FONT, enable_events=True),
-            sg.Text('DPS²', font=GLOBAL_FONT),
-         sg.Button('⌨', key=f'S{servo_num}_accel_keypad', size=(2,1), font=GLOBAL_FONT),
-         sg.Button('OK', key=f'S{servo_num}_accel_ok', size=(4,1), font=GLOBAL_FONT, button_color=('white', 'green'))],
-        [sg.Text('Deceleration:', size=(18,1), font=GLOBAL_FONT),
-         sg.Input(key=f'S{servo_num}_decel', size=(10,1), font=GLOBAL_FONT, enable_events=True),
-            sg.Text('DPS²', font=GLOBAL_FONT),
-         sg.Button('⌨', key=f'S{servo_num}_decel_keypad', size=(2,1), font=GLOBAL_FONT),
-         sg.Button('OK', key=f'S{servo_num}_decel_ok', size=(4,1), font=GLOBAL_FONT, button_color=('white', 'green'))],
-        [sg.Text('Absolute Position (DEG):', size=(18,1), font=GLOBAL_FONT),
-            sg.Input(key=f'S{servo_num}_abs_pos', size=(10,1), font=GLOBAL_FONT, enable_events=True),
-                sg.Text('DEG ', font=GLOBAL_FONT),
-            sg.Button('⌨', key=f'S{servo_num}_abs_pos_keypad', size=(2,1), font=GLOBAL_FONT),
-            sg.Button('OK', key=f'S{servo_num}_abs_pos_ok', size=(4,1), font=GLOBAL_FONT, button_color=('white', 'green'))],
-        [sg.Text('Relative Position (DEG):', size=(18,1), font=GLOBAL_FONT),
-            sg.Input(key=f'S{servo_num}_rel_pos', size=(10,1), font=GLOBAL_FONT, enable_events=True),
-                sg.Text('DEG ', font=GLOBAL_FONT),
-            sg.Button('⌨', key=f'S{servo_num}_rel_pos_keypad', size=(2,1), font=GLOBAL_FONT),
-            sg.Button('OK', key=f'S{servo_num}_rel_pos_ok', size=(4,1), font=GLOBAL_FONT, button_color=('white', 'green'))],
-        [sg.Text('Actual Position:', size=(18,1), font=GLOBAL_FONT), sg.Text('0', key=f'S{servo_num}_actual_pos', size=(10,1), font=GLOBAL_FONT), sg.Text('DEG', font=GLOBAL_FONT)],
-        [sg.Text('Actual Position:', size=(18,1), font=GLOBAL_FONT), sg.Text('0', key=f'S{servo_num}_actual_pos_pulses', size=(10,1), font=GLOBAL_FONT), sg.Text('PUL', font=GLOBAL_FONT)],
+        *field_rows,
+        [sg.Text('Actual Position:', size=(18,1), font=GLOBAL_FONT), sg.Text('0 DEG / 0 PUL', key=f'S{servo_num}_actual_pos', size=(28,1), font=GLOBAL_FONT)],
         [
             sg.Button('Servo Enable', key=f'S{servo_num}_enable', size=(12,2), font=GLOBAL_FONT),
             sg.Button('Servo Disable', key=f'S{servo_num}_disable', size=(12,2), font=GLOBAL_FONT),
@@ -1155,8 +1327,7 @@ def build_servo_tab(servo_num):
                 font=GLOBAL_FONT,
                 enable_events=True,
                 justification='center'
-            ),
-            sg.Button('⌨', key=f'S{servo_num}_jog_amount_keypad', size=(2,1), font=GLOBAL_FONT)
+            )
         ]
     ]
     return layout
@@ -1294,44 +1465,81 @@ def compute_midpoint_speed(speed: float, accel: float, decel: float, mid_distanc
 def update_mid_speed_display(window, servo_num: int):
     """Update the displayed midpoint speed estimate for a servo."""
     try:
-        axis_letter = AXIS_LETTERS[servo_num - 1]
-        axis_cfg = AXIS_UNITS.get(axis_letter, {})
+        axis_cfg = AXIS_UNITS_BY_IDX[servo_num - 1]
         axis_range = (axis_cfg.get('max', 180.0) - axis_cfg.get('min', 0.0))
         # Use half of axis range but cap at 90 deg as requested
         mid_distance = max(0.0, min(90.0, axis_range / 2.0))
+        servo_keys = SERVO_KEYS[servo_num]
         def _parse(key):
-            val = window[key].get() if key in window.AllKeysDict else None
+            val = _element(window, key).get() if key in window.AllKeysDict else None
             try:
                 return float(val)
             except Exception:
                 return None
-        speed = _parse(f'S{servo_num}_speed')
-        accel = _parse(f'S{servo_num}_accel')
-        decel = _parse(f'S{servo_num}_decel')
+        speed = _parse(servo_keys['speed'])
+        accel = _parse(servo_keys['accel'])
+        decel = _parse(servo_keys['decel'])
         mid_speed = compute_midpoint_speed(speed, accel, decel, mid_distance)
-        display_key = f'S{servo_num}_mid_speed'
+        display_key = servo_keys['mid_speed']
         if display_key in window.AllKeysDict:
             if mid_speed is None:
-                window[display_key].update('—')
+                _element(window, display_key).update('—')
             else:
-                window[display_key].update(f"{format_display_value(mid_speed)} DPS")
+                _element(window, display_key).update(f"{format_display_value(mid_speed)} DPS")
     except Exception:
         try:
-            window[f'S{servo_num}_mid_speed'].update('—')
+            _element(window, f'S{servo_num}_mid_speed').update('—')
         except Exception:
             pass
 
 # -----------------------------
 # Main window layout
 # -----------------------------
-NUMERIC_INPUT_KEYS = []
-NUMERIC_KEYPAD_BUTTONS = []
+# [CHANGE 2026-10-15 20:20:00 -04:00] Per-servo widget keys built once and interned, so the event loop
+# and poll handler look keys up instead of formatting 'S{i}_{field}' on every event.
+SERVO_KEY_FIELDS = (
+    'speed', 'accel', 'decel', 'abs_pos', 'rel_pos', 'jog_amount',
+    'actual_pos', 'status_light', 'status_text', 'confirm_ok',
+    'mid_speed', 'comm_indicator', 'comm_label',
+)
+SERVO_KEYS = {i: {field: sys.intern(f'S{i}_{field}') for field in SERVO_KEY_FIELDS} for i in range(1, 9)}
+SETPOINT_OK_ACTIONS = {field: sys.intern(f'{field}_ok') for field in ('speed', 'accel', 'decel', 'abs_pos', 'rel_pos')}
+# [CHANGE 2026-10-15 21:10:00 -04:00] key -> element, filled once the window is finalized.
+ELEMENTS = {}
+
+# [CHANGE 2026-10-15 21:55:00 -04:00] (servo_num, field) -> (min, max, scaling, gearbox), resolved once
+# from AXIS_UNITS/NUMERIC_LIMITS so setpoint handling does a single lookup per event.
+LIMITS = {
+    (i, field): (*get_limits(AXIS_LETTERS[i - 1], field),
+                 AXIS_UNITS.get(AXIS_LETTERS[i - 1], {}).get('scaling', 1),
+                 AXIS_UNITS.get(AXIS_LETTERS[i - 1], {}).get('gearbox', 1))
+    for i in range(1, 9)
+    for field in NUMERIC_LIMITS
+}
+
+# [CHANGE 2026-10-15 22:15:00 -04:00] Built straight from constant field tuples; no temporary lists.
+# Membership is tested on every event; frozensets make that a hash lookup.
+ALL_TAB_POS_FIELDS = ('pos1', 'pos2', 'pos3', 'pos4', 'pos5')
+NUMERIC_INPUT_KEYS = frozenset(
+    [SERVO_KEYS[i][field] for i in range(1, 9) for field in SETPOINT_FIELDS]
+    + [sys.intern(f'ALL_S{i}_{pos_field}') for i in range(1, 9) for pos_field in ALL_TAB_POS_FIELDS]
+)
+NUMERIC_KEYPAD_BUTTONS = frozenset(
+    sys.intern(f'S{i}_{field}_keypad') for i in range(1, 9) for field in SETPOINT_FIELDS
+)
+# [CHANGE 2026-10-15 22:50:00 -04:00] Keystroke filter for numeric inputs, compiled once.
+_NUMERIC_INPUT_FILTER_RE = re.compile(r'[^0-9\-.]')
+
+# [CHANGE 2026-10-15 21:00:00 -04:00] Reverse index: per-servo event key -> (servo_num, action).
+# handle_servo_event looks events up here instead of slicing/splitting/int() on every event.
+EVENT_INDEX = {}
 for i in range(1, 9):
-    for field in ['speed', 'accel', 'decel', 'abs_pos', 'rel_pos', 'jog_amount']:
-        NUMERIC_INPUT_KEYS.append(f'S{i}_{field}')
-        NUMERIC_KEYPAD_BUTTONS.append(f'S{i}_{field}_keypad')
-    for pos_field in ['pos1', 'pos2', 'pos3', 'pos4', 'pos5']:
-        NUMERIC_INPUT_KEYS.append(f'ALL_S{i}_{pos_field}')
+    for action in (*SERVO_KEY_FIELDS, *SETPOINT_OK_ACTIONS.values(),
+                   *(key[len(f'S{i}_'):] for key in COMMAND_MAP if key.startswith(f'S{i}_'))):
+        EVENT_INDEX[sys.intern(f'S{i}_{action}')] = (i, action)
+for key in NUMERIC_KEYPAD_BUTTONS:
+    servo_num_str, action = key[1:].split('_', 1)
+    EVENT_INDEX[key] = (int(servo_num_str), action)
 
 # DataPipe helpers tracked on window
 DP_SEGMENTS_KEY = '_dp_segments'
@@ -1355,8 +1563,23 @@ layout = [
             [
                 [
                     sg.Checkbox('Show Poll Logs', key='SHOW_POLL_LOGS', enable_events=True, default=False, font=GLOBAL_FONT),
+                    # [CHANGE 2026-10-15 21:15:00 -04:00] Poll period (ms) for the position poller.
+                    sg.Text('Poll ms', font=GLOBAL_FONT),
+                    sg.Spin([100, 250, 500, 750, 1000], initial_value=500, key='POLL_MS', size=(5, 1), enable_events=True, font=GLOBAL_FONT),
                     sg.Button('Shutdown', key='SHUTDOWN', size=(10,2), button_color=('white', 'red'), font=GLOBAL_FONT),
                     sg.Button('E-STOP', key='ESTOP', size=(10,2), button_color=('white', '#C00000'), font=('Courier New', 10, 'bold'))
+                ],
+                # [CHANGE 2026-10-15 21:40:00 -04:00] In-window setpoint confirmation (replaces popup_ok_cancel).
+                [
+                    sg.pin(sg.Column(
+                        [[
+                            sg.Text('', key='CONFIRM_TEXT', font=GLOBAL_FONT),
+                            sg.Button('Confirm', key='CONFIRM_OK', size=(8, 1), button_color=('white', 'green'), font=GLOBAL_FONT),
+                            sg.Button('Cancel', key='CONFIRM_CANCEL', size=(8, 1), font=GLOBAL_FONT),
+                        ]],
+                        key='CONFIRM_COL',
+                        visible=False,
+                    ))
                 ]
             ],
             element_justification='right',
@@ -1368,6 +1591,66 @@ layout = [
 
 window = sg.Window("Controller GUI", layout, size=(800, 540), font=GLOBAL_FONT, finalize=True, return_keyboard_events=True, resizable=True)
 
+# [CHANGE 2026-10-15 21:10:00 -04:00] Resolve per-servo elements and the debug log once; hot paths
+# index ELEMENTS instead of going through Window.__getitem__ on every update.
+ELEMENTS.update(
+    (key, window[key])
+    for servo_keys in SERVO_KEYS.values()
+    for key in servo_keys.values()
+    if key in window.AllKeysDict
+)
+ELEMENTS['DEBUG_LOG'] = window['DEBUG_LOG']
+for key in ('CONFIRM_COL', 'CONFIRM_TEXT'):
+    ELEMENTS[key] = window[key]
+
+# [CHANGE 2026-10-15 22:30:00 -04:00] A setpoint input opens its keypad: the bind emits
+# 'S{n}_{field}_keypad', the same event the per-field ⌨ buttons (now removed) used to send.
+# [CHANGE 2026-10-16 00:15:00 -04:00] Double-click/double-tap only, so a single click still places the
+# cursor for keyboard entry.
+for keypad_event in NUMERIC_KEYPAD_BUTTONS:
+    input_key = keypad_event[:-len('_keypad')]
+    if input_key in window.AllKeysDict:
+        window[input_key].bind('<Double-Button-1>', '_keypad')
+
+# [CHANGE 2026-10-15 21:25:00 -04:00] Bound the debug log: every DEBUG_LOG_TRIM_MS the oldest lines
+# beyond DEBUG_LOG_MAX_LINES are deleted from the Tk text widget, so a long session cannot grow it forever.
+DEBUG_LOG_MAX_LINES = 2000
+DEBUG_LOG_TRIM_MS = 5000
+
+
+def _trim_debug_log():
+    try:
+        widget = ELEMENTS['DEBUG_LOG'].Widget
+        line_count = int(widget.index('end-1c').split('.')[0])
+        if line_count > DEBUG_LOG_MAX_LINES:
+            widget.delete('1.0', f'{line_count - DEBUG_LOG_MAX_LINES + 1}.0')
+        window.TKroot.after(DEBUG_LOG_TRIM_MS, _trim_debug_log)
+    except Exception:
+        pass
+
+
+window.TKroot.after(DEBUG_LOG_TRIM_MS, _trim_debug_log)
+
+# [CHANGE 2026-10-15 23:25:00 -04:00] 'Show Poll Logs' lines are buffered and written to DEBUG_LOG in one
+# print every POLL_LOG_FLUSH_MS, instead of one Multiline insert per line per poll. Warnings and
+# errors elsewhere still print immediately.
+POLL_LOG_FLUSH_MS = 200
+POLL_LOG_BUFFER = []
+
+
+def _flush_poll_log():
+    try:
+        if POLL_LOG_BUFFER:
+            lines = '\n'.join(POLL_LOG_BUFFER)
+            POLL_LOG_BUFFER.clear()
+            ELEMENTS['DEBUG_LOG'].print(lines)
+        window.TKroot.after(POLL_LOG_FLUSH_MS, _flush_poll_log)
+    except Exception:
+        pass
+
+
+window.TKroot.after(POLL_LOG_FLUSH_MS, _flush_poll_log)
+
 # Route WARNING+ log records to the GUI debug log so comm errors are visible
 # without a terminal session open.
 class _GUILogHandler(logging.Handler):
@@ -1417,19 +1700,97 @@ def send_axis_command(axis_letter, cmd):
     return controller.send_command(cmd)
 
 
+# [CHANGE 2026-10-15 21:30:00 -04:00] Fire-and-forget setpoint writes: handle_servo_event queues the
+# command and returns; one writer thread sends it and posts ('CMD_REPLY', (cmd, response, error, tag)).
+# Comm objects serialize send/receive internally, so this thread can share them with the poller.
+COMM_TX_Q = queue.Queue()
+_comm_tx_thread = None
+# [CHANGE 2026-10-16 00:55:00 -04:00] Jog chains carry the axis epoch in their tag; E-STOP/Stop bump it
+# (under COMM_TX_LOCK, which the writer holds from its epoch check through the send), so a stale chain
+# is neither sent nor continued once the stop has gone out.
+JOG_EPOCH = [0] * 8
+COMM_TX_LOCK = threading.Lock()
+# [CHANGE 2026-10-16 01:00:00 -04:00] Setpoint writes queued but not yet answered, per axis. Start Motion
+# and Stop still send on the GUI thread, so Start is blocked while one is outstanding (BG could otherwise
+# beat the new target or speed to the controller).
+SETPOINT_INFLIGHT = [0] * 8
+
+
+def _jog_cancelled(tag):
+    """True if tag belongs to a jog chain started before the last E-STOP/Stop for its axis."""
+    return tag[0] in ('jog', 'jog_step') and len(tag) > 3 and tag[3] != JOG_EPOCH[tag[1] - 1]
+
+
+def _comm_tx_worker():
+    while True:
+        item = COMM_TX_Q.get()
+        if item is None:
+            return
+        axis_letter, cmd, tag = item
+        response, error = None, None
+        with COMM_TX_LOCK:
+            if _jog_cancelled(tag):
+                print(f'[DEBUG] Jog command {cmd} for axis {axis_letter} dropped after stop')
+                continue
+            try:
+                response = send_axis_command(axis_letter, cmd)
+            except Exception as e:
+                error = f'{e}\n' + traceback.format_exc()
+        try:
+            window.write_event_value('CMD_REPLY', (cmd, response, error, tag))
+        except Exception:
+            pass
+
+
+def queue_axis_command(axis_letter, cmd, tag):
+    """Queue cmd for the writer thread (started on first use); the reply arrives as a CMD_REPLY event."""
+    global _comm_tx_thread
+    if _comm_tx_thread is None or not _comm_tx_thread.is_alive():
+        _comm_tx_thread = threading.Thread(target=_comm_tx_worker, name='comm-tx', daemon=True)
+        _comm_tx_thread.start()
+    COMM_TX_Q.put((axis_letter, cmd, tag))
+
+
+def cancel_queued_commands(servo_num=None):
+    """Drop queued writer commands (all axes, or one servo) and cancel their jog chains.
+
+    Call before sending ST. Returns the dropped (axis_letter, cmd, tag) items.
+    """
+    kept, dropped = [], []
+    with COMM_TX_LOCK:
+        while True:
+            try:
+                item = COMM_TX_Q.get_nowait()
+            except queue.Empty:
+                break
+            if item is None or (servo_num is not None and item[2][1] != servo_num):
+                kept.append(item)
+            else:
+                dropped.append(item)
+                if item[2][0] == 'setpoint':
+                    SETPOINT_INFLIGHT[item[2][1] - 1] -= 1
+        for item in kept:
+            COMM_TX_Q.put(item)
+        for idx in (range(len(JOG_EPOCH)) if servo_num is None else (servo_num - 1,)):
+            JOG_EPOCH[idx] += 1
+    if dropped and not window_closed:
+        ELEMENTS['DEBUG_LOG'].print(f'[STOP] Dropped queued commands: {", ".join(item[1] for item in dropped)}')
+    return dropped
+
+
 def push_motion_defaults_to_controller(window):
     """Send saved speed/accel/decel to the controller at startup so the TIM service
     has correct values without the user having to click OK on each field."""
     for i in range(1, 5):  # Axes A-D (Servos 1-4) only
         axis_letter = AXIS_LETTERS[i - 1]
-        if not hasattr(window, '_last_setpoints') or len(window._last_setpoints) < i:
+        if getattr(window, '_last_setpoints', None) is None:
             continue
         sp = window._last_setpoints[i - 1]
         scaling = AXIS_UNITS.get(axis_letter, {}).get('scaling', 1)
         gearbox = AXIS_UNITS.get(axis_letter, {}).get('gearbox', 1)
         for field, cmd_prefix in (('speed', 'SP'), ('accel', 'AC'), ('decel', 'DC')):
-            val = sp.get(field)
-            if val is None:
+            val = sp[FIELD_IDX[field]]
+            if not math.isfinite(val):
                 continue
             try:
                 pulses = int(round(float(val) * scaling * gearbox))
@@ -1467,10 +1828,7 @@ def sync_axis_e_actual_from_commanded(window, servo_num=5):
         if not hasattr(window, '_last_pos_update_ts'):
             window._last_pos_update_ts = [None] * 8
 
-        if f'S{servo_num}_actual_pos' in window.AllKeysDict:
-            window[f'S{servo_num}_actual_pos'].update(str(commanded_disp))
-        if f'S{servo_num}_actual_pos_pulses' in window.AllKeysDict:
-            window[f'S{servo_num}_actual_pos_pulses'].update(str(int(round(float(commanded_pulses)))))
+        set_actual_position(window, servo_num, commanded_disp, int(round(float(commanded_pulses))))
 
         window._last_valid_pos[servo_num - 1] = str(commanded_disp)
         window._last_pos_update_ts[servo_num - 1] = time.time()
@@ -1525,10 +1883,7 @@ def adjust_axis_e_actual_by_delta(window, servo_num, delta_deg):
             setattr(comm_e, 'clearcore_commanded_position', new_pulses)
 
         new_disp = 0 if abs(new_deg) < 1e-6 else round(new_deg, 2)
-        if f'S{servo_num}_actual_pos' in window.AllKeysDict:
-            window[f'S{servo_num}_actual_pos'].update(str(new_disp))
-        if f'S{servo_num}_actual_pos_pulses' in window.AllKeysDict:
-            window[f'S{servo_num}_actual_pos_pulses'].update(str(new_pulses))
+        set_actual_position(window, servo_num, new_disp, new_pulses)
 
         if not hasattr(window, '_last_valid_pos'):
             window._last_valid_pos = [''] * 8
@@ -1543,15 +1898,57 @@ def adjust_axis_e_actual_by_delta(window, servo_num, delta_deg):
 window_closed = False
 import time
 # Import the polling thread from ControllerPolling
-from ControllerPolling import start_polling_thread, start_comm_health_thread
+from ControllerPolling import start_polling_thread, start_comm_health_thread, POLL_SAMPLES, set_poll_interval, POLL_INTERVAL_DEFAULT_MS
+
+# [CHANGE 2026-10-15 20:50:00 -04:00] Seed queries for one axis go out as a single multi-operand MG.
+SEED_QUERY_FIELDS = ('speed', 'accel', 'decel', 'abs_pos', 'status')
+SEED_QUERY_OPERANDS = ('_SP', '_AC', '_DC', '_TP', '_MO')
+# [CHANGE 2026-10-15 21:35:00 -04:00] Numbers in an MG reply, found in one scan (no per-line try/float).
+_SEED_NUMBER_RE = re.compile(r'-?\d+(?:\.\d+)?')
+# [CHANGE 2026-10-15 22:25:00 -04:00] Seed command strings per axis, formatted once at import.
+SEED_QUERY_CMD = {axis: 'MG ' + ', '.join(op + axis for op in SEED_QUERY_OPERANDS) for axis in AXIS_LETTERS}
+SEED_FALLBACK_CMDS = {
+    axis: tuple((field, f'MG {op}{axis}') for field, op in zip(SEED_QUERY_FIELDS, SEED_QUERY_OPERANDS))
+    for axis in AXIS_LETTERS
+}
+SEED_SETPOINT_FIELDS = ('speed', 'accel', 'decel', 'abs_pos')
+
+
+def _query_seed_values(comm, axis_letter):
+    """
+    Read speed/accel/decel/target/motor-off for one axis.
+    Tries 'MG _SPx, _ACx, _DCx, _TPx, _MOx' in one round-trip; if the reply is not five
+    numbers, falls back to one MG per operand. Returns {field: float} for fields that answered.
+    """
+    results = {}
+    try:
+        resp = comm.send_command(SEED_QUERY_CMD[axis_letter])
+        if isinstance(resp, str):
+            tokens = _SEED_NUMBER_RE.findall(resp)
+            if len(tokens) == len(SEED_QUERY_FIELDS):
+                return dict(zip(SEED_QUERY_FIELDS, map(float, tokens)))
+    except Exception:
+        pass
+    for field, cmd in SEED_FALLBACK_CMDS[axis_letter]:
+        try:
+            resp = comm.send_command(cmd)
+            if isinstance(resp, str):
+                # Take the first numeric token
+                match = _SEED_NUMBER_RE.search(resp)
+                if match:
+                    results[field] = float(match.group())
+        except Exception:
+            continue
+    return results
+
 
 def initialize_setpoints_from_controller(window, comm):
     """Query controller for current setpoints/status and seed GUI fields."""
     if not comm:
         return
     # Ensure tracking structure exists even if controller queries fail
-    if not hasattr(window, '_last_setpoints') or not window._last_setpoints or len(window._last_setpoints) != 8:
-        window._last_setpoints = [{f: None for f in ['speed', 'accel', 'decel', 'abs_pos', 'rel_pos', 'jog_amount']} for _ in range(8)]
+    if getattr(window, '_last_setpoints', None) is None:
+        window._last_setpoints = _new_setpoint_table()
     try:
         mode = getattr(comm, 'mode', None)
     except Exception:
@@ -1559,79 +1956,177 @@ def initialize_setpoints_from_controller(window, comm):
     # Currently only implemented for Galil (CommMode1) where MG operands are available
     if mode != 'CommMode1':
         return
+    axis_results = [_query_seed_values(comm, axis_letter) for axis_letter in AXIS_LETTERS]
+    # [CHANGE 2026-10-15 21:20:00 -04:00] Convert each seeded field for all 8 axes in one step.
+    seeded_deg = {
+        field: pulses_to_degrees_all([results.get(field, float('nan')) for results in axis_results])
+        for field in SEED_SETPOINT_FIELDS
+    }
+    last_setpoints = window._last_setpoints
     for idx, axis_letter in enumerate(AXIS_LETTERS):
         servo_num = idx + 1
-        scaling = AXIS_UNITS.get(axis_letter, {}).get('scaling', 1) or 1
-        gearbox = AXIS_UNITS.get(axis_letter, {}).get('gearbox', 1) or 1
-        denom = scaling * gearbox if scaling * gearbox != 0 else 1
-        queries = {
-            'speed': f'MG _SP{axis_letter}',
-            'accel': f'MG _AC{axis_letter}',
-            'decel': f'MG _DC{axis_letter}',
-            'abs_pos': f'MG _TP{axis_letter}',
-            'status': f'MG _MO{axis_letter}',
-        }
-        results = {}
-        for field, cmd in queries.items():
-            try:
-                resp = comm.send_command(cmd)
-                if isinstance(resp, str):
-                    # Take the first numeric token
-                    for line in resp.splitlines():
-                        line = line.strip()
-                        try:
-                            results[field] = float(line)
-                            break
-                        except ValueError:
-                            continue
-            except Exception:
-                continue
+        results = axis_results[idx]
+        servo_keys = SERVO_KEYS[servo_num]
+        last_row = last_setpoints[idx]
         # Update numeric fields (convert pulses to degrees)
-        for field in ['speed', 'accel', 'decel', 'abs_pos']:
+        for field in SEED_SETPOINT_FIELDS:
             if field not in results:
                 # Set default value of 0 for abs_pos if not queried
                 if field == 'abs_pos':
-                    window[f'S{servo_num}_{field}'].update('0')
-                    window._last_setpoints[servo_num - 1][field] = 0
+                    _element(window, servo_keys[field]).update('0')
+                    last_row[FIELD_IDX[field]] = 0
                 continue
-            raw = results[field]
-            val_deg = raw / denom if field in ['speed', 'accel', 'decel', 'abs_pos'] else raw
+            val_deg = float(seeded_deg[field][idx])
             # Clamp to configured min/max for safety on seed
-            min_val, max_val = get_limits(axis_letter, field)
+            min_val, max_val, _, _ = LIMITS[(servo_num, field)]
             if min_val is not None and max_val is not None:
                 val_deg = max(min_val, min(max_val, val_deg))
             formatted = format_display_value(val_deg)
-            window[f'S{servo_num}_{field}'].update(formatted)
+            _element(window, servo_keys[field]).update(formatted)
             # Track last setpoints for cancel restore
-            window._last_setpoints[servo_num - 1][field] = val_deg
+            last_row[FIELD_IDX[field]] = val_deg
         # Relative position has no direct query; reset to 0
-        window[f'S{servo_num}_rel_pos'].update('0')
-        window._last_setpoints[servo_num - 1]['rel_pos'] = 0
+        _element(window, servo_keys['rel_pos']).update('0')
+        last_row[FIELD_IDX['rel_pos']] = 0
         # Update enable/disable indicator using status (Galil _MO returns 0 when disabled)
         status_val = results.get('status')
         if status_val is not None:
             enabled = status_val == 0
             if enabled:
-                window[f'S{servo_num}_status_light'].update('●', text_color='#00FF00')
-                window[f'S{servo_num}_status_text'].update('Enabled', text_color='#00FF00')
+                set_status_indicator(window, servo_num, 'Enabled', '#00FF00')
             else:
-                window[f'S{servo_num}_status_light'].update('●', text_color='#FFFF00')
-                window[f'S{servo_num}_status_text'].update('Disabled', text_color='#FFFF00')
+                set_status_indicator(window, servo_num, 'Disabled', '#FFFF00')
         if not window_closed:
-            window['DEBUG_LOG'].print(f'[INIT] S{servo_num} seeded from controller: {results}')
+            ELEMENTS['DEBUG_LOG'].print(f'[INIT] S{servo_num} seeded from controller: {results}')
         update_mid_speed_display(window, servo_num)
 
 
-def update_setpoint_highlight(window, servo_num, actual_deg=None, tolerance=0.1):
+def send_setpoint(window, servo_num, field, value, values):
+    """Convert a confirmed setpoint (degrees) to pulses and queue it for the writer thread."""
+    axis_letter = AXIS_LETTERS[servo_num - 1]
+    # Convert engineering units to pulses using axis scaling and gearbox.
+    _, _, scaling, gearbox = LIMITS[(servo_num, field)]
+    pulses_value = int(round(value * scaling * gearbox))
+
+    cmd = PARAM_CMD[SERVO_KEYS[servo_num][field]](pulses_value)
+
+    # ClearCore Axis E: stage move on OK, execute on Start Motion
+    if axis_letter == 'E' and field in ('abs_pos', 'rel_pos') and isinstance(cmd, str):
+        if cmd.startswith('PAE='):
+            cmd = 'QPAE=' + cmd.split('=', 1)[1]
+        elif cmd.startswith('PRE='):
+            cmd = 'QPRE=' + cmd.split('=', 1)[1]
+
+    print(f'[DEBUG] About to send setpoint command: {cmd}')
+    if not cmd:
+        print('[DEBUG] RETURN: cmd is None')
+        return
+    controller = get_comm_for_axis(axis_letter)
+    if not controller:
+        print('[DEBUG] RETURN: controller is None')
+        sg.popup_error('Controller communications not initialized.', keep_on_top=True)
+        return
+    # [CHANGE 2026-10-15 21:30:00 -04:00] Sent by the writer thread; apply_setpoint_reply finishes on CMD_REPLY.
+    SETPOINT_INFLIGHT[servo_num - 1] += 1
+    queue_axis_command(axis_letter, cmd, ('setpoint', servo_num, field, value, dict(values)))
+
+
+def cancel_setpoint(window, servo_num, field, previous_setpoint, original_text):
+    """Revert an unconfirmed setpoint input to its last confirmed value (or the text before editing)."""
+    confirm_label = field.replace('_', ' ').title()
+    restore_val = previous_setpoint if previous_setpoint is not None else original_text
+    _element(window, SERVO_KEYS[servo_num][field]).update(format_display_value(restore_val) if restore_val not in (None, '') else '')
+    if not window_closed:
+        ELEMENTS['DEBUG_LOG'].print(f"[INFO] Setpoint canceled for {confirm_label} S{servo_num}; reverted to {format_display_value(restore_val) if restore_val not in (None, '') else 'blank'}\n", end='')
+        ELEMENTS['DEBUG_LOG'].Widget.see('end')
+        if field == 'abs_pos':
+            update_setpoint_highlight(window, servo_num)
+        else:
+            set_pending_highlight(window, servo_num, field)
+    print('[DEBUG] User canceled setpoint send')
+
+
+# [CHANGE 2026-10-15 21:40:00 -04:00] One setpoint awaits confirmation at a time; a new OK press
+# while one is pending cancels (reverts) the older one first.
+def request_setpoint_confirm(window, servo_num, field, value, values, previous_setpoint, original_text):
+    """Stash a setpoint and show the in-window Confirm/Cancel row for it."""
+    pending = getattr(window, '_pending_confirm', None)
+    if pending is not None:
+        cancel_setpoint(window, pending[0], pending[1], pending[4], pending[5])
+    window._pending_confirm = (servo_num, field, value, values, previous_setpoint, original_text)
+    confirm_label = field.replace('_', ' ').title()
+    ELEMENTS['CONFIRM_TEXT'].update(f'Send {confirm_label} (S{servo_num}) = {format_display_value(value)}?')
+    ELEMENTS['CONFIRM_COL'].update(visible=True)
+
+
+def resolve_setpoint_confirm(window, confirmed):
+    """Handle CONFIRM_OK / CONFIRM_CANCEL: hide the row, then send or revert the stashed setpoint."""
+    pending = getattr(window, '_pending_confirm', None)
+    window._pending_confirm = None
+    ELEMENTS['CONFIRM_COL'].update(visible=False)
+    if pending is None:
+        return
+    servo_num, field, value, values, previous_setpoint, original_text = pending
+    if confirmed:
+        send_setpoint(window, servo_num, field, value, values)
+    else:
+        cancel_setpoint(window, servo_num, field, previous_setpoint, original_text)
+
+
+def apply_setpoint_reply(window, cmd, response, error, servo_num, field, value, values):
+    """Finish a queued setpoint write on the GUI thread: log the reply and record the confirmed value."""
+    axis_letter = AXIS_LETTERS[servo_num - 1]
+    SETPOINT_INFLIGHT[servo_num - 1] = max(0, SETPOINT_INFLIGHT[servo_num - 1] - 1)
+    if error is not None:
+        print(f'[DEBUG] Exception sending setpoint command: {error}')
+        sg.popup_error(f'Error sending command: {error.splitlines()[0]}', keep_on_top=True)
+        if not window_closed:
+            ELEMENTS['DEBUG_LOG'].update(f'[ERROR] Error sending command: {error}\n', append=True)
+            ELEMENTS['DEBUG_LOG'].Widget.see('end')
+        return
+    print(f'[DEBUG] Setpoint command sent, response: {response}')
+    if not window_closed:
+        if axis_letter == 'E' and field in ('abs_pos', 'rel_pos') and isinstance(cmd, str) and cmd.startswith('QP'):
+            log_line = (
+                f"[TEST LOG] {field.capitalize()} OK for S{servo_num}: Staged {cmd} "
+                f"(waiting for Start Motion)\nReply: {response}\n"
+            )
+        else:
+            log_line = f"[TEST LOG] {field.capitalize()} OK for S{servo_num}: Sent {cmd}\nReply: {response}\n"
+        print(f'[DEBUG] Logging setpoint to DEBUG_LOG: {log_line.strip()}')
+        ELEMENTS['DEBUG_LOG'].print(log_line, end='')
+        ELEMENTS['DEBUG_LOG'].Widget.see('end')
+    # Persist last confirmed setpoint value for cancel restores
+    window._last_setpoints[servo_num - 1][FIELD_IDX[field]] = value
+    # Track command type for Start Motion safety
+    if field == 'abs_pos':
+        LAST_MOTION_COMMAND[servo_num - 1] = 'abs'
+        update_setpoint_highlight(window, servo_num)
+    elif field == 'rel_pos':
+        LAST_MOTION_COMMAND[servo_num - 1] = 'rel'
+        set_pending_highlight(window, servo_num, field)
+    else:
+        set_pending_highlight(window, servo_num, field)
+    if field in ('speed', 'accel', 'decel'):
+        # Persist latest motion tuning immediately after a successful update.
+        try:
+            save_motion_defaults_from_values(values)
+        except Exception:
+            pass
+        update_mid_speed_display(window, servo_num)
+
+
+def update_setpoint_highlight(window, servo_num, actual_deg=None, tolerance=0.1, values=None):
     """Highlight abs_pos: yellow if pending, green if on target, otherwise white."""
     key = f'S{servo_num}_abs_pos'
-    pending = set_pending_highlight(window, servo_num, 'abs_pos')
+    pending = set_pending_highlight(window, servo_num, 'abs_pos', values)
     if pending:
         return
+    element = _element(window, key)
     try:
-        target_str = window[key].get()
+        target_str = values[key] if values is not None and key in values else element.get()
         if not target_str or target_str in ('-', '.'):
-            window[key].update(background_color=DEFAULT_INPUT_BG)
+            _set_input_bg(element, key, DEFAULT_INPUT_BG)
             return
         if actual_deg is None:
             try:
@@ -1639,15 +2134,15 @@ def update_setpoint_highlight(window, servo_num, actual_deg=None, tolerance=0.1)
             except Exception:
                 actual_deg = None
         if actual_deg is None:
-            window[key].update(background_color=DEFAULT_INPUT_BG)
+            _set_input_bg(element, key, DEFAULT_INPUT_BG)
             return
         target = float(target_str)
         if abs(actual_deg - target) <= tolerance:
-            window[key].update(background_color=HIGHLIGHT_INPUT_BG)
+            _set_input_bg(element, key, HIGHLIGHT_INPUT_BG)
         else:
-            window[key].update(background_color=DEFAULT_INPUT_BG)
+            _set_input_bg(element, key, DEFAULT_INPUT_BG)
     except Exception:
-        window[key].update(background_color=DEFAULT_INPUT_BG)
+        _set_input_bg(element, key, DEFAULT_INPUT_BG)
 
 
 # [CHANGE 2026-03-24 13:36:00 -04:00] Press/release jog binding intentionally disabled for safety.
@@ -1726,7 +2221,7 @@ def send_datapipe_contour(comm, segments, window=None):
     for c in cmds:
         result = comm.send_command(c)
         if window and 'DEBUG_LOG' in window.AllKeysDict:
-            window['DEBUG_LOG'].print(f"[DP_CMD] {c} -> {result}")
+            ELEMENTS['DEBUG_LOG'].print(f"[DP_CMD] {c} -> {result}")
         if result is False:
             tc1 = None
             try:
@@ -1837,7 +2332,7 @@ def send_datapipe_pr(comm, segments, window=None, line_speed: float = 1.0, value
     for c in cmds:
         result = comm.send_command(c)
         if window and 'DEBUG_LOG' in window.AllKeysDict:
-            window['DEBUG_LOG'].print(f"[DP_PR_CMD] {c} -> {result}")
+            ELEMENTS['DEBUG_LOG'].print(f"[DP_PR_CMD] {c} -> {result}")
         if result is False:
             tc1 = None
             try:
@@ -1881,15 +2376,171 @@ def send_datapipe_pr(comm, segments, window=None, line_speed: float = 1.0, value
 
 
 
+# [CHANGE 2026-10-15 22:10:00 -04:00] Per-action handlers for handle_servo_event, dispatched through
+# SERVO_ACTION_DISPATCH instead of a match/case chain. Each returns the command to send, or None to
+# send nothing (validation failures have already told the operator).
+def _handle_jog(window, values, servo_num, axis_letter, map_key):
+    """Validate the jog speed against soft limits and build the JG/BG command."""
+    speed_val = values.get(f'S{servo_num}_speed', None)
+    if speed_val is None or speed_val == '':
+        sg.popup_error('Please enter a speed value for Jog', keep_on_top=True)
+        return
+    try:
+        speed_val = float(speed_val)
+    except ValueError:
+        sg.popup_error('Invalid speed value for Jog', keep_on_top=True)
+        return
+    # Soft limit: prevent jogging past min/max if current position known
+    try:
+        current_pos = float(window._last_valid_pos[servo_num - 1]) if window._last_valid_pos[servo_num - 1] else None
+    except Exception:
+        current_pos = None
+    axis_units = AXIS_UNITS_BY_IDX[servo_num - 1]
+    min_val, max_val = axis_units['min'], axis_units['max']
+    if current_pos is not None:
+        if speed_val > 0 and current_pos >= max_val:
+            if hasattr(window, '_jog_limit_hit'):
+                window._jog_limit_hit[servo_num - 1] = True
+            set_status_indicator(window, servo_num, 'At Max Limit', '#FFA500')
+            sg.popup_error(f'Jog blocked: at limit {max_val} deg', keep_on_top=True)
+            return
+        if speed_val < 0 and current_pos <= min_val:
+            if hasattr(window, '_jog_limit_hit'):
+                window._jog_limit_hit[servo_num - 1] = True
+            set_status_indicator(window, servo_num, 'At Min Limit', '#FFA500')
+            sg.popup_error(f'Jog blocked: at limit {min_val} deg', keep_on_top=True)
+            return
+    # Convert degrees/sec to pulses/sec using scaling and gearbox.
+    scaling = axis_units.get('scaling', 1)
+    gearbox = axis_units.get('gearbox', 1)
+    speed_val = int(round(speed_val * scaling * gearbox))
+    cmd = PARAM_CMD[map_key](speed_val)
+    LAST_MOTION_COMMAND[servo_num - 1] = 'jog'
+    return cmd
+
+
+def _handle_start(window, values, servo_num, axis_letter, map_key):
+    """Safety-check Start Motion (Axis E stages its target first) and return the BG command."""
+    # [CHANGE 2026-04-17 00:00:00 -04:00] Added diagnostic print so start execution is visible in terminal log.
+    print(f'[DEBUG] Start case entered for S{servo_num}, axis={axis_letter}, LAST_MOTION_COMMAND={LAST_MOTION_COMMAND[servo_num - 1]}')
+    # SAFETY: Block Start Motion if no valid position command was set
+    last_cmd = LAST_MOTION_COMMAND[servo_num - 1]
+    if last_cmd not in ('abs', 'rel'):
+        sg.popup_error(
+            f'Start Motion blocked for safety.\n\n'
+            f'You must set an Absolute or Relative position\n'
+            f'before using Start Motion.\n\n'
+            f'Current state: {last_cmd or "no position set"}',
+            keep_on_top=True,
+            title='Safety Block'
+        )
+        return
+    if SETPOINT_INFLIGHT[servo_num - 1] > 0:
+        sg.popup_error(
+            f'Start Motion blocked for safety.\n\n'
+            f'A setpoint for S{servo_num} is still being sent.\n'
+            f'Wait for its reply in the log, then press Start again.',
+            keep_on_top=True,
+            title='Safety Block'
+        )
+        return
+    if axis_letter == 'E':
+        try:
+            axis_units = AXIS_UNITS[axis_letter]
+            scaling = axis_units.get('scaling', 1) or 1
+            gearbox = axis_units.get('gearbox', 1) or 1
+
+            # [CHANGE 2026-03-24 11:06:00 -04:00] Deterministically stage Axis E target on Start.
+            # This prevents BGE from running without a pending target when operator hasn't pressed setpoint OK recently.
+            if last_cmd == 'abs':
+                abs_raw = values.get(f'S{servo_num}_abs_pos', '')
+                if abs_raw not in ('', None, '-', '.'):
+                    abs_deg = float(abs_raw)
+                    abs_min, abs_max = get_limits(axis_letter, 'abs_pos')
+                    abs_deg = max(abs_min, min(abs_max, abs_deg))
+                    abs_pulses = int(round(abs_deg * scaling * gearbox))
+                    send_axis_command(axis_letter, f'QPAE={abs_pulses}')
+                    if comm_e is not None:
+                        setattr(comm_e, 'clearcore_commanded_position', abs_pulses)
+            elif last_cmd == 'rel':
+                rel_raw = values.get(f'S{servo_num}_rel_pos', '')
+                if rel_raw not in ('', None, '-', '.'):
+                    rel_deg = float(rel_raw)
+                    rel_pulses = int(round(rel_deg * scaling * gearbox))
+                    send_axis_command(axis_letter, f'QPRE={rel_pulses}')
+                    if comm_e is not None:
+                        base = getattr(comm_e, 'clearcore_commanded_position', None)
+                        if base is None:
+                            base = getattr(comm_e, 'clearcore_last_position', 0)
+                        setattr(comm_e, 'clearcore_commanded_position', int(base) + rel_pulses)
+
+            speed_raw = values.get(f'S{servo_num}_speed', '')
+            accel_raw = values.get(f'S{servo_num}_accel', '')
+
+            if speed_raw not in ('', None, '-', '.'):
+                speed_val = float(speed_raw)
+                speed_pulses = int(round(speed_val * scaling * gearbox))
+                send_axis_command(axis_letter, f'SP{axis_letter}={speed_pulses}')
+
+            if accel_raw not in ('', None, '-', '.'):
+                accel_val = float(accel_raw)
+                accel_pulses = int(round(accel_val * scaling * gearbox))
+                send_axis_command(axis_letter, f'AC{axis_letter}={accel_pulses}')
+        except Exception as start_param_err:
+            if not window_closed:
+                ELEMENTS['DEBUG_LOG'].print(f'[WARN] Axis E start pre-load skipped: {start_param_err}')
+    cmd = STATIC_CMD.get(map_key)
+    print(f'[DEBUG] Start: cmd={cmd!r} for S{servo_num} (axis {axis_letter})')
+    return cmd
+
+
+def _handle_stop(window, values, servo_num, axis_letter, map_key):
+    """Clear motion tracking and cancel any hold-to-jog worker, then return the ST command."""
+    cmd = STATIC_CMD.get(map_key)
+    # Clear motion command tracking on stop
+    LAST_MOTION_COMMAND[servo_num - 1] = None
+    # [CHANGE 2026-10-16 00:55:00 -04:00] Drop this axis's queued writer commands so a jog chain cannot BG after ST.
+    cancel_queued_commands(servo_num)
+    # [CHANGE 2026-03-24 10:58:00 -04:00] Force-cancel any active press-and-hold jog worker before issuing stop.
+    idx = servo_num - 1
+    if 0 <= idx < len(JOG_STOP_EVENTS):
+        try:
+            stop_evt = JOG_STOP_EVENTS[idx]
+            if stop_evt is not None:
+                stop_evt.set()
+        except Exception:
+            pass
+        JOG_STOP_EVENTS[idx] = None
+    return cmd
+
+
+def _handle_simple(window, values, servo_num, axis_letter, map_key):
+    """Actions with a fixed command string (enable, disable, clear_faults, ...)."""
+    return STATIC_CMD.get(map_key)
+
+
+SERVO_ACTION_DISPATCH = {
+    'jog': _handle_jog,
+    'start': _handle_start,
+    'stop': _handle_stop,
+    'enable': _handle_simple,
+    'disable': _handle_simple,
+}
+
 # --- Define handle_servo_event before main event loop ---
 def handle_servo_event(event, values):
     # Parse servo number from event string (e.g., 'S3_enable' -> 3)
     if isinstance(event, str) and event.startswith('S') and '_' in event:
         try:
-            servo_num_str, action = event[1:].split('_', 1)
-            servo_num = int(servo_num_str)
+            parsed = EVENT_INDEX.get(event)
+            if parsed is not None:
+                servo_num, action = parsed
+                map_key = event
+            else:
+                servo_num_str, action = event[1:].split('_', 1)
+                servo_num = int(servo_num_str)
+                map_key = f'S{servo_num}_{action}'
             axis_letter = AXIS_LETTERS[servo_num - 1]
-            map_key = f'S{servo_num}_{action}'
             print(f'[DEBUG] handle_servo_event: event={event}, servo_num={servo_num}, action={action}')
         except Exception:
             print(f'[DEBUG] handle_servo_event: failed to parse event={event}')
@@ -1897,15 +2548,16 @@ def handle_servo_event(event, values):
 
         # Always check for setpoint OK button, regardless of map_key in COMMAND_MAP
         setpoint_fields = ['speed', 'accel', 'decel', 'abs_pos', 'rel_pos']
-        if not hasattr(window, '_last_setpoints'):
-            window._last_setpoints = [{f: None for f in setpoint_fields} for _ in range(8)]
+        if getattr(window, '_last_setpoints', None) is None:
+            window._last_setpoints = _new_setpoint_table()
+        servo_keys = SERVO_KEYS[servo_num]
         for field in setpoint_fields:
-            print(f'[DEBUG] Comparing action={action} to {field}_ok')
-            if action == f'{field}_ok':
+            if action == SETPOINT_OK_ACTIONS[field]:
                 print(f'[DEBUG] handle_servo_event called for {field}_ok, S{servo_num}')
-                original_text = window[f'S{servo_num}_{field}'].get()
-                previous_setpoint = window._last_setpoints[servo_num - 1].get(field)
-                value = values.get(f'S{servo_num}_{field}', None)
+                field_key = servo_keys[field]
+                original_text = window[field_key].get()
+                previous_setpoint = get_last_setpoint(window, servo_num, field)
+                value = values.get(field_key, None)
                 if value is None or value == '':
                     print(f'[DEBUG] No value entered for {field} (S{servo_num})')
                     sg.popup_error(f'Please enter a value for {field}', keep_on_top=True)
@@ -1915,14 +2567,14 @@ def handle_servo_event(event, values):
                     # Accept float input and keep one decimal place for display
                     value = round(float(value), 1)
                     formatted_value = format_display_value(value)
-                    window[f'S{servo_num}_{field}'].update(formatted_value)
+                    window[field_key].update(formatted_value)
                 except ValueError:
                     print(f'[DEBUG] Invalid value for {field} (S{servo_num}): {value}')
                     sg.popup_error(f'Invalid value for {field}', keep_on_top=True)
                     print('[DEBUG] RETURN: Invalid value')
                     return
                 axis_letter = AXIS_LETTERS[servo_num - 1]
-                min_val, max_val = get_limits(axis_letter, field)
+                min_val, max_val, scaling, gearbox = LIMITS[(servo_num, field)]
                 # For relative moves, ensure resulting position stays within limits
                 if field == 'rel_pos':
                     try:
@@ -1951,240 +2603,34 @@ def handle_servo_event(event, values):
                     print('[DEBUG] RETURN: Value out of range')
                     return
                 # Confirm with user before sending command (optional per tab)
-                confirm_required = bool(values.get(f'S{servo_num}_confirm_ok', True))
-                confirm_label = field.replace('_', ' ').title()
-                confirm = 'OK'
+                confirm_required = bool(values.get(servo_keys['confirm_ok'], True))
                 if confirm_required:
-                    confirm = sg.popup_ok_cancel(
-                        f"Send setpoint for {confirm_label} (S{servo_num})?\nValue: {formatted_value}",
-                        keep_on_top=True,
-                        title='Confirm Setpoint'
-                    )
-                if confirm != 'OK':
-                    restore_val = previous_setpoint if previous_setpoint is not None else original_text
-                    window[f'S{servo_num}_{field}'].update(format_display_value(restore_val) if restore_val not in (None, '') else '')
-                    if not window_closed:
-                        window['DEBUG_LOG'].print(f"[INFO] Setpoint canceled for {confirm_label} S{servo_num}; reverted to {format_display_value(restore_val) if restore_val not in (None, '') else 'blank'}\n", end='')
-                        window['DEBUG_LOG'].Widget.see('end')
-                        if field == 'abs_pos':
-                            update_setpoint_highlight(window, servo_num)
-                        else:
-                            set_pending_highlight(window, servo_num, field)
-                    print('[DEBUG] User canceled setpoint send')
-                    return
-                # Convert engineering units to pulses using axis scaling and gearbox.
-                scaling = AXIS_UNITS[axis_letter].get('scaling', 1)
-                gearbox = AXIS_UNITS[axis_letter].get('gearbox', 1)
-                pulses_value = int(round(value * scaling * gearbox))
-
-                cmd_func = COMMAND_MAP.get(f'S{servo_num}_{field}')
-                if callable(cmd_func):
-                    cmd = cmd_func(pulses_value)
-                else:
-                    cmd = cmd_func
-
-                # ClearCore Axis E: stage move on OK, execute on Start Motion
-                if axis_letter == 'E' and field in ('abs_pos', 'rel_pos') and isinstance(cmd, str):
-                    if cmd.startswith('PAE='):
-                        cmd = 'QPAE=' + cmd.split('=', 1)[1]
-                    elif cmd.startswith('PRE='):
-                        cmd = 'QPRE=' + cmd.split('=', 1)[1]
-
-                print(f'[DEBUG] About to send setpoint command: {cmd}')
-                if not cmd:
-                    print('[DEBUG] RETURN: cmd is None')
-                    return
-                controller = get_comm_for_axis(axis_letter)
-                if not controller:
-                    print('[DEBUG] RETURN: controller is None')
-                    sg.popup_error('Controller communications not initialized.', keep_on_top=True)
+                    # [CHANGE 2026-10-15 21:40:00 -04:00] Show the in-window confirm row and return; the
+                    # send (or revert) happens on CONFIRM_OK / CONFIRM_CANCEL in the main loop.
+                    request_setpoint_confirm(window, servo_num, field, value, dict(values), previous_setpoint, original_text)
                     return
-                try:
-                    response = send_axis_command(axis_letter, cmd)
-                    print(f'[DEBUG] Setpoint command sent, response: {response}')
-                    if not window_closed:
-                        if axis_letter == 'E' and field in ('abs_pos', 'rel_pos') and isinstance(cmd, str) and cmd.startswith('QP'):
-                            log_line = (
-                                f"[TEST LOG] {field.capitalize()} OK for S{servo_num}: Staged {cmd} "
-                                f"(waiting for Start Motion)\nReply: {response}\n"
-                            )
-                        else:
-                            log_line = f"[TEST LOG] {field.capitalize()} OK for S{servo_num}: Sent {cmd}\nReply: {response}\n"
-                        print(f'[DEBUG] Logging setpoint to DEBUG_LOG: {log_line.strip()}')
-                        window['DEBUG_LOG'].print(log_line, end='')
-                        window['DEBUG_LOG'].Widget.see('end')
-                        window.refresh()
-                    # Persist last confirmed setpoint value for cancel restores
-                    window._last_setpoints[servo_num - 1][field] = value
-                    # Track command type for Start Motion safety
-                    if field == 'abs_pos':
-                        LAST_MOTION_COMMAND[servo_num - 1] = 'abs'
-                        update_setpoint_highlight(window, servo_num)
-                    elif field == 'rel_pos':
-                        LAST_MOTION_COMMAND[servo_num - 1] = 'rel'
-                        set_pending_highlight(window, servo_num, field)
-                    else:
-                        set_pending_highlight(window, servo_num, field)
-                    if field in ('speed', 'accel', 'decel'):
-                        # Persist latest motion tuning immediately after a successful update.
-                        try:
-                            save_motion_defaults_from_values(values)
-                        except Exception:
-                            pass
-                        update_mid_speed_display(window, servo_num)
-                except Exception as e:
-                    import traceback
-                    error_details = f'{e}\n' + traceback.format_exc()
-                    print(f'[DEBUG] Exception sending setpoint command: {error_details}')
-                    sg.popup_error(f'Error sending command: {e}', keep_on_top=True)
-                    if not window_closed:
-                        window['DEBUG_LOG'].update(f'[ERROR] Error sending command: {error_details}\n', append=True)
-                        window['DEBUG_LOG'].Widget.see('end')
+                send_setpoint(window, servo_num, field, value, values)
                 return
         # Only handle direct motor control buttons if not a setpoint OK event
         if map_key in COMMAND_MAP:
-            cmd = None
-            match action:
-                case 'jog':
-                    speed_val = values.get(f'S{servo_num}_speed', None)
-                    if speed_val is None or speed_val == '':
-                        sg.popup_error('Please enter a speed value for Jog', keep_on_top=True)
-                        return
-                    try:
-                        speed_val = float(speed_val)
-                    except ValueError:
-                        sg.popup_error('Invalid speed value for Jog', keep_on_top=True)
-                        return
-                    # Soft limit: prevent jogging past min/max if current position known
-                    axis_letter = AXIS_LETTERS[servo_num - 1]
-                    try:
-                        current_pos = float(window._last_valid_pos[servo_num - 1]) if window._last_valid_pos[servo_num - 1] else None
-                    except Exception:
-                        current_pos = None
-                    min_val, max_val = AXIS_UNITS[axis_letter]['min'], AXIS_UNITS[axis_letter]['max']
-                    if current_pos is not None:
-                        if speed_val > 0 and current_pos >= max_val:
-                            if hasattr(window, '_jog_limit_hit'):
-                                window._jog_limit_hit[servo_num - 1] = True
-                            window[f'S{servo_num}_status_light'].update('●', text_color='#FFA500')
-                            window[f'S{servo_num}_status_text'].update('At Max Limit', text_color='#FFA500')
-                            sg.popup_error(f'Jog blocked: at limit {max_val} deg', keep_on_top=True)
-                            return
-                        if speed_val < 0 and current_pos <= min_val:
-                            if hasattr(window, '_jog_limit_hit'):
-                                window._jog_limit_hit[servo_num - 1] = True
-                            window[f'S{servo_num}_status_light'].update('●', text_color='#FFA500')
-                            window[f'S{servo_num}_status_text'].update('At Min Limit', text_color='#FFA500')
-                            sg.popup_error(f'Jog blocked: at limit {min_val} deg', keep_on_top=True)
-                            return
-                    # Convert degrees/sec to pulses/sec using scaling and gearbox.
-                    axis_letter = AXIS_LETTERS[servo_num - 1]
-                    scaling = AXIS_UNITS[axis_letter].get('scaling', 1)
-                    gearbox = AXIS_UNITS[axis_letter].get('gearbox', 1)
-                    speed_val = int(round(speed_val * scaling * gearbox))
-                    cmd_func = COMMAND_MAP[map_key]
-                    if callable(cmd_func):
-                        cmd = cmd_func(speed_val)
-                    else:
-                        cmd = cmd_func
-                    LAST_MOTION_COMMAND[servo_num - 1] = 'jog'
-                case 'start':
-                    # [CHANGE 2026-04-17 00:00:00 -04:00] Added diagnostic print so start execution is visible in terminal log.
-                    print(f'[DEBUG] Start case entered for S{servo_num}, axis={axis_letter}, LAST_MOTION_COMMAND={LAST_MOTION_COMMAND[servo_num - 1]}')
-                    # SAFETY: Block Start Motion if no valid position command was set
-                    last_cmd = LAST_MOTION_COMMAND[servo_num - 1]
-                    if last_cmd not in ('abs', 'rel'):
-                        sg.popup_error(
-                            f'Start Motion blocked for safety.\n\n'
-                            f'You must set an Absolute or Relative position\n'
-                            f'before using Start Motion.\n\n'
-                            f'Current state: {last_cmd or "no position set"}',
-                            keep_on_top=True,
-                            title='Safety Block'
-                        )
-                        return
-                    if axis_letter == 'E':
-                        try:
-                            axis_units = AXIS_UNITS[axis_letter]
-                            scaling = axis_units.get('scaling', 1) or 1
-                            gearbox = axis_units.get('gearbox', 1) or 1
-
-                            # [CHANGE 2026-03-24 11:06:00 -04:00] Deterministically stage Axis E target on Start.
-                            # This prevents BGE from running without a pending target when operator hasn't pressed setpoint OK recently.
-                            if last_cmd == 'abs':
-                                abs_raw = values.get(f'S{servo_num}_abs_pos', '')
-                                if abs_raw not in ('', None, '-', '.'):
-                                    abs_deg = float(abs_raw)
-                                    abs_min, abs_max = get_limits(axis_letter, 'abs_pos')
-                                    abs_deg = max(abs_min, min(abs_max, abs_deg))
-                                    abs_pulses = int(round(abs_deg * scaling * gearbox))
-                                    send_axis_command(axis_letter, f'QPAE={abs_pulses}')
-                                    if comm_e is not None:
-                                        setattr(comm_e, 'clearcore_commanded_position', abs_pulses)
-                            elif last_cmd == 'rel':
-                                rel_raw = values.get(f'S{servo_num}_rel_pos', '')
-                                if rel_raw not in ('', None, '-', '.'):
-                                    rel_deg = float(rel_raw)
-                                    rel_pulses = int(round(rel_deg * scaling * gearbox))
-                                    send_axis_command(axis_letter, f'QPRE={rel_pulses}')
-                                    if comm_e is not None:
-                                        base = getattr(comm_e, 'clearcore_commanded_position', None)
-                                        if base is None:
-                                            base = getattr(comm_e, 'clearcore_last_position', 0)
-                                        setattr(comm_e, 'clearcore_commanded_position', int(base) + rel_pulses)
-
-                            speed_raw = values.get(f'S{servo_num}_speed', '')
-                            accel_raw = values.get(f'S{servo_num}_accel', '')
-
-                            if speed_raw not in ('', None, '-', '.'):
-                                speed_val = float(speed_raw)
-                                speed_pulses = int(round(speed_val * scaling * gearbox))
-                                send_axis_command(axis_letter, f'SP{axis_letter}={speed_pulses}')
-
-                            if accel_raw not in ('', None, '-', '.'):
-                                accel_val = float(accel_raw)
-                                accel_pulses = int(round(accel_val * scaling * gearbox))
-                                send_axis_command(axis_letter, f'AC{axis_letter}={accel_pulses}')
-                        except Exception as start_param_err:
-                            if not window_closed:
-                                window['DEBUG_LOG'].print(f'[WARN] Axis E start pre-load skipped: {start_param_err}')
-                    cmd = COMMAND_MAP[map_key] if not callable(COMMAND_MAP[map_key]) else None
-                    print(f'[DEBUG] Start: cmd={cmd!r} for S{servo_num} (axis {axis_letter})')
-                case 'enable' | 'disable' | 'stop':
-                    cmd = COMMAND_MAP[map_key] if not callable(COMMAND_MAP[map_key]) else None
-                    if action == 'stop':
-                        # Clear motion command tracking on stop
-                        LAST_MOTION_COMMAND[servo_num - 1] = None
-                        # [CHANGE 2026-03-24 10:58:00 -04:00] Force-cancel any active press-and-hold jog worker before issuing stop.
-                        idx = servo_num - 1
-                        if 0 <= idx < len(JOG_STOP_EVENTS):
-                            try:
-                                stop_evt = JOG_STOP_EVENTS[idx]
-                                if stop_evt is not None:
-                                    stop_evt.set()
-                            except Exception:
-                                pass
-                            JOG_STOP_EVENTS[idx] = None
-                case _:
-                    # For any other actions, fallback to original logic if needed
-                    cmd = COMMAND_MAP[map_key] if not callable(COMMAND_MAP[map_key]) else None
+            cmd = SERVO_ACTION_DISPATCH.get(action, _handle_simple)(window, values, servo_num, axis_letter, map_key)
             if cmd:
                 controller = get_comm_for_axis(axis_letter)
                 if controller:
                     try:
                         # If disabling, send stop command first
                         if action == 'disable':
+                            cancel_queued_commands(servo_num)
                             stop_key = f'S{servo_num}_stop'
-                            stop_cmd = COMMAND_MAP.get(stop_key)
+                            stop_cmd = STATIC_CMD.get(stop_key)
                             if stop_cmd and axis_letter != 'E':
-                                stop_cmd_val = stop_cmd if not callable(stop_cmd) else stop_cmd()
-                                send_axis_command(axis_letter, stop_cmd_val)
+                                send_axis_command(axis_letter, stop_cmd)
                         response = send_axis_command(axis_letter, cmd)
                         # Log request and reply in DEBUG_LOG for all actions
                         if not window_closed:
-                            prev_log = window['DEBUG_LOG'].get()
+                            # [CHANGE 2026-10-15 21:25:00 -04:00] Append instead of rewriting the whole log.
                             new_log = f"[TEST LOG] {action.capitalize()} button clicked for S{servo_num}: Sent {cmd}\nReply: {response}\n"
-                            window['DEBUG_LOG'].update(prev_log + new_log)
+                            ELEMENTS['DEBUG_LOG'].print(new_log, end='')
                         action_succeeded = not (
                             response is False or
                             (isinstance(response, str) and str(response).strip().upper().startswith('UNSUPPORTED'))
@@ -2193,27 +2639,23 @@ def handle_servo_event(event, values):
                             # Immediately update indicator color (bright green for enable, bright yellow for disable)
                             match action:
                                 case 'enable':
-                                    window[f'S{servo_num}_status_light'].update('●', text_color='#00FF00')  # Bright green
-                                    window[f'S{servo_num}_status_text'].update('Enabled', text_color='#00FF00')
+                                    set_status_indicator(window, servo_num, 'Enabled', '#00FF00')
                                 case 'disable':
-                                    window[f'S{servo_num}_status_light'].update('●', text_color='#FFFF00')  # Bright yellow
-                                    window[f'S{servo_num}_status_text'].update('Disabled', text_color='#FFFF00')
+                                    set_status_indicator(window, servo_num, 'Disabled', '#FFFF00')
                             if axis_letter == 'E' and action == 'start':
                                 # [CHANGE 2026-03-27 11:05:00 -04:00] Servo E has no feedback; mirror accepted start target.
                                 sync_axis_e_actual_from_commanded(window, servo_num)
                         elif action in ('disable', 'stop') and axis_letter == 'E':
                             # [CHANGE 2026-03-23 16:32:24 -04:00] Non-blocking unsupported indicator for Axis E disable/stop.
                             if not window_closed:
-                                window['DEBUG_LOG'].print(f"[WARN] Axis E {action} is not supported by current ClearCore firmware command set.")
-                            window[f'S{servo_num}_status_light'].update('●', text_color='#FFA500')
-                            window[f'S{servo_num}_status_text'].update(f'{action.capitalize()} unsupported', text_color='#FFA500')
+                                ELEMENTS['DEBUG_LOG'].print(f"[WARN] Axis E {action} is not supported by current ClearCore firmware command set.")
+                            set_status_indicator(window, servo_num, f'{action.capitalize()} unsupported', '#FFA500')
                     except Exception as e:
                         import traceback
                         error_details = f'{e}\n' + traceback.format_exc()
                         sg.popup_error(f'Error sending command: {e}', keep_on_top=True)
                         if not window_closed:
-                            prev_log = window['DEBUG_LOG'].get()
-                            window['DEBUG_LOG'].update(prev_log + f'[ERROR] Error sending command: {error_details}\n')
+                            ELEMENTS['DEBUG_LOG'].print(f'[ERROR] Error sending command: {error_details}\n', end='')
                 else:
                     sg.popup_error('Controller communications not initialized.', keep_on_top=True)
             return
@@ -2289,13 +2731,17 @@ def handle_all_run_sequence(window, comm, values):
         sg.popup_error('No enabled servos with setpoints to run.', keep_on_top=True)
         return
 
-    for entry in selected:
-        for idx, sp in enumerate(entry['setpoints'], start=1):
-            if sp is None:
-                continue
-            if sp < entry['min'] or sp > entry['max']:
-                sg.popup_error(f"Servo {entry['servo_num']} setpoint {idx} out of range ({entry['min']} to {entry['max']}).", keep_on_top=True)
-                return
+    # Validate every selected setpoint in one pass; blank slots are NaN and always pass
+    slots = [(entry, idx, sp) for entry in selected for idx, sp in enumerate(entry['setpoints'], start=1)]
+    in_range = validate_axis_values(
+        [float('nan') if sp is None else sp for _entry, _idx, sp in slots],
+        [entry['min'] for entry, _idx, _sp in slots],
+        [entry['max'] for entry, _idx, _sp in slots],
+    )
+    for (entry, idx, _sp), ok in zip(slots, in_range):
+        if not ok:
+            sg.popup_error(f"Servo {entry['servo_num']} setpoint {idx} out of range ({entry['min']} to {entry['max']}).", keep_on_top=True)
+            return
 
     # Validate line speed (0-2)
     try:
@@ -2490,7 +2936,7 @@ def handle_jog_press(window, servo_num, direction, is_press, values):
         return
 
     sign = 1 if str(direction).lower() == 'cw' else -1
-    axis_units = AXIS_UNITS.get(axis_letter, {})
+    axis_units = AXIS_UNITS_BY_IDX[servo_num - 1]
     if axis_units.get('reverse', False):
         sign = -sign
     signed_speed = speed_val * sign
@@ -2520,15 +2966,13 @@ def handle_jog_press(window, servo_num, direction, is_press, values):
         if signed_speed > 0 and current_pos >= max_val:
             if hasattr(window, '_jog_limit_hit'):
                 window._jog_limit_hit[servo_num - 1] = True
-            window[f'S{servo_num}_status_light'].update('●', text_color='#FFA500')
-            window[f'S{servo_num}_status_text'].update('At Max Limit', text_color='#FFA500')
+            set_status_indicator(window, servo_num, 'At Max Limit', '#FFA500')
             sg.popup_error(f'Jog blocked: at upper limit {max_val} deg', keep_on_top=True)
             return
         if signed_speed < 0 and current_pos <= min_val:
             if hasattr(window, '_jog_limit_hit'):
                 window._jog_limit_hit[servo_num - 1] = True
-            window[f'S{servo_num}_status_light'].update('●', text_color='#FFA500')
-            window[f'S{servo_num}_status_text'].update('At Min Limit', text_color='#FFA500')
+            set_status_indicator(window, servo_num, 'At Min Limit', '#FFA500')
             sg.popup_error(f'Jog blocked: at lower limit {min_val} deg', keep_on_top=True)
             return
 
@@ -2539,862 +2983,917 @@ def handle_jog_press(window, servo_num, direction, is_press, values):
         return
     step_pulses *= sign
 
+    # [CHANGE 2026-10-15 23:05:00 -04:00] Jog commands go through the writer thread (FIFO, so PR/SP/AC/DC/BG
+    # keep their order); replies come back as CMD_REPLY and are finished in apply_jog_reply.
+    # [CHANGE 2026-10-15 23:45:00 -04:00] Only PR is queued here; the staged SP/AC/DC/BG ride in the tag and
+    # apply_jog_reply queues each one after the previous reply succeeds, so a failed PR never reaches BG.
     if is_press:
-        cmd = f'PR{axis_letter}={step_pulses}'
-        try:
-            response = comm.send_command(cmd)
-            print(f'[DEBUG] JOG one-shot command: {cmd} -> {response}')
-            # Successful jog — clear any jog limit indicator for this axis.
-            if hasattr(window, '_jog_limit_hit'):
-                window._jog_limit_hit[servo_num - 1] = False
-                window[f'S{servo_num}_status_light'].update('●', text_color='#00FF00')
-                window[f'S{servo_num}_status_text'].update('Enabled', text_color='#00FF00')
-
-            if axis_letter in ('A', 'B', 'C', 'D'):
-                # RapidCode axes: stage speed/accel/decel then fire with BG.
-                # PR only stages the distance; motion profile must be explicit.
-                sp_pulses = int(round(speed_val * scaling * gearbox))
-                accel_str = str(values.get(f'S{servo_num}_accel', '')).strip()
-                decel_str = str(values.get(f'S{servo_num}_decel', '')).strip()
-                try:
-                    accel_pulses = int(round(float(accel_str) * scaling * gearbox)) if accel_str else sp_pulses * 2
-                    decel_pulses = int(round(float(decel_str) * scaling * gearbox)) if decel_str else sp_pulses * 2
-                except ValueError:
-                    accel_pulses = sp_pulses * 2
-                    decel_pulses = sp_pulses * 2
-                comm.send_command(f'SP{axis_letter}={sp_pulses}')
-                comm.send_command(f'AC{axis_letter}={accel_pulses}')
-                comm.send_command(f'DC{axis_letter}={decel_pulses}')
-                bg_response = comm.send_command(f'BG{axis_letter}')
-                print(f'[DEBUG] JOG BG{axis_letter} -> {bg_response}')
-            elif axis_letter == 'E':
-                # [CHANGE 2026-03-27 11:50:00 -04:00] Servo E PRE updates commanded cache; mirror it without applying a second delta.
-                jog_ok = not (
-                    response is False or
-                    (isinstance(response, str) and str(response).strip().upper().startswith('UNSUPPORTED'))
-                )
-                if jog_ok:
-                    sync_axis_e_actual_from_commanded(window, servo_num)
-        except Exception as ex:
-            print(f'[DEBUG] Jog one-shot failed: {ex}')
+        staged = ()
+        if axis_letter in ('A', 'B', 'C', 'D'):
+            # RapidCode axes: stage speed/accel/decel then fire with BG.
+            # PR only stages the distance; motion profile must be explicit.
+            sp_pulses = int(round(speed_val * scaling * gearbox))
+            accel_str = str(values.get(f'S{servo_num}_accel', '')).strip()
+            decel_str = str(values.get(f'S{servo_num}_decel', '')).strip()
+            try:
+                accel_pulses = int(round(float(accel_str) * scaling * gearbox)) if accel_str else sp_pulses * 2
+                decel_pulses = int(round(float(decel_str) * scaling * gearbox)) if decel_str else sp_pulses * 2
+            except ValueError:
+                accel_pulses = sp_pulses * 2
+                decel_pulses = sp_pulses * 2
+            staged = (f'SP{axis_letter}={sp_pulses}', f'AC{axis_letter}={accel_pulses}',
+                      f'DC{axis_letter}={decel_pulses}', f'BG{axis_letter}')
+        queue_axis_command(axis_letter, f'PR{axis_letter}={step_pulses}',
+                           ('jog', servo_num, staged, JOG_EPOCH[servo_num - 1]))
     else:
-        cmd = f'ST{axis_letter}'
-        try:
-            response = comm.send_command(cmd)
-            print(f'[DEBUG] JOG release command: {cmd} -> {response}')
-        except Exception as ex:
-            print(f'[DEBUG] Jog release failed: {ex}')
+        queue_axis_command(axis_letter, f'ST{axis_letter}', ('jog_step', servo_num))
     return
 
+
+def apply_jog_reply(window, cmd, response, error, tag):
+    """Finish a queued jog/zero command on the GUI thread.
+
+    tag is (kind, servo_num) or (kind, servo_num, pending, epoch); pending holds the commands still to
+    send for this jog and the next one is queued only when this reply succeeded and no E-STOP/Stop has
+    bumped the axis epoch since the jog started.
+    """
+    kind, servo_num = tag[0], tag[1]
+    pending = tag[2] if len(tag) > 2 else ()
+    axis_letter = AXIS_LETTERS[servo_num - 1]
+    if _jog_cancelled(tag):
+        print(f'[DEBUG] Jog cancelled by stop for axis {axis_letter}; not sent: {", ".join(pending) or "-"}')
+        return
+    if error is not None:
+        print(f'[DEBUG] {kind} command {cmd} failed: {error.splitlines()[0]}')
+        if pending:
+            print(f'[DEBUG] Jog aborted for axis {axis_letter}; not sent: {", ".join(pending)}')
+        return
+    print(f'[DEBUG] {kind} command: {cmd} -> {response}')
+    command_ok = not (
+        response is False or
+        (isinstance(response, str) and str(response).strip().upper().startswith('UNSUPPORTED'))
+    )
+    if not command_ok:
+        if pending:
+            print(f'[DEBUG] Jog aborted for axis {axis_letter}; not sent: {", ".join(pending)}')
+        return
+    if pending:
+        queue_axis_command(axis_letter, pending[0], ('jog_step', servo_num, pending[1:], tag[3]))
+    if kind == 'jog':
+        # Successful jog — clear any jog limit indicator for this axis.
+        if hasattr(window, '_jog_limit_hit'):
+            window._jog_limit_hit[servo_num - 1] = False
+            set_status_indicator(window, servo_num, 'Enabled', '#00FF00')
+        # [CHANGE 2026-03-27 11:50:00 -04:00] Servo E PRE updates commanded cache; mirror it without applying a second delta.
+        if axis_letter == 'E':
+            sync_axis_e_actual_from_commanded(window, servo_num)
+    elif kind == 'zero' and axis_letter == 'E':
+        # [CHANGE 2026-03-27 11:20:00 -04:00] Servo E zero immediately resets displayed/cached commanded position.
+        try:
+            if comm_e is not None:
+                setattr(comm_e, 'clearcore_last_position', 0)
+                setattr(comm_e, 'clearcore_commanded_position', 0)
+            sync_axis_e_actual_from_commanded(window, servo_num)
+        except Exception:
+            pass
+
 # Start background polling threads using ControllerPolling.
 # - POSITION_POLL thread updates live motion/status fields per active axis routing.
 # - COMM_HEALTH thread updates per-axis link indicators (Comms OK / No Link).
 # Both threads post thread-safe events to the GUI event loop.
 
+# [CHANGE 2026-10-16 00:35:00 -04:00] Soft/absolute position bounds in pulses per configured servo, so the
+# poller can count out-of-range polls before it drops unchanged samples (see POLL_HEARTBEAT_S).
+POLL_LIMIT_PULSES = None
+if SAFETY_LIMIT_STOPS_ENABLED:
+    POLL_LIMIT_PULSES = {}
+    for idx in range(8):
+        if AXIS_CONFIGURED[idx]:
+            lo_deg = max(float(AXIS_SOFT_MIN[idx]), -ABSOLUTE_SAFETY_LIMIT_DEG)
+            hi_deg = min(float(AXIS_SOFT_MAX[idx]), ABSOLUTE_SAFETY_LIMIT_DEG)
+            scale_gear = float(AXIS_SCALE_GEAR[idx])
+            POLL_LIMIT_PULSES[idx + 1] = tuple(sorted((lo_deg * scale_gear, hi_deg * scale_gear)))
+
 # [CHANGE 2026-03-24 14:54:00 -04:00] Include comm_e so Axis E polling uses ClearCore path.
-polling_thread, polling_stop_event = start_polling_thread(window, comm, comm_e, comm_h)
+polling_thread, polling_stop_event = start_polling_thread(window, comm, comm_e, comm_h, POLL_LIMIT_PULSES)
 
 # [CHANGE 2026-04-17 00:00:00 -04:00] Start comm health thread: pings each controller every 5s and updates link indicators.
 comm_health_thread, comm_health_stop_event = start_comm_health_thread(window, comm, comm_e, comm_h, interval=5.0)
 
-# Main event loop (no periodic polling here)
-while True:
-    try:
-        event, values = window.read(timeout=100)
-    except Exception as loop_error:
+# [CHANGE 2026-10-15 23:10:00 -04:00] Per-servo poll/limit state is created once here instead of being
+# re-checked with hasattr() on every event; handlers rely on it existing.
+# The invalid/zero counters advance once per delivered sample; with change-only delivery an unchanged
+# reply at rest arrives about once per POLL_HEARTBEAT_S, so "N samples" can span N seconds.
+# _limit_exceed_counts follows the poller's per-poll 'limit_count' instead.
+if not hasattr(window, '_invalid_resp_counters'):
+    window._invalid_resp_counters = [0]*8
+if not hasattr(window, '_consecutive_zero_actuals'):
+    window._consecutive_zero_actuals = [0]*8
+if not hasattr(window, '_last_valid_pos'):
+    window._last_valid_pos = ['']*8
+if not hasattr(window, '_last_pos_update_ts'):
+    window._last_pos_update_ts = [None]*8
+if not hasattr(window, '_limit_tripped'):
+    window._limit_tripped = [False]*8
+if not hasattr(window, '_limit_exceed_counts'):
+    window._limit_exceed_counts = [0]*8
+if not hasattr(window, '_jog_limit_hit'):
+    window._jog_limit_hit = [False]*8
+
+# [CHANGE 2026-10-15 23:35:00 -04:00] Main event loop moved into a function, called once from __main__.
+# Loop temporaries become fast locals; module state the loop rebinds is declared global below.
+def run_event_loop(window, comm):
+    """Dispatch GUI events until the window is closed (no periodic polling here)."""
+    global LOG_POSITION_POLLS, SEQ_RUNNING, SEQ_STOP_EVENT, SEQ_THREAD, window_closed
+    while True:
         try:
-            sg.popup_error(f'UI loop error: {loop_error}', keep_on_top=True)
-        except Exception:
-            pass
-        continue
-    if event == 'SHOW_POLL_LOGS':
-        LOG_POSITION_POLLS = bool(values.get('SHOW_POLL_LOGS', False))
-        continue
-    if event == 'TABGROUP':
-        _refresh_description_colors(window)
-        continue
-    if event == 'ESTOP':
-        # Immediate stop for all axes
-        # [CHANGE 2026-03-24 16:18:00 -04:00] Send explicit per-axis stops for mixed-controller axes (E/H) in addition to global ST.
-        # Cancel any in-flight DataPipe PR send
-        if hasattr(window, '_dp_pr_stop') and window._dp_pr_stop:
+            # [CHANGE 2026-10-15 22:35:00 -04:00] Block until a real event: pollers post via write_event_value
+            # and periodic jobs (log trim, highlight debounce) run as Tk after() callbacks, so nothing needs a tick.
+            event, values = window.read()
+        except Exception as loop_error:
             try:
-                window._dp_pr_stop.set()
+                sg.popup_error(f'UI loop error: {loop_error}', keep_on_top=True)
             except Exception:
                 pass
-        if SEQ_STOP_EVENT is not None:
+            continue
+        if event == 'SHOW_POLL_LOGS':
+            LOG_POSITION_POLLS = bool(values.get('SHOW_POLL_LOGS', False))
+            continue
+        if event in ('CONFIRM_OK', 'CONFIRM_CANCEL'):
+            resolve_setpoint_confirm(window, event == 'CONFIRM_OK')
+            continue
+        if event == 'CMD_REPLY':
+            cmd, response, error, tag = values[event]
+            if tag[0] == 'setpoint':
+                apply_setpoint_reply(window, cmd, response, error, *tag[1:])
+            else:
+                apply_jog_reply(window, cmd, response, error, tag)
+            continue
+        if event == 'POLL_MS':
             try:
+                applied_ms = set_poll_interval(values.get('POLL_MS', POLL_INTERVAL_DEFAULT_MS))
+            except (TypeError, ValueError):
+                applied_ms = set_poll_interval(POLL_INTERVAL_DEFAULT_MS)
+            window['POLL_MS'].update(applied_ms)
+            continue
+        if event == 'TABGROUP':
+            _refresh_description_colors(window)
+            continue
+        if event == 'ESTOP':
+            # Immediate stop for all axes
+            # [CHANGE 2026-03-24 16:18:00 -04:00] Send explicit per-axis stops for mixed-controller axes (E/H) in addition to global ST.
+            # [CHANGE 2026-10-15 21:40:00 -04:00] Drop (revert) any setpoint still awaiting confirmation.
+            if getattr(window, '_pending_confirm', None) is not None:
+                resolve_setpoint_confirm(window, False)
+            # Cancel any in-flight DataPipe PR send
+            if hasattr(window, '_dp_pr_stop') and window._dp_pr_stop:
+                try:
+                    window._dp_pr_stop.set()
+                except Exception:
+                    pass
+            if SEQ_STOP_EVENT is not None:
+                try:
+                    SEQ_STOP_EVENT.set()
+                except Exception:
+                    pass
+            SEQ_RUNNING = False
+            if 'ALL_RUN_SEQUENCE' in window.AllKeysDict:
+                window['ALL_RUN_SEQUENCE'].update(disabled=False)
+            if 'ALL_STOP_SEQUENCE' in window.AllKeysDict:
+                window['ALL_STOP_SEQUENCE'].update(disabled=True)
+            # [CHANGE 2026-10-16 00:55:00 -04:00] Empty the writer queue and cancel jog chains before ST goes out.
+            cancel_queued_commands()
+            stop_errors = []
+            # Main RSI/Galil path (A-D and any axes mapped there)
+            if comm:
+                try:
+                    resp = comm.send_command('ST')
+                    if not window_closed:
+                        ELEMENTS['DEBUG_LOG'].print(f'[ESTOP] Sent ST to main controller -> {resp}')
+                except Exception as ex:
+                    stop_errors.append(f'main ST failed: {ex}')
+
+            # Explicit per-axis stop for mixed-controller axes
+            for axis_letter, servo_num in [('E', 5), ('H', 8)]:
+                try:
+                    stop_key = f'S{servo_num}_stop'
+                    stop_cmd = STATIC_CMD.get(stop_key)
+                    if stop_cmd:
+                        stop_cmd_val = stop_cmd
+                        stop_resp = send_axis_command(axis_letter, stop_cmd_val)
+                        if not window_closed:
+                            ELEMENTS['DEBUG_LOG'].print(f'[ESTOP] Sent {stop_cmd_val} to Axis {axis_letter} -> {stop_resp}')
+                except Exception as ex:
+                    stop_errors.append(f'Axis {axis_letter} stop failed: {ex}')
+
+            LAST_MOTION_COMMAND[:] = [None]*8
+            if not window_closed:
+                for idx in range(1, 9):
+                    set_status_indicator(window, idx, 'E-STOP', '#FF0000')
+
+            if stop_errors and not window_closed:
+                sg.popup_error('E-STOP completed with errors:\n' + '\n'.join(stop_errors), keep_on_top=True)
+            elif (comm is None and comm_e is None and comm_h is None) and not window_closed:
+                sg.popup_error('Controller communications not initialized.', keep_on_top=True)
+            continue
+        if event == 'ALL_SEQ_LOG':
+            msg = values.get(event, '')
+            if not window_closed:
+                ELEMENTS['DEBUG_LOG'].print(msg)
+            continue
+        if event == 'ALL_SEQ_ERROR':
+            err_msg = values.get(event, '')
+            if not window_closed:
+                ELEMENTS['DEBUG_LOG'].print(f'[SEQ ERROR] {err_msg}')
+                sg.popup_error(err_msg, keep_on_top=True)
+            continue
+        if event == 'ALL_STEP_TIME':
+            payload = values.get(event, None)
+            if isinstance(payload, (list, tuple)) and len(payload) >= 2:
+                step_idx, elapsed = payload[0], payload[1]
+                key = f'ALL_STEP{step_idx}_TIME'
+                if key in window.AllKeysDict:
+                    try:
+                        window[key].update(f"{float(elapsed):.2f}")
+                    except Exception:
+                        window[key].update('—')
+            continue
+        if event == 'ALL_SEQ_DONE':
+            status = values.get(event, '')
+            SEQ_RUNNING = False
+            SEQ_STOP_EVENT = None
+            SEQ_THREAD = None
+            if 'ALL_RUN_SEQUENCE' in window.AllKeysDict:
+                window['ALL_RUN_SEQUENCE'].update(disabled=False)
+            if 'ALL_STOP_SEQUENCE' in window.AllKeysDict:
+                window['ALL_STOP_SEQUENCE'].update(disabled=True)
+            if not window_closed:
+                ELEMENTS['DEBUG_LOG'].print(f'[SEQ] Done: {status}')
+                if isinstance(status, str):
+                    if status.startswith('error'):
+                        sg.popup_error(status, keep_on_top=True)
+                    elif status == 'completed':
+                        sg.popup_ok('Sequence complete.', keep_on_top=True)
+            continue
+        if event == 'ALL_STOP_SEQUENCE':
+            if SEQ_STOP_EVENT is not None:
                 SEQ_STOP_EVENT.set()
+            continue
+
+        # DataPipe events
+        if event == 'DP_LOAD':
+            file_path = values.get('DP_FILE', '')
+            sheet_name = values.get('DP_SHEET', '') or None
+            try:
+                row_start = int(str(values.get('DP_ROW_START', '2')).strip() or '2')
+                row_end = int(str(values.get('DP_ROW_END', '61')).strip() or '61')
             except Exception:
-                pass
-        SEQ_RUNNING = False
-        if 'ALL_RUN_SEQUENCE' in window.AllKeysDict:
-            window['ALL_RUN_SEQUENCE'].update(disabled=False)
-        if 'ALL_STOP_SEQUENCE' in window.AllKeysDict:
-            window['ALL_STOP_SEQUENCE'].update(disabled=True)
-        stop_errors = []
-        # Main RSI/Galil path (A-D and any axes mapped there)
-        if comm:
+                row_start, row_end = 2, 61
             try:
-                resp = comm.send_command('ST')
-                if not window_closed:
-                    window['DEBUG_LOG'].print(f'[ESTOP] Sent ST to main controller -> {resp}')
-            except Exception as ex:
-                stop_errors.append(f'main ST failed: {ex}')
+                raw_segments, seconds_guess, missing_axes = load_datapipe_segments(file_path, sheet_name, row_start, row_end)
+                prepared_segments = prepare_datapipe_segments(raw_segments)
+                window._dp_segments = prepared_segments
+                window._dp_time_ms = prepared_segments[0]['time_ms'] if prepared_segments else None
+                render_datapipe_preview(window, prepared_segments)
+                time_note = 'seconds converted to ms' if seconds_guess else 'ms'
+                missing_note = f"; missing headers treated as 0: {', '.join(missing_axes)}" if missing_axes else ''
+                window['DP_STATUS'].update(f"Loaded {len(prepared_segments)} segments ({time_note}{missing_note}).")
+                if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
+                    ELEMENTS['DEBUG_LOG'].print(f"[DP_LOAD] missing axes: {missing_axes}")
+                enable_dp = bool(prepared_segments)
+                window['DP_SEND'].update(disabled=not enable_dp)
+                if 'DP_SEND_PR' in window.AllKeysDict:
+                    window['DP_SEND_PR'].update(disabled=not enable_dp)
+                if 'DP_SEND_BATCH_PR' in window.AllKeysDict:
+                    window['DP_SEND_BATCH_PR'].update(disabled=not enable_dp)
+            except Exception as e:
+                error_details = f"[DP_LOAD] {e}\n" + traceback.format_exc()
+                window['DP_STATUS'].update(f"Load failed: {e}")
+                if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
+                    ELEMENTS['DEBUG_LOG'].print(error_details)
 
-        # Explicit per-axis stop for mixed-controller axes
-        for axis_letter, servo_num in [('E', 5), ('H', 8)]:
+        if event == 'DP_SEND_BATCH_PR':
             try:
-                stop_key = f'S{servo_num}_stop'
-                stop_cmd = COMMAND_MAP.get(stop_key)
-                if stop_cmd:
-                    stop_cmd_val = stop_cmd if not callable(stop_cmd) else stop_cmd()
-                    stop_resp = send_axis_command(axis_letter, stop_cmd_val)
-                    if not window_closed:
-                        window['DEBUG_LOG'].print(f'[ESTOP] Sent {stop_cmd_val} to Axis {axis_letter} -> {stop_resp}')
-            except Exception as ex:
-                stop_errors.append(f'Axis {axis_letter} stop failed: {ex}')
+                segments = getattr(window, '_dp_segments', None)
+                if not segments:
+                    ELEMENTS['DEBUG_LOG'].print('No segments loaded for batch PR.')
+                else:
+                    program_str = send_batch_pr_program(comm, segments)
+                    ELEMENTS['DEBUG_LOG'].print('Batch PR program sent and executed.')
+            except Exception as e:
+                ELEMENTS['DEBUG_LOG'].print(f'Error: {e}')
+                window['DP_PREVIEW'].update('')
+                window['DP_SEND'].update(disabled=True)
+                if 'DP_SEND_PR' in window.AllKeysDict:
+                    window['DP_SEND_PR'].update(disabled=True)
+            continue
 
-        LAST_MOTION_COMMAND[:] = [None]*8
-        if not window_closed:
-            for idx in range(1, 9):
-                window[f'S{idx}_status_light'].update('●', text_color='#FF0000')
-                window[f'S{idx}_status_text'].update('E-STOP', text_color='#FF0000')
-
-        if stop_errors and not window_closed:
-            sg.popup_error('E-STOP completed with errors:\n' + '\n'.join(stop_errors), keep_on_top=True)
-        elif (comm is None and comm_e is None and comm_h is None) and not window_closed:
-            sg.popup_error('Controller communications not initialized.', keep_on_top=True)
-        continue
-    if event == 'ALL_SEQ_LOG':
-        msg = values.get(event, '')
-        if not window_closed:
-            window['DEBUG_LOG'].print(msg)
-        continue
-    if event == 'ALL_SEQ_ERROR':
-        err_msg = values.get(event, '')
-        if not window_closed:
-            window['DEBUG_LOG'].print(f'[SEQ ERROR] {err_msg}')
-            sg.popup_error(err_msg, keep_on_top=True)
-        continue
-    if event == 'ALL_STEP_TIME':
-        payload = values.get(event, None)
-        if isinstance(payload, (list, tuple)) and len(payload) >= 2:
-            step_idx, elapsed = payload[0], payload[1]
-            key = f'ALL_STEP{step_idx}_TIME'
-            if key in window.AllKeysDict:
-                try:
-                    window[key].update(f"{float(elapsed):.2f}")
-                except Exception:
-                    window[key].update('—')
-        continue
-    if event == 'ALL_SEQ_DONE':
-        status = values.get(event, '')
-        SEQ_RUNNING = False
-        SEQ_STOP_EVENT = None
-        SEQ_THREAD = None
-        if 'ALL_RUN_SEQUENCE' in window.AllKeysDict:
-            window['ALL_RUN_SEQUENCE'].update(disabled=False)
-        if 'ALL_STOP_SEQUENCE' in window.AllKeysDict:
-            window['ALL_STOP_SEQUENCE'].update(disabled=True)
-        if not window_closed:
-            window['DEBUG_LOG'].print(f'[SEQ] Done: {status}')
-            if isinstance(status, str):
-                if status.startswith('error'):
-                    sg.popup_error(status, keep_on_top=True)
-                elif status == 'completed':
-                    sg.popup_ok('Sequence complete.', keep_on_top=True)
-        continue
-    if event == 'ALL_STOP_SEQUENCE':
-        if SEQ_STOP_EVENT is not None:
-            SEQ_STOP_EVENT.set()
-        continue
-
-    # DataPipe events
-    if event == 'DP_LOAD':
-        file_path = values.get('DP_FILE', '')
-        sheet_name = values.get('DP_SHEET', '') or None
-        try:
-            row_start = int(str(values.get('DP_ROW_START', '2')).strip() or '2')
-            row_end = int(str(values.get('DP_ROW_END', '61')).strip() or '61')
-        except Exception:
-            row_start, row_end = 2, 61
-        try:
-            raw_segments, seconds_guess, missing_axes = load_datapipe_segments(file_path, sheet_name, row_start, row_end)
-            prepared_segments = prepare_datapipe_segments(raw_segments)
-            window._dp_segments = prepared_segments
-            window._dp_time_ms = prepared_segments[0]['time_ms'] if prepared_segments else None
-            render_datapipe_preview(window, prepared_segments)
-            time_note = 'seconds converted to ms' if seconds_guess else 'ms'
-            missing_note = f"; missing headers treated as 0: {', '.join(missing_axes)}" if missing_axes else ''
-            window['DP_STATUS'].update(f"Loaded {len(prepared_segments)} segments ({time_note}{missing_note}).")
-            if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
-                window['DEBUG_LOG'].print(f"[DP_LOAD] missing axes: {missing_axes}")
-            enable_dp = bool(prepared_segments)
-            window['DP_SEND'].update(disabled=not enable_dp)
-            if 'DP_SEND_PR' in window.AllKeysDict:
-                window['DP_SEND_PR'].update(disabled=not enable_dp)
-            if 'DP_SEND_BATCH_PR' in window.AllKeysDict:
-                window['DP_SEND_BATCH_PR'].update(disabled=not enable_dp)
-        except Exception as e:
-            error_details = f"[DP_LOAD] {e}\n" + traceback.format_exc()
-            window['DP_STATUS'].update(f"Load failed: {e}")
-            if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
-                window['DEBUG_LOG'].print(error_details)
+        if event == 'DP_SEND':
+            segments = getattr(window, '_dp_segments', None)
+            try:
+                if not segments:
+                    raise RuntimeError('No segments loaded. Load first.')
+                send_datapipe_contour(comm, segments, window)
+                window['DP_STATUS'].update('Contour data sent to controller (DT uses first segment).')
+            except Exception as e:
+                window['DP_STATUS'].update(f"Send failed: {e}")
+            continue
 
-    if event == 'DP_SEND_BATCH_PR':
-        try:
+        if event == 'DP_SEND_PR':
             segments = getattr(window, '_dp_segments', None)
             if not segments:
-                window['DEBUG_LOG'].print('No segments loaded for batch PR.')
-            else:
-                program_str = send_batch_pr_program(comm, segments)
-                window['DEBUG_LOG'].print('Batch PR program sent and executed.')
-        except Exception as e:
-            window['DEBUG_LOG'].print(f'Error: {e}')
-            window['DP_PREVIEW'].update('')
-            window['DP_SEND'].update(disabled=True)
-            if 'DP_SEND_PR' in window.AllKeysDict:
-                window['DP_SEND_PR'].update(disabled=True)
-        continue
-
-    if event == 'DP_SEND':
-        segments = getattr(window, '_dp_segments', None)
-        try:
-            if not segments:
-                raise RuntimeError('No segments loaded. Load first.')
-            send_datapipe_contour(comm, segments, window)
-            window['DP_STATUS'].update('Contour data sent to controller (DT uses first segment).')
-        except Exception as e:
-            window['DP_STATUS'].update(f"Send failed: {e}")
-        continue
-
-    if event == 'DP_SEND_PR':
-        segments = getattr(window, '_dp_segments', None)
-        if not segments:
-            window['DP_STATUS'].update('No segments loaded. Load first.')
-            continue
-        try:
-            line_speed = float(str(values.get('ALL_LINE_SPEED', '1')).strip() or '1')
-        except Exception:
-            line_speed = 1.0
-        if line_speed < 0:
-            line_speed = 0.0
-        max_rows = None
-        try:
-            max_rows_val = str(values.get('DP_RUN_ROWS', '')).strip()
-            if max_rows_val:
-                max_rows = int(float(max_rows_val))
-                if max_rows <= 0:
-                    max_rows = None
-        except Exception:
+                window['DP_STATUS'].update('No segments loaded. Load first.')
+                continue
+            try:
+                line_speed = float(str(values.get('ALL_LINE_SPEED', '1')).strip() or '1')
+            except Exception:
+                line_speed = 1.0
+            if line_speed < 0:
+                line_speed = 0.0
             max_rows = None
-        if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
-            window['DEBUG_LOG'].print(f"[DP_SEND_PR] rows={len(segments)} max_rows={max_rows} line_speed={line_speed}")
-
-        import threading
-        DP_PR_STOP_EVENT = threading.Event()
-        window._dp_pr_stop = DP_PR_STOP_EVENT
-        window['DP_STATUS'].update('Sending PR sequence...')
-
-        def _run_dp_pr():
             try:
-                send_datapipe_pr(comm, segments, window, line_speed=line_speed, values=values, max_rows=max_rows, stop_event=DP_PR_STOP_EVENT)
-                ran_rows = max_rows if (max_rows is not None and max_rows > 0) else len(segments)
-                window.write_event_value('DP_PR_DONE', f'PR sequence sent (rows={ran_rows}).')
-            except Exception as e:
-                window.write_event_value('DP_PR_ERROR', f"Send failed: {e}")
-
-        threading.Thread(target=_run_dp_pr, daemon=True).start()
-        continue
-
-    if event == 'DP_PR_PROGRESS':
-        payload = values.get(event, None)
-        if isinstance(payload, (list, tuple)) and len(payload) == 2 and 'DP_STATUS' in window.AllKeysDict:
-            idx, total = payload
-            window['DP_STATUS'].update(f'Sending PR: {idx}/{total}')
-        continue
-
-    if event == 'DP_PR_DONE':
-        msg = values.get(event, '')
-        if 'DP_STATUS' in window.AllKeysDict:
-            window['DP_STATUS'].update(msg)
-        continue
-
-    if event == 'DP_PR_ERROR':
-        msg = values.get(event, '')
-        if 'DP_STATUS' in window.AllKeysDict:
-            window['DP_STATUS'].update(msg)
-        if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
-            window['DEBUG_LOG'].print(f"[DP_SEND_PR] error: {msg}")
-        continue
-
-    if event == 'ALL_PVT_SEND':
-        try:
-            sample_ms = float(str(values.get('ALL_PVT_SAMPLE_MS', '50')).strip() or '50')
-            if sample_ms <= 0:
-                raise ValueError('Sample time must be positive.')
-            payload = build_all_pvt_payload(values, window, sample_ms)
-            window._pvt_payload = payload
-            if 'PVT_PREVIEW' in window.AllKeysDict:
-                render_pvt_preview(window, payload)
-            send_pvt_payload(comm, payload, window)
-            status_msg = f"Sent {payload['count']} PVT points from ALL tab @ {sample_ms:.1f} ms."
-            if 'ALL_PVT_STATUS' in window.AllKeysDict:
-                window['ALL_PVT_STATUS'].update(status_msg)
-            if 'PVT_STATUS' in window.AllKeysDict:
-                window['PVT_STATUS'].update(status_msg)
-            if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
-                window['DEBUG_LOG'].print(f"[ALL_PVT_SEND] points={payload['count']} sample={sample_ms}")
-        except Exception as e:
-            fail_msg = f"Send failed: {e}"
-            if 'ALL_PVT_STATUS' in window.AllKeysDict:
-                window['ALL_PVT_STATUS'].update(fail_msg)
-            if 'PVT_STATUS' in window.AllKeysDict:
-                window['PVT_STATUS'].update(fail_msg)
+                max_rows_val = str(values.get('DP_RUN_ROWS', '')).strip()
+                if max_rows_val:
+                    max_rows = int(float(max_rows_val))
+                    if max_rows <= 0:
+                        max_rows = None
+            except Exception:
+                max_rows = None
             if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
-                window['DEBUG_LOG'].print(f"[ALL_PVT_SEND] error: {e}\n{traceback.format_exc()}")
-        continue
+                ELEMENTS['DEBUG_LOG'].print(f"[DP_SEND_PR] rows={len(segments)} max_rows={max_rows} line_speed={line_speed}")
 
-    if event == 'PVT_LOAD':
-        file_path = str(values.get('PVT_FILE', '') or '').strip()
-        try:
-            sample_ms = float(str(values.get('PVT_SAMPLE_MS', '50')).strip() or '50')
-        except Exception:
-            sample_ms = 50.0
-        try:
-            if not file_path:
-                raise ValueError('Select a PVT file first.')
-            if sample_ms <= 0:
-                raise ValueError('Sample time must be positive.')
-            raw_rows = load_pvt_points(file_path)
-            payload = prepare_pvt_payload(raw_rows, sample_ms)
-            window._pvt_payload = payload
-            render_pvt_preview(window, payload)
-            window['PVT_STATUS'].update(f"Loaded {payload['count']} points @ {sample_ms:.1f} ms.")
-            window['PVT_SEND'].update(disabled=False)
-            if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
-                window['DEBUG_LOG'].print(f"[PVT_LOAD] points={payload['count']} sample={sample_ms} file={file_path}")
-        except Exception as e:
-            window['PVT_STATUS'].update(f"Load failed: {e}")
-            window['PVT_PREVIEW'].update('')
-            if 'PVT_SEND' in window.AllKeysDict:
-                window['PVT_SEND'].update(disabled=True)
-            if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
-                window['DEBUG_LOG'].print(f"[PVT_LOAD] error: {e}\n{traceback.format_exc()}")
-        continue
+            DP_PR_STOP_EVENT = threading.Event()
+            window._dp_pr_stop = DP_PR_STOP_EVENT
+            window['DP_STATUS'].update('Sending PR sequence...')
 
-    if event == 'PVT_SEND':
-        payload = getattr(window, '_pvt_payload', None)
-        try:
-            if not payload:
-                raise RuntimeError('Load PVT data first.')
-            send_pvt_payload(comm, payload, window)
-            window['PVT_STATUS'].update('PVT sent to controller (PT/PV/PA, axes A-D).')
-        except Exception as e:
-            window['PVT_STATUS'].update(f"Send failed: {e}")
+            def _run_dp_pr():
+                try:
+                    send_datapipe_pr(comm, segments, window, line_speed=line_speed, values=values, max_rows=max_rows, stop_event=DP_PR_STOP_EVENT)
+                    ran_rows = max_rows if (max_rows is not None and max_rows > 0) else len(segments)
+                    window.write_event_value('DP_PR_DONE', f'PR sequence sent (rows={ran_rows}).')
+                except Exception as e:
+                    window.write_event_value('DP_PR_ERROR', f"Send failed: {e}")
+
+            threading.Thread(target=_run_dp_pr, daemon=True).start()
+            continue
+
+        if event == 'DP_PR_PROGRESS':
+            payload = values.get(event, None)
+            if isinstance(payload, (list, tuple)) and len(payload) == 2 and 'DP_STATUS' in window.AllKeysDict:
+                idx, total = payload
+                window['DP_STATUS'].update(f'Sending PR: {idx}/{total}')
+            continue
+
+        if event == 'DP_PR_DONE':
+            msg = values.get(event, '')
+            if 'DP_STATUS' in window.AllKeysDict:
+                window['DP_STATUS'].update(msg)
+            continue
+
+        if event == 'DP_PR_ERROR':
+            msg = values.get(event, '')
+            if 'DP_STATUS' in window.AllKeysDict:
+                window['DP_STATUS'].update(msg)
             if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
-                window['DEBUG_LOG'].print(f"[PVT_SEND] error: {e}\n{traceback.format_exc()}")
-        continue
-    # Ensure counters are initialized before use
-    if not hasattr(window, '_invalid_resp_counters'):
-        window._invalid_resp_counters = [0]*8
-    if not hasattr(window, '_consecutive_zero_actuals'):
-        window._consecutive_zero_actuals = [0]*8
-    if not hasattr(window, '_last_valid_pos'):
-        window._last_valid_pos = ['']*8
-    if not hasattr(window, '_last_pos_update_ts'):
-        window._last_pos_update_ts = [None]*8
-    if not hasattr(window, '_limit_tripped'):
-        window._limit_tripped = [False]*8
-    if not hasattr(window, '_limit_exceed_counts'):
-        window._limit_exceed_counts = [0]*8
-    if not hasattr(window, '_jog_limit_hit'):
-        window._jog_limit_hit = [False]*8
-
-    # Sync per-servo description input to ALL tab label
-    if isinstance(event, str) and event.startswith('S') and event.endswith('_desc'):
-        try:
-            servo_num = int(event[1:event.index('_')])
-            desc_text = str(values.get(event, '')).strip()
-            display_text = desc_text if desc_text else DEFAULT_SERVO_DESCRIPTIONS.get(servo_num, f'Servo {servo_num}')
-            if f'ALL_S{servo_num}_desc' in window.AllKeysDict:
-                window[f'ALL_S{servo_num}_desc'].update(display_text)
-            axis_letter = AXIS_LETTERS[servo_num - 1]
-            AXIS_UNITS.setdefault(axis_letter, {})['description'] = display_text
-            save_axis_description(axis_letter, display_text)
-        except Exception as desc_err:
-            if not window_closed:
-                window['DEBUG_LOG'].print(f'[ERROR] Descriptor update failed: {desc_err}\n{traceback.format_exc()}')
-        continue
+                ELEMENTS['DEBUG_LOG'].print(f"[DP_SEND_PR] error: {msg}")
+            continue
 
-    if handle_all_tab_event(window, event, values):
-        continue
-    if event == 'ALL_RUN_SEQUENCE':
-        handle_all_run_sequence(window, comm, values)
-        continue
+        if event == 'ALL_PVT_SEND':
+            try:
+                sample_ms = float(str(values.get('ALL_PVT_SAMPLE_MS', '50')).strip() or '50')
+                if sample_ms <= 0:
+                    raise ValueError('Sample time must be positive.')
+                payload = build_all_pvt_payload(values, window, sample_ms)
+                window._pvt_payload = payload
+                if 'PVT_PREVIEW' in window.AllKeysDict:
+                    render_pvt_preview(window, payload)
+                send_pvt_payload(comm, payload, window)
+                status_msg = f"Sent {payload['count']} PVT points from ALL tab @ {sample_ms:.1f} ms."
+                if 'ALL_PVT_STATUS' in window.AllKeysDict:
+                    window['ALL_PVT_STATUS'].update(status_msg)
+                if 'PVT_STATUS' in window.AllKeysDict:
+                    window['PVT_STATUS'].update(status_msg)
+                if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
+                    ELEMENTS['DEBUG_LOG'].print(f"[ALL_PVT_SEND] points={payload['count']} sample={sample_ms}")
+            except Exception as e:
+                fail_msg = f"Send failed: {e}"
+                if 'ALL_PVT_STATUS' in window.AllKeysDict:
+                    window['ALL_PVT_STATUS'].update(fail_msg)
+                if 'PVT_STATUS' in window.AllKeysDict:
+                    window['PVT_STATUS'].update(fail_msg)
+                if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
+                    ELEMENTS['DEBUG_LOG'].print(f"[ALL_PVT_SEND] error: {e}\n{traceback.format_exc()}")
+            continue
 
-    if event == 'JOG_PRESS':
-        try:
-            servo_num, direction, is_press = values.get(event, (None, None, None))
-        except Exception:
-            servo_num, direction, is_press = None, None, None
-        if servo_num is not None and direction is not None and is_press is not None:
-            handle_jog_press(window, int(servo_num), direction, bool(is_press), values)
-        else:
-            print(f'[DEBUG] Invalid JOG_PRESS payload: {values.get(event)}')
-        continue
+        if event == 'PVT_LOAD':
+            file_path = str(values.get('PVT_FILE', '') or '').strip()
+            try:
+                sample_ms = float(str(values.get('PVT_SAMPLE_MS', '50')).strip() or '50')
+            except Exception:
+                sample_ms = 50.0
+            try:
+                if not file_path:
+                    raise ValueError('Select a PVT file first.')
+                if sample_ms <= 0:
+                    raise ValueError('Sample time must be positive.')
+                raw_rows = load_pvt_points(file_path)
+                payload = prepare_pvt_payload(raw_rows, sample_ms)
+                window._pvt_payload = payload
+                render_pvt_preview(window, payload)
+                window['PVT_STATUS'].update(f"Loaded {payload['count']} points @ {sample_ms:.1f} ms.")
+                window['PVT_SEND'].update(disabled=False)
+                if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
+                    ELEMENTS['DEBUG_LOG'].print(f"[PVT_LOAD] points={payload['count']} sample={sample_ms} file={file_path}")
+            except Exception as e:
+                window['PVT_STATUS'].update(f"Load failed: {e}")
+                window['PVT_PREVIEW'].update('')
+                if 'PVT_SEND' in window.AllKeysDict:
+                    window['PVT_SEND'].update(disabled=True)
+                if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
+                    ELEMENTS['DEBUG_LOG'].print(f"[PVT_LOAD] error: {e}\n{traceback.format_exc()}")
+            continue
 
-    if event == 'JOG_LIMIT_HIT':
-        try:
-            servo_num, which_limit = values.get(event, (None, None))
-            if servo_num is not None:
-                if hasattr(window, '_jog_limit_hit'):
-                    window._jog_limit_hit[int(servo_num) - 1] = True
-                if str(which_limit).lower() == 'max':
-                    window[f'S{servo_num}_status_light'].update('●', text_color='#FFA500')
-                    window[f'S{servo_num}_status_text'].update('At Max Limit', text_color='#FFA500')
-                else:
-                    window[f'S{servo_num}_status_light'].update('●', text_color='#FFA500')
-                    window[f'S{servo_num}_status_text'].update('At Min Limit', text_color='#FFA500')
-        except Exception as jog_limit_err:
-            print(f'[DEBUG] Failed to handle JOG_LIMIT_HIT: {jog_limit_err}')
-        continue
+        if event == 'PVT_SEND':
+            payload = getattr(window, '_pvt_payload', None)
+            try:
+                if not payload:
+                    raise RuntimeError('Load PVT data first.')
+                send_pvt_payload(comm, payload, window)
+                window['PVT_STATUS'].update('PVT sent to controller (PT/PV/PA, axes A-D).')
+            except Exception as e:
+                window['PVT_STATUS'].update(f"Send failed: {e}")
+                if not window_closed and 'DEBUG_LOG' in window.AllKeysDict:
+                    ELEMENTS['DEBUG_LOG'].print(f"[PVT_SEND] error: {e}\n{traceback.format_exc()}")
+            continue
+        # Sync per-servo description input to ALL tab label
+        if isinstance(event, str) and event.startswith('S') and event.endswith('_desc'):
+            try:
+                servo_num = int(event[1:event.index('_')])
+                desc_text = str(values.get(event, '')).strip()
+                display_text = desc_text if desc_text else DEFAULT_SERVO_DESCRIPTIONS.get(servo_num, f'Servo {servo_num}')
+                if f'ALL_S{servo_num}_desc' in window.AllKeysDict:
+                    window[f'ALL_S{servo_num}_desc'].update(display_text)
+                axis_letter = AXIS_LETTERS[servo_num - 1]
+                AXIS_UNITS.setdefault(axis_letter, {})['description'] = display_text
+                save_axis_description(axis_letter, display_text)
+            except Exception as desc_err:
+                if not window_closed:
+                    ELEMENTS['DEBUG_LOG'].print(f'[ERROR] Descriptor update failed: {desc_err}\n{traceback.format_exc()}')
+            continue
 
+        if handle_all_tab_event(window, event, values):
+            continue
+        if event == 'ALL_RUN_SEQUENCE':
+            handle_all_run_sequence(window, comm, values)
+            continue
 
-    if event == sg.WIN_CLOSED:
-        window_closed = True
-        if SEQ_STOP_EVENT is not None:
+        if event == 'JOG_PRESS':
             try:
-                SEQ_STOP_EVENT.set()
+                servo_num, direction, is_press = values.get(event, (None, None, None))
             except Exception:
-                pass
-        try:
-            save_sequence_state_from_values(values)
-        except Exception:
-            pass
-        try:
-            # [CHANGE 2026-03-24 11:19:00 -04:00] Persist speed/accel/decel for next startup.
-            save_motion_defaults_from_values(values)
-        except Exception:
-            pass
-        break
-
-    # Logging errors/warnings forwarded from background threads and communications.py
-    if event == 'GUI_LOG':
-        msg = values.get('GUI_LOG', '')
-        if msg and not window_closed:
-            window['DEBUG_LOG'].print(msg)
-
-    # [CHANGE 2026-04-17 00:00:00 -04:00] Comm health: update per-axis link indicator dots.
-    if event == 'COMM_HEALTH':
-        health_data = values.get('COMM_HEALTH', {})
-        if isinstance(health_data, dict) and not window_closed:
-            for servo_num, info in health_data.items():
-                ok = info.get('ok')
-                label = info.get('label', '')
-                ind_key   = f'S{servo_num}_comm_indicator'
-                label_key = f'S{servo_num}_comm_label'
-                if ind_key not in window.AllKeysDict:
-                    continue
-                if ok is True:
-                    color = '#00CC00'   # green
-                elif ok is False:
-                    color = '#FF3333'   # red
-                else:
-                    color = 'gray'      # not configured
-                window[ind_key].update('\u25cf', text_color=color)
-                window[label_key].update(label, text_color=color)
-        continue
-
-    if event == 'POSITION_POLL':
-        # Handle position update from background thread
-        data = values[event] if event in values else None
-        if data:
-            i = data['servo']
-            axis_letter = data['axis_letter']
-            pos_resp = data.get('pos_resp')
-            raw_resp = data.get('raw_resp')
-            pos_val = None
-            pos_val_deg = None
-            valid = False
-            # [CHANGE 2026-03-27 11:35:00 -04:00] Axis E has no encoder; render Actual from commanded cache only.
-            axis_e_allow_update = True
-            axis_e_override_pulses = None
-            if axis_letter == 'E':
+                servo_num, direction, is_press = None, None, None
+            if servo_num is not None and direction is not None and is_press is not None:
+                handle_jog_press(window, int(servo_num), direction, bool(is_press), values)
+            else:
+                print(f'[DEBUG] Invalid JOG_PRESS payload: {values.get(event)}')
+            continue
+
+        if event == 'JOG_LIMIT_HIT':
+            try:
+                servo_num, which_limit = values.get(event, (None, None))
+                if servo_num is not None:
+                    if hasattr(window, '_jog_limit_hit'):
+                        window._jog_limit_hit[int(servo_num) - 1] = True
+                    if str(which_limit).lower() == 'max':
+                        set_status_indicator(window, servo_num, 'At Max Limit', '#FFA500')
+                    else:
+                        set_status_indicator(window, servo_num, 'At Min Limit', '#FFA500')
+            except Exception as jog_limit_err:
+                print(f'[DEBUG] Failed to handle JOG_LIMIT_HIT: {jog_limit_err}')
+            continue
+
+
+        if event == sg.WIN_CLOSED:
+            window_closed = True
+            if SEQ_STOP_EVENT is not None:
                 try:
-                    if comm_e is not None:
-                        commanded = getattr(comm_e, 'clearcore_commanded_position', None)
-                        if commanded is None:
-                            commanded = getattr(comm_e, 'clearcore_last_position', None)
-                        if commanded is not None:
-                            axis_e_override_pulses = float(commanded)
-                            pos_resp = str(commanded)
+                    SEQ_STOP_EVENT.set()
                 except Exception:
                     pass
-            # Log the raw response for debugging (optional)
-            if not window_closed and LOG_POSITION_POLLS:
-                window['DEBUG_LOG'].print(f'Axis {axis_letter}: MG _RP{axis_letter} raw response: {raw_resp}')
-            # [CHANGE 2026-03-24 15:40:00 -04:00] Disabled per-poll Servo 5 button-state query to prevent comm congestion/delays.
-            if axis_letter == 'E' and axis_e_allow_update and (pos_resp is None or str(pos_resp).strip() in (':', '')):
+            try:
+                save_sequence_state_from_values(values)
+            except Exception:
+                pass
+            try:
+                # [CHANGE 2026-03-24 11:19:00 -04:00] Persist speed/accel/decel for next startup.
+                save_motion_defaults_from_values(values)
+            except Exception:
+                pass
+            break
+
+        # Logging errors/warnings forwarded from background threads and communications.py
+        if event == 'GUI_LOG':
+            msg = values.get('GUI_LOG', '')
+            if msg and not window_closed:
+                ELEMENTS['DEBUG_LOG'].print(msg)
+
+        # [CHANGE 2026-04-17 00:00:00 -04:00] Comm health: update per-axis link indicator dots.
+        if event == 'COMM_HEALTH':
+            health_data = values.get('COMM_HEALTH', {})
+            if isinstance(health_data, dict) and not window_closed:
+                for servo_num, info in health_data.items():
+                    ok = info.get('ok')
+                    label = info.get('label', '')
+                    # [CHANGE 2026-10-15 22:45:00 -04:00] Cached elements; no per-report key formatting.
+                    servo_keys = SERVO_KEYS.get(servo_num)
+                    if servo_keys is None or servo_keys['comm_indicator'] not in ELEMENTS:
+                        continue
+                    if ok is True:
+                        color = '#00CC00'   # green
+                    elif ok is False:
+                        color = '#FF3333'   # red
+                    else:
+                        color = 'gray'      # not configured
+                    ELEMENTS[servo_keys['comm_indicator']].update('\u25cf', text_color=color)
+                    ELEMENTS[servo_keys['comm_label']].update(label, text_color=color)
+            continue
+
+        if event == 'POSITION_POLL':
+            # Handle position updates from background thread
+            # [CHANGE 2026-10-15 19:35:00 -04:00] The event is only a wakeup; samples come from the poll ring.
+            # [CHANGE 2026-10-15 20:10:00 -04:00] Coalesce: if the GUI fell behind, only the newest sample
+            # per servo is rendered; older ones would be overwritten in the same pass anyway.
+            latest_samples = POLL_SAMPLES.drain_latest()
+            # [CHANGE 2026-10-15 20:15:00 -04:00] Resolve each axis's pulses first, then convert every axis
+            # with one poll_pipeline call instead of one kernel call per sample.
+            for axis_idx in range(8):
+                POLL_RAW_PULSES[axis_idx] = float('nan')
+            for data in latest_samples.values():
+                if data['axis_letter'] == 'E':
+                    # [CHANGE 2026-03-27 11:35:00 -04:00] Axis E has no encoder; render Actual from commanded cache only.
+                    # [CHANGE 2026-10-16 00:10:00 -04:00] The only place Axis E is overridden; the render loop
+                    # below reads the substituted pos_resp like any other axis.
+                    try:
+                        if comm_e is not None:
+                            commanded = getattr(comm_e, 'clearcore_commanded_position', None)
+                            if commanded is None:
+                                commanded = getattr(comm_e, 'clearcore_last_position', None)
+                            if commanded is not None:
+                                data['pos_resp'] = str(float(commanded))
+                    except Exception:
+                        pass
                 try:
-                    if comm_e is not None:
-                        commanded = getattr(comm_e, 'clearcore_commanded_position', None)
-                        if commanded is not None:
-                            pos_resp = str(commanded)
+                    POLL_RAW_PULSES[data['servo'] - 1] = float(data.get('pos_resp'))
                 except Exception:
                     pass
-            if axis_e_override_pulses is not None:
-                pos_resp = str(axis_e_override_pulses)
-            if axis_e_allow_update and pos_resp is not None and str(pos_resp).strip() != ':' and str(pos_resp).strip() != '':
-                try:
-                    pos_val_pulses = float(pos_resp)
-                    axis_units = AXIS_UNITS[axis_letter]
-                    pulses_per_degree = axis_units.get('scaling') or (axis_units.get('pulses', 0) / max(axis_units.get('degrees', 1), 1e-9))
-                    if pulses_per_degree <= 0:
-                        pulses_per_degree = 1
-                    gearbox = axis_units.get('gearbox', 1)
-                    pos_val_deg = pos_val_pulses / (pulses_per_degree * gearbox)
-                    pos_val_disp = 0 if abs(pos_val_deg) < 1e-6 else round(pos_val_deg, 2)
-                    # Robust: Only treat zero as valid if setpoint was zero or after 3 consecutive zero responses
-                    last_setpoint = getattr(window, '_last_setpoints', [{}]*8)[i-1].get('abs_pos', None)
+            # [CHANGE 2026-10-15 20:30:00 -04:00] Fused kernel: degrees plus a soft-limit bitmask for all axes.
+            in_soft_limits = poll_pipeline(POLL_RAW_PULSES, AXIS_INV_SG, AXIS_SOFT_MIN, AXIS_SOFT_MAX, POLL_DEGREES)
+            limit_tripped = window._limit_tripped
+            limit_exceed_counts = window._limit_exceed_counts
+            jog_limit_hit = window._jog_limit_hit
+            for data in latest_samples.values():
+                i = data['servo']
+                servo_keys = SERVO_KEYS[i]
+                axis_letter = data['axis_letter']
+                pos_resp = data.get('pos_resp')
+                raw_resp = data.get('raw_resp')
+                pos_val_deg = None
+                valid = False
+                # Log the raw response for debugging (optional)
+                if not window_closed and LOG_POSITION_POLLS:
+                    POLL_LOG_BUFFER.append(f'Axis {axis_letter}: MG _RP{axis_letter} raw response: {raw_resp}')
+                # [CHANGE 2026-03-24 15:40:00 -04:00] Disabled per-poll Servo 5 button-state query to prevent comm congestion/delays.
+                # pos_resp arrives stripped, with empty/':' replies already mapped to None by the poller.
+                if pos_resp is not None:
+                    try:
+                        axis_idx = i - 1
+                        # A reply that did not parse as a number left its POLL_RAW_PULSES slot NaN.
+                        if not AXIS_CONFIGURED[axis_idx] or math.isnan(POLL_RAW_PULSES[axis_idx]):
+                            raise ValueError(pos_resp)
+                        # Degrees were filled in for every polled axis by the poll_pipeline call above.
+                        pos_val_deg = float(POLL_DEGREES[axis_idx])
+                        pos_val_disp = 0 if abs(pos_val_deg) < 1e-6 else round(pos_val_deg, 2)
+                        # Robust: Only treat zero as valid if setpoint was zero or after 3 consecutive zero responses
+                        last_setpoint = get_last_setpoint(window, i, 'abs_pos')
+                        try:
+                            last_setpoint_zero = last_setpoint is not None and abs(float(last_setpoint)) < 1e-6
+                        except Exception:
+                            last_setpoint_zero = False
+                        consecutive_zero = getattr(window, '_consecutive_zero_actuals', [0]*8)
+                        # Suppress a zero reading only if we've previously seen a non-zero position
+                        # (motor was somewhere non-zero and is now falsely reading 0 during decel/stop).
+                        # Before the first real move, 0 is genuine and must be shown.
+                        # After 3 consecutive zeros, accept as genuine (e.g. motor parked at 0° end-stop).
+                        last_known = window._last_valid_pos[i-1] if window._last_valid_pos[i-1] else ''
+                        has_seen_nonzero = last_known not in ('', '0', 'N/A')
+                        if pos_val_disp == 0 and not last_setpoint_zero and has_seen_nonzero and consecutive_zero[i-1] < 3:
+                            valid = False
+                        else:
+                            if not window_closed:
+                                set_actual_position(window, i, deg=pos_val_disp)
+                                # Target highlight only moves with the displayed (0.01 deg) position;
+                                # input edits and setpoint confirms refresh it on their own paths.
+                                if last_known != str(pos_val_disp):
+                                    update_setpoint_highlight(window, i, pos_val_deg, values=values)
+                            window._last_valid_pos[i-1] = str(pos_val_disp)
+                            window._last_pos_update_ts[i-1] = time.time()
+                            window._invalid_resp_counters[i-1] = 0
+                            valid = True
+                    except Exception:
+                        pass
+                # Actual position in pulses display
+                if pos_resp is not None and not window_closed:
+                    set_actual_position(window, i, pulses=pos_resp)
+                # SAFETY: Stop motion if position exceeds soft limits OR absolute 360-degree rotation limit
+                idx = i - 1
+                if pos_val_deg is not None and not SAFETY_LIMIT_STOPS_ENABLED:
+                    limit_exceed_counts[idx] = 0
+                    limit_tripped[idx] = False
+                    jog_limit_hit[idx] = False
+                if pos_val_deg is not None and SAFETY_LIMIT_STOPS_ENABLED:
+                    # Absolute safety: never allow >360 degrees rotation
+                    beyond_absolute_limit = abs(pos_val_deg) > ABSOLUTE_SAFETY_LIMIT_DEG
+                    out_of_range = beyond_absolute_limit or not (in_soft_limits >> idx) & 1
+                    was_tripped = limit_tripped[idx]
+                    # [CHANGE 2026-10-15 23:40:00 -04:00] Steady state (in range, nothing latched) is one compound
+                    # test; trip confirmation and indicator restore only run when a flag can change.
+                    if not (out_of_range or was_tripped or jog_limit_hit[idx]):
+                        limit_exceed_counts[idx] = 0
+                    else:
+                        min_val = float(AXIS_MIN[idx])
+                        max_val = float(AXIS_MAX[idx])
+
+                        if out_of_range:
+                            # The poller's count includes polls it did not deliver or that were coalesced;
+                            # fall back to counting here when it has none (e.g. Axis E cache override).
+                            limit_exceed_counts[idx] = data.get('limit_count') or limit_exceed_counts[idx] + 1
+                            if not window_closed:
+                                ELEMENTS['DEBUG_LOG'].print(f'[LIMIT] Axis {axis_letter} out-of-range sample {limit_exceed_counts[idx]}/{LIMIT_TRIP_CONFIRM_SAMPLES}: pos={pos_val_deg:.3f}° (soft {min_val-LIMIT_SOFT_TOLERANCE_DEG:.1f}..{max_val+LIMIT_SOFT_TOLERANCE_DEG:.1f}, abs±{ABSOLUTE_SAFETY_LIMIT_DEG:.0f})')
+                        else:
+                            limit_exceed_counts[idx] = 0
+
+                        if out_of_range and not was_tripped and limit_exceed_counts[idx] >= LIMIT_TRIP_CONFIRM_SAMPLES:
+                            stop_key = f'S{i}_stop'
+                            stop_cmd = STATIC_CMD.get(stop_key)
+                            controller = get_comm_for_axis(axis_letter)
+                            # [CHANGE 2026-03-24 16:24:00 -04:00] Route safety limit-stop through per-axis comm path so E/H stop on their native controllers.
+                            if stop_cmd and controller:
+                                try:
+                                    stop_cmd_val = stop_cmd
+                                    send_axis_command(axis_letter, stop_cmd_val)
+                                    # Clear motion command tracking
+                                    LAST_MOTION_COMMAND[idx] = None
+                                    if not window_closed:
+                                        if beyond_absolute_limit:
+                                            limit_msg = f'[SAFETY] Axis {axis_letter} exceeded ABSOLUTE 360° rotation limit at {pos_val_deg:.1f}°; EMERGENCY STOP sent: {stop_cmd_val}'
+                                            popup_msg = f'EMERGENCY STOP!\n\nAxis {axis_letter} exceeded absolute safety limit.\nPosition: {pos_val_deg:.1f}°\n\nServos must NEVER rotate more than 360°.'
+                                        else:
+                                            limit_msg = f'[WARN] Axis {axis_letter} exceeded soft limits ({min_val},{max_val}); sent stop command: {stop_cmd_val}'
+                                            popup_msg = f'Axis {axis_letter} exceeded limits ({min_val} to {max_val}). Motion stopped.'
+                                        ELEMENTS['DEBUG_LOG'].print(limit_msg)
+                                        # Visual + popup notification on first limit trip
+                                        set_status_indicator(window, i, 'Stopped (limit)', '#FF4500')
+                                        sg.popup_ok(popup_msg, keep_on_top=True, title='Safety Stop' if beyond_absolute_limit else '')
+                                except Exception:
+                                    if not window_closed:
+                                        ELEMENTS['DEBUG_LOG'].print(f'[ERROR] Failed to send stop for axis {axis_letter}')
+                            elif not controller and not window_closed:
+                                ELEMENTS['DEBUG_LOG'].print(f'[WARN] Axis {axis_letter} exceeded limits but comm not initialized; no stop sent')
+                                sg.popup_ok(f'Axis {axis_letter} exceeded limits ({min_val} to {max_val}) but comm not initialized; stop not sent.', keep_on_top=True, title='')
+                            limit_tripped[idx] = True
+                        elif was_tripped and min_val <= pos_val_deg <= max_val:
+                            # Clear limit indicator when back inside bounds
+                            limit_tripped[idx] = False
+                            limit_exceed_counts[idx] = 0
+                            if not window_closed:
+                                set_status_indicator(window, i, 'Enabled', '#00FF00')
+                        elif jog_limit_hit[idx] and min_val < pos_val_deg < max_val:
+                            # Clear jog limit indicator when back inside absolute bounds
+                            jog_limit_hit[idx] = False
+                            limit_exceed_counts[idx] = 0
+                            if not window_closed:
+                                set_status_indicator(window, i, 'Enabled', '#00FF00')
+                # Robust actuals display: only accept zero if setpoint was zero or after 3 consecutive zero responses
+                debug_msgs = []
+                if not valid:
+                    window._invalid_resp_counters[i-1] += 1
+                    last_setpoint = get_last_setpoint(window, i, 'abs_pos')
                     try:
                         last_setpoint_zero = last_setpoint is not None and abs(float(last_setpoint)) < 1e-6
                     except Exception:
                         last_setpoint_zero = False
                     consecutive_zero = getattr(window, '_consecutive_zero_actuals', [0]*8)
-                    # Suppress a zero reading only if we've previously seen a non-zero position
-                    # (motor was somewhere non-zero and is now falsely reading 0 during decel/stop).
-                    # Before the first real move, 0 is genuine and must be shown.
-                    # After 3 consecutive zeros, accept as genuine (e.g. motor parked at 0° end-stop).
-                    last_known = window._last_valid_pos[i-1] if window._last_valid_pos[i-1] else ''
-                    has_seen_nonzero = last_known not in ('', '0', 'N/A')
-                    if pos_val_disp == 0 and not last_setpoint_zero and has_seen_nonzero and consecutive_zero[i-1] < 3:
-                        valid = False
+                    if pos_val_disp == 0:
+                        consecutive_zero[i-1] = consecutive_zero[i-1] + 1
                     else:
+                        consecutive_zero[i-1] = 0
+                    window._consecutive_zero_actuals = consecutive_zero
+                    debug_msgs.append(f'[DEBUG] Axis {axis_letter} raw={pos_resp} disp={pos_val_disp} setpoint={last_setpoint} zero_ctr={consecutive_zero[i-1]} valid={valid}')
+                    if window._invalid_resp_counters[i-1] >= 5:
                         if not window_closed:
-                            window[f'S{i}_actual_pos'].update(str(pos_val_disp))
-                            update_setpoint_highlight(window, i, pos_val_deg)
-                        window._last_valid_pos[i-1] = str(pos_val_disp)
-                        window._last_pos_update_ts[i-1] = time.time()
-                        window._invalid_resp_counters[i-1] = 0
-                        valid = True
-                except Exception:
-                    pass
-            # Actual position in pulses display
-            if pos_resp is not None and str(pos_resp).strip() not in (':', ''):
-                try:
-                    pos_pulses_disp = str(pos_resp).strip()
-                    if not window_closed:
-                        window[f'S{i}_actual_pos_pulses'].update(pos_pulses_disp)
-                except Exception:
-                    if not window_closed:
-                        window[f'S{i}_actual_pos_pulses'].update('N/A')
-            # SAFETY: Stop motion if position exceeds soft limits OR absolute 360-degree rotation limit
-            if pos_val_deg is not None and not SAFETY_LIMIT_STOPS_ENABLED:
-                window._limit_exceed_counts[i-1] = 0
-                window._limit_tripped[i-1] = False
-                window._jog_limit_hit[i-1] = False
-            if pos_val_deg is not None and SAFETY_LIMIT_STOPS_ENABLED:
-                axis_units = AXIS_UNITS[axis_letter]
-                min_val = axis_units['min']
-                max_val = axis_units['max']
-                # Absolute safety: never allow >360 degrees rotation
-                beyond_absolute_limit = abs(pos_val_deg) > ABSOLUTE_SAFETY_LIMIT_DEG
-                beyond_soft_limit = (pos_val_deg < min_val - LIMIT_SOFT_TOLERANCE_DEG or pos_val_deg > max_val + LIMIT_SOFT_TOLERANCE_DEG)
-                
-                if beyond_soft_limit or beyond_absolute_limit:
-                    window._limit_exceed_counts[i-1] += 1
-                    if not window_closed:
-                        window['DEBUG_LOG'].print(f'[LIMIT] Axis {axis_letter} out-of-range sample {window._limit_exceed_counts[i-1]}/{LIMIT_TRIP_CONFIRM_SAMPLES}: pos={pos_val_deg:.3f}° (soft {min_val-LIMIT_SOFT_TOLERANCE_DEG:.1f}..{max_val+LIMIT_SOFT_TOLERANCE_DEG:.1f}, abs±{ABSOLUTE_SAFETY_LIMIT_DEG:.0f})')
-                else:
-                    window._limit_exceed_counts[i-1] = 0
-
-                if (beyond_soft_limit or beyond_absolute_limit) and not window._limit_tripped[i-1] and window._limit_exceed_counts[i-1] >= LIMIT_TRIP_CONFIRM_SAMPLES:
-                    stop_key = f'S{i}_stop'
-                    stop_cmd = COMMAND_MAP.get(stop_key)
-                    controller = get_comm_for_axis(axis_letter)
-                    # [CHANGE 2026-03-24 16:24:00 -04:00] Route safety limit-stop through per-axis comm path so E/H stop on their native controllers.
-                    if stop_cmd and controller:
-                        try:
-                            stop_cmd_val = stop_cmd if not callable(stop_cmd) else stop_cmd()
-                            send_axis_command(axis_letter, stop_cmd_val)
-                            # Clear motion command tracking
-                            LAST_MOTION_COMMAND[i-1] = None
-                            if not window_closed:
-                                if beyond_absolute_limit:
-                                    limit_msg = f'[SAFETY] Axis {axis_letter} exceeded ABSOLUTE 360° rotation limit at {pos_val_deg:.1f}°; EMERGENCY STOP sent: {stop_cmd_val}'
-                                    popup_msg = f'EMERGENCY STOP!\n\nAxis {axis_letter} exceeded absolute safety limit.\nPosition: {pos_val_deg:.1f}°\n\nServos must NEVER rotate more than 360°.'
-                                else:
-                                    limit_msg = f'[WARN] Axis {axis_letter} exceeded soft limits ({min_val},{max_val}); sent stop command: {stop_cmd_val}'
-                                    popup_msg = f'Axis {axis_letter} exceeded limits ({min_val} to {max_val}). Motion stopped.'
-                                window['DEBUG_LOG'].print(limit_msg)
-                                # Visual + popup notification on first limit trip
-                                window[f'S{i}_status_light'].update('●', text_color='#FF4500')  # Orange-red
-                                window[f'S{i}_status_text'].update('Stopped (limit)', text_color='#FF4500')
-                                sg.popup_ok(popup_msg, keep_on_top=True, title='Safety Stop' if beyond_absolute_limit else '')
-                        except Exception:
-                            if not window_closed:
-                                window['DEBUG_LOG'].print(f'[ERROR] Failed to send stop for axis {axis_letter}')
-                    elif not controller and not window_closed:
-                        window['DEBUG_LOG'].print(f'[WARN] Axis {axis_letter} exceeded limits but comm not initialized; no stop sent')
-                        sg.popup_ok(f'Axis {axis_letter} exceeded limits ({min_val} to {max_val}) but comm not initialized; stop not sent.', keep_on_top=True, title='')
-                    window._limit_tripped[i-1] = True
-                elif window._limit_tripped[i-1] and min_val <= pos_val_deg <= max_val:
-                    # Clear limit indicator when back inside bounds
-                    window._limit_tripped[i-1] = False
-                    window._limit_exceed_counts[i-1] = 0
-                    if not window_closed:
-                        window[f'S{i}_status_light'].update('●', text_color='#00FF00')
-                        window[f'S{i}_status_text'].update('Enabled', text_color='#00FF00')
-                elif window._jog_limit_hit[i-1] and min_val < pos_val_deg < max_val:
-                    # Clear jog limit indicator when back inside absolute bounds
-                    window._jog_limit_hit[i-1] = False
-                    window._limit_exceed_counts[i-1] = 0
-                    if not window_closed:
-                        window[f'S{i}_status_light'].update('●', text_color='#00FF00')
-                        window[f'S{i}_status_text'].update('Enabled', text_color='#00FF00')
-            # Robust actuals display: only accept zero if setpoint was zero or after 3 consecutive zero responses
-            debug_msgs = []
-            if not valid:
-                window._invalid_resp_counters[i-1] += 1
-                last_setpoint = getattr(window, '_last_setpoints', [{}]*8)[i-1].get('abs_pos', None)
-                try:
-                    last_setpoint_zero = last_setpoint is not None and abs(float(last_setpoint)) < 1e-6
-                except Exception:
-                    last_setpoint_zero = False
-                consecutive_zero = getattr(window, '_consecutive_zero_actuals', [0]*8)
-                if pos_val_disp == 0:
-                    consecutive_zero[i-1] = consecutive_zero[i-1] + 1
+                            set_actual_position(window, i, deg='N/A')
+                        log_val = 'N/A'
+                        debug_msgs.append(f'[DEBUG] Axis {axis_letter} display updated to N/A (invalid_ctr={window._invalid_resp_counters[i-1]})')
+                    else:
+                        last_val = window._last_valid_pos[i-1] if window._last_valid_pos[i-1] else ''
+                        if not window_closed:
+                            set_actual_position(window, i, deg=last_val)
+                        log_val = last_val if last_val else 'N/A'
+                        debug_msgs.append(f'[DEBUG] Axis {axis_letter} display kept at last valid ({last_val})')
                 else:
-                    consecutive_zero[i-1] = 0
-                window._consecutive_zero_actuals = consecutive_zero
-                debug_msgs.append(f'[DEBUG] Axis {axis_letter} raw={pos_resp} disp={pos_val_disp} setpoint={last_setpoint} zero_ctr={consecutive_zero[i-1]} valid={valid}')
-                if window._invalid_resp_counters[i-1] >= 5:
-                    if not window_closed:
-                        window[f'S{i}_actual_pos'].update('N/A')
-                    log_val = 'N/A'
-                    debug_msgs.append(f'[DEBUG] Axis {axis_letter} display updated to N/A (invalid_ctr={window._invalid_resp_counters[i-1]})')
+                    if hasattr(window, '_consecutive_zero_actuals'):
+                        window._consecutive_zero_actuals[i-1] = 0
+                    log_val = window._last_valid_pos[i-1]
+                    debug_msgs.append(f'[DEBUG] Axis {axis_letter} valid actual: {log_val}')
+                if not window_closed and LOG_POSITION_POLLS:
+                    POLL_LOG_BUFFER.extend(debug_msgs)
+                    POLL_LOG_BUFFER.append(f'Axis {axis_letter}: MG _RP{axis_letter} -> {log_val}')
+            continue
+        # Reconnect button — re-establishes the TCP/UDP link for this axis's controller
+        if isinstance(event, str) and event.endswith('_reconnect'):
+            try:
+                servo_num = int(event[1:event.index('_')])
+                axis_letter = AXIS_LETTERS[servo_num - 1]
+                target_comm = get_comm_for_axis(axis_letter)
+                if target_comm is not None and hasattr(target_comm, '_reconnect_rsi'):
+                    success = target_comm._reconnect_rsi()
+                    msg = 'Reconnected successfully.' if success else 'Reconnect failed — check service is running.'
+                elif target_comm is not None:
+                    msg = 'Link uses UDP (ClearCore) — no explicit reconnect needed.'
                 else:
-                    last_val = window._last_valid_pos[i-1] if window._last_valid_pos[i-1] else ''
-                    if not window_closed:
-                        window[f'S{i}_actual_pos'].update(last_val)
-                    log_val = last_val if last_val else 'N/A'
-                    debug_msgs.append(f'[DEBUG] Axis {axis_letter} display kept at last valid ({last_val})')
-            else:
-                if hasattr(window, '_consecutive_zero_actuals'):
-                    window._consecutive_zero_actuals[i-1] = 0
-                log_val = window._last_valid_pos[i-1]
-                debug_msgs.append(f'[DEBUG] Axis {axis_letter} valid actual: {log_val}')
-            if not window_closed and LOG_POSITION_POLLS:
-                for msg in debug_msgs:
-                    window['DEBUG_LOG'].print(msg)
-
-            if not window_closed and LOG_POSITION_POLLS:
-                window['DEBUG_LOG'].print(f'Axis {axis_letter}: MG _RP{axis_letter} -> {log_val}')
-        continue
-    # Reconnect button — re-establishes the TCP/UDP link for this axis's controller
-    if isinstance(event, str) and event.endswith('_reconnect'):
-        try:
-            servo_num = int(event[1:event.index('_')])
-            axis_letter = AXIS_LETTERS[servo_num - 1]
-            target_comm = get_comm_for_axis(axis_letter)
-            if target_comm is not None and hasattr(target_comm, '_reconnect_rsi'):
-                success = target_comm._reconnect_rsi()
-                msg = 'Reconnected successfully.' if success else 'Reconnect failed — check service is running.'
-            elif target_comm is not None:
-                msg = 'Link uses UDP (ClearCore) — no explicit reconnect needed.'
-            else:
-                msg = 'No comm object configured for this axis.'
-            window['DEBUG_LOG'].print(f'[RECONNECT] Axis {axis_letter}: {msg}')
-        except Exception as _re:
-            window['DEBUG_LOG'].print(f'[RECONNECT] Error: {_re}')
+                    msg = 'No comm object configured for this axis.'
+                ELEMENTS['DEBUG_LOG'].print(f'[RECONNECT] Axis {axis_letter}: {msg}')
+            except Exception as _re:
+                ELEMENTS['DEBUG_LOG'].print(f'[RECONNECT] Error: {_re}')
 
-    # Zero Position button (handle early so it isn't swallowed by generic S*_action logic)
-    if isinstance(event, str) and event.endswith('_zero_pos'):
-        try:
-            servo_num = int(event[1:event.index('_')])
-            axis_letter = AXIS_LETTERS[servo_num - 1]
-            confirm = sg.popup_yes_no(
-                f'Set current position as ZERO for Axis {axis_letter}?\n\nThis cannot be undone without re-homing.',
-                title='Confirm Zero Position',
-                keep_on_top=True,
-            )
-            if confirm != 'Yes':
-                continue
+        # Zero Position button (handle early so it isn't swallowed by generic S*_action logic)
+        if isinstance(event, str) and event.endswith('_zero_pos'):
+            try:
+                servo_num = int(event[1:event.index('_')])
+                axis_letter = AXIS_LETTERS[servo_num - 1]
+                confirm = sg.popup_yes_no(
+                    f'Set current position as ZERO for Axis {axis_letter}?\n\nThis cannot be undone without re-homing.',
+                    title='Confirm Zero Position',
+                    keep_on_top=True,
+                )
+                if confirm != 'Yes':
+                    continue
 
-            # Use axis-specific command instead of multi-axis format
-            dp_cmd = f"DP{axis_letter}=0"
+                # Use axis-specific command instead of multi-axis format
+                dp_cmd = ZERO_POS_CMD[servo_num - 1]
 
-            # Route to correct comm object
-            response = send_axis_command(axis_letter, dp_cmd)
-            if axis_letter == 'E':
-                # [CHANGE 2026-03-27 11:20:00 -04:00] Servo E zero immediately resets displayed/cached commanded position.
-                zero_ok = not (
-                    response is False or
-                    (isinstance(response, str) and str(response).strip().upper().startswith('UNSUPPORTED'))
-                )
-                if zero_ok:
+                # Route to correct comm object (writer thread; Axis E cache reset happens in apply_jog_reply)
+                queue_axis_command(axis_letter, dp_cmd, ('zero', servo_num))
+            except Exception as e:
+                sg.popup_error(f'Error parsing servo number: {e}', keep_on_top=True)
+            continue
+
+        # Keypad button logic for numeric value entry
+        if event in NUMERIC_KEYPAD_BUTTONS:
+            parts = event.split('_')
+            servo = parts[0]
+            field = '_'.join(parts[1:-1])
+            input_key = f'{servo}_{field}'
+            current_val = values.get(input_key, '')
+            try:
+                current_val = round(float(current_val), 1)
+            except (ValueError, TypeError):
+                current_val = 0.0
+            # Convert servo number to axis letter (1->A, 2->B, ...)
+            axis_num = int(servo[1:]) if servo.startswith('S') else None
+            axis_letter = AXIS_LETTERS[axis_num - 1] if axis_num and 1 <= axis_num <= 8 else None
+            # Use axis-specific limits (speed/accel/decel/positions) with defaults
+            if axis_letter and (axis_num, field) in LIMITS:
+                min_val, max_val = LIMITS[(axis_num, field)][:2]
+            else:
+                min_val, max_val = NUMERIC_LIMITS.get(field, (0, 54000))
+            unit_label = 'DPS' if field == 'speed' else ('DPS^2' if field in ['accel', 'decel'] else ('Deg' if field in ['abs_pos', 'rel_pos', 'jog_amount'] else ''))
+            # Make popup title more descriptive with setpoint type
+            field_titles = {
+                'speed': 'Speed',
+                'accel': 'Acceleration',
+                'decel': 'Deceleration',
+                'abs_pos': 'Absolute Position',
+                'rel_pos': 'Relative Position',
+                'jog_amount': 'Jog Amount',
+            }
+            field_title = field_titles.get(field, field.capitalize())
+            popup_title = f'Enter {field_title} for Servo {servo} ({unit_label})'
+            keypad = NumericKeypad(
+                title=popup_title,
+                current_value=current_val,
+                axis_letter=axis_letter,
+                font=GLOBAL_FONT,
+                unit_label=unit_label,
+                min_val=min_val,
+                max_val=max_val
+            )
+            result = keypad.show()
+            if result is not None:
+                # Enforce min/max for PC keyboard edits as well
+                if result < min_val or result > max_val:
+                    sg.popup_error(f"Value for {field} must be between {min_val} and {max_val}", keep_on_top=True)
+                else:
+                    window[input_key].update(format_display_value(result))
+                    # Mark pending (not confirmed) until OK is pressed
                     try:
-                        if comm_e is not None:
-                            setattr(comm_e, 'clearcore_last_position', 0)
-                            setattr(comm_e, 'clearcore_commanded_position', 0)
-                        sync_axis_e_actual_from_commanded(window, servo_num)
+                        serv_num = int(servo[1:])
+                        if field == 'abs_pos':
+                            update_setpoint_highlight(window, serv_num)
+                        else:
+                            set_pending_highlight(window, serv_num, field)
+                        if field in ('speed', 'accel', 'decel'):
+                            update_mid_speed_display(window, serv_num)
                     except Exception:
                         pass
-        except Exception as e:
-            sg.popup_error(f'Error parsing servo number: {e}', keep_on_top=True)
-        continue
-
-    # Keypad button logic for numeric value entry
-    if event in NUMERIC_KEYPAD_BUTTONS:
-        parts = event.split('_')
-        servo = parts[0]
-        field = '_'.join(parts[1:-1])
-        input_key = f'{servo}_{field}'
-        current_val = values.get(input_key, '')
-        try:
-            current_val = round(float(current_val), 1)
-        except (ValueError, TypeError):
-            current_val = 0.0
-        # Convert servo number to axis letter (1->A, 2->B, ...)
-        axis_num = int(servo[1:]) if servo.startswith('S') else None
-        axis_letter = chr(64 + axis_num) if axis_num and 1 <= axis_num <= 8 else None
-        # Use axis-specific limits (speed/accel/decel/positions) with defaults
-        if axis_letter:
-            min_val, max_val = get_limits(axis_letter, field)
-        else:
-            min_val, max_val = NUMERIC_LIMITS.get(field, (0, 54000))
-        unit_label = 'DPS' if field == 'speed' else ('DPS^2' if field in ['accel', 'decel'] else ('Deg' if field in ['abs_pos', 'rel_pos', 'jog_amount'] else ''))
-        # Make popup title more descriptive with setpoint type
-        field_titles = {
-            'speed': 'Speed',
-            'accel': 'Acceleration',
-            'decel': 'Deceleration',
-            'abs_pos': 'Absolute Position',
-            'rel_pos': 'Relative Position',
-            'jog_amount': 'Jog Amount',
-        }
-        field_title = field_titles.get(field, field.capitalize())
-        popup_title = f'Enter {field_title} for Servo {servo} ({unit_label})'
-        keypad = NumericKeypad(
-            title=popup_title,
-            current_value=current_val,
-            axis_letter=axis_letter,
-            font=GLOBAL_FONT,
-            unit_label=unit_label,
-            min_val=min_val,
-            max_val=max_val
-        )
-        result = keypad.show()
-        if result is not None:
-            # Enforce min/max for PC keyboard edits as well
-            if result < min_val or result > max_val:
-                sg.popup_error(f"Value for {field} must be between {min_val} and {max_val}", keep_on_top=True)
+            continue
+
+        # Restrict keyboard entries for numeric fields to digits, leading '-', and a single decimal (one digit precision)
+        if event in NUMERIC_INPUT_KEYS:
+            val = values.get(event, '')
+            # Keep only digits, '-', and '.'
+            filtered = _NUMERIC_INPUT_FILTER_RE.sub('', val)
+            # Normalize sign to leading position only
+            sign = '-' if filtered.startswith('-') else ''
+            filtered = filtered[1:] if filtered.startswith('-') else filtered
+            filtered = filtered.replace('-', '')
+            # Enforce a single decimal point and only one digit after it
+            if '.' in filtered:
+                whole, frac = filtered.split('.', 1)
+                frac = frac[:1]
+                filtered = f"{sign}{whole}.{frac}"
             else:
-                window[input_key].update(format_display_value(result))
-                # Mark pending (not confirmed) until OK is pressed
+                filtered = sign + filtered
+            # If the filtered value differs from the input, update the field
+            if filtered != val:
+                window[event].update(filtered)
+            # Clamp to axis min/max for PC keyboard entry (same limits as keypad)
+            if filtered not in ('', '-', '.', '-.'):
                 try:
-                    serv_num = int(servo[1:])
-                    if field == 'abs_pos':
-                        update_setpoint_highlight(window, serv_num)
+                    numeric_val = float(filtered)
+                    parts = event.split('_', 1)
+                    servo_part = parts[0] if len(parts) > 0 else ''
+                    field_part = parts[1] if len(parts) > 1 else ''
+                    servo_num = None
+                    if servo_part.startswith('S'):
+                        servo_num = int(servo_part[1:])
+                    elif servo_part == 'ALL' and field_part:
+                        nested = field_part.split('_', 1)
+                        nested_servo = nested[0] if nested else ''
+                        if nested_servo.startswith('S'):
+                            try:
+                                servo_num = int(nested_servo[1:])
+                            except Exception:
+                                servo_num = None
+                        field_part = 'abs_pos'
+                    axis_letter = AXIS_LETTERS[servo_num - 1] if servo_num and 1 <= servo_num <= 8 else None
+                    if axis_letter and (servo_num, field_part) in LIMITS:
+                        min_val, max_val = LIMITS[(servo_num, field_part)][:2]
                     else:
-                        set_pending_highlight(window, serv_num, field)
-                    if field in ('speed', 'accel', 'decel'):
-                        update_mid_speed_display(window, serv_num)
+                        min_val, max_val = NUMERIC_LIMITS.get(field_part, (0, 54000))
+                    clamped = round(max(min_val, min(max_val, numeric_val)), 1)
+                    if clamped != numeric_val:
+                        window[event].update(format_display_value(clamped))
+                    if servo_num and field_part:
+                        # [CHANGE 2026-10-15 21:05:00 -04:00] Debounced: one recompute per typing burst.
+                        schedule_input_highlight(window, servo_num, field_part)
+                        if field_part in ('speed', 'accel', 'decel'):
+                            update_mid_speed_display(window, servo_num)
                 except Exception:
                     pass
-        continue
-
-    # Restrict keyboard entries for numeric fields to digits, leading '-', and a single decimal (one digit precision)
-    if event in NUMERIC_INPUT_KEYS:
-        val = values.get(event, '')
-        import re
-        # Keep only digits, '-', and '.'
-        filtered = re.sub(r'[^0-9\-.]', '', val)
-        # Normalize sign to leading position only
-        sign = '-' if filtered.startswith('-') else ''
-        filtered = filtered[1:] if filtered.startswith('-') else filtered
-        filtered = filtered.replace('-', '')
-        # Enforce a single decimal point and only one digit after it
-        if '.' in filtered:
-            whole, frac = filtered.split('.', 1)
-            frac = frac[:1]
-            filtered = f"{sign}{whole}.{frac}"
-        else:
-            filtered = sign + filtered
-        # If the filtered value differs from the input, update the field
-        if filtered != val:
-            window[event].update(filtered)
-        # Clamp to axis min/max for PC keyboard entry (same limits as keypad)
-        if filtered not in ('', '-', '.', '-.'):
-            try:
-                numeric_val = float(filtered)
-                parts = event.split('_', 1)
-                servo_part = parts[0] if len(parts) > 0 else ''
-                field_part = parts[1] if len(parts) > 1 else ''
-                servo_num = None
-                if servo_part.startswith('S'):
-                    servo_num = int(servo_part[1:])
-                elif servo_part == 'ALL' and field_part:
-                    nested = field_part.split('_', 1)
-                    nested_servo = nested[0] if nested else ''
-                    if nested_servo.startswith('S'):
-                        try:
-                            servo_num = int(nested_servo[1:])
-                        except Exception:
-                            servo_num = None
-                    field_part = 'abs_pos'
-                axis_letter = AXIS_LETTERS[servo_num - 1] if servo_num and 1 <= servo_num <= 8 else None
-                if axis_letter:
-                    min_val, max_val = get_limits(axis_letter, field_part)
-                else:
-                    min_val, max_val = NUMERIC_LIMITS.get(field_part, (0, 54000))
-                clamped = round(max(min_val, min(max_val, numeric_val)), 1)
-                if clamped != numeric_val:
-                    window[event].update(format_display_value(clamped))
-                if servo_num and field_part:
-                    if field_part == 'abs_pos':
-                        update_setpoint_highlight(window, servo_num)
-                    else:
-                        set_pending_highlight(window, servo_num, field_part)
-                    if field_part in ('speed', 'accel', 'decel'):
-                        update_mid_speed_display(window, servo_num)
-            except Exception:
-                pass
-    # Only call handle_servo_event for setpoint OK buttons
-    if isinstance(event, str) and event.startswith('S') and '_' in event:
-        if event.endswith('_ok'):
-            print(f'[DEBUG] Main loop routing event to handle_servo_event: {event}')
-            handle_servo_event(event, values)
-            # Add polling pause after setpoint changes
-            import time
-            time.sleep(1)  # Pause polling for 1 second after setpoint change
-            continue
-        # Otherwise, handle direct motor control buttons (Enable, Disable, Start, Stop, Jog) by reusing handle_servo_event
-        # to ensure a single code path with consistent scaling logic.
-        parts = event.split('_')
-        if len(parts) == 3 and parts[1] == 'jog' and parts[2] in ('cw', 'ccw'):
-            # [CHANGE 2026-03-24 13:36:00 -04:00] Safety: jog buttons are one-shot pulses only (no release event dependency).
-            servo_num = parts[0][1:]
-            if not str(servo_num).isdigit():
+        # Only call handle_servo_event for setpoint OK buttons
+        if isinstance(event, str) and event.startswith('S') and '_' in event:
+            if event.endswith('_ok'):
+                print(f'[DEBUG] Main loop routing event to handle_servo_event: {event}')
+                handle_servo_event(event, values)
+                # Add polling pause after setpoint changes
+                time.sleep(1)  # Pause polling for 1 second after setpoint change
                 continue
-            servo_num_int = int(servo_num)
-            direction = parts[2]
-            axis_letter = AXIS_LETTERS[servo_num_int - 1]
-            window['DEBUG_LOG'].print(f'Button clicked: S{servo_num}_jog_{direction} (Axis {axis_letter}) [one-shot]')
-            handle_jog_press(window, servo_num_int, direction, True, values)
-            continue
-        if len(parts) == 2:
-            servo_num = parts[0][1:]
-            if not str(servo_num).isdigit():
+            # Otherwise, handle direct motor control buttons (Enable, Disable, Start, Stop, Jog) by reusing handle_servo_event
+            # to ensure a single code path with consistent scaling logic.
+            parts = event.split('_')
+            if len(parts) == 3 and parts[1] == 'jog' and parts[2] in ('cw', 'ccw'):
+                # [CHANGE 2026-03-24 13:36:00 -04:00] Safety: jog buttons are one-shot pulses only (no release event dependency).
+                servo_num = parts[0][1:]
+                if not str(servo_num).isdigit():
+                    continue
+                servo_num_int = int(servo_num)
+                direction = parts[2]
+                axis_letter = AXIS_LETTERS[servo_num_int - 1]
+                ELEMENTS['DEBUG_LOG'].print(f'Button clicked: S{servo_num}_jog_{direction} (Axis {axis_letter}) [one-shot]')
+                handle_jog_press(window, servo_num_int, direction, True, values)
                 continue
-            action = parts[1]
-            axis_letter = AXIS_LETTERS[int(servo_num)-1]
-            prev_log = window['DEBUG_LOG'].get()
-            if not prev_log.endswith('\r\n') and not prev_log.endswith('\n'):
-                prev_log += '\r\n'
-            window['DEBUG_LOG'].print(f'Button clicked: S{servo_num}_{action} (Axis {axis_letter})')
-            # Reuse the unified handler (handles jog scaling to pulses)
-            handle_servo_event(event, values)
-        continue
+            if len(parts) == 2:
+                servo_num = parts[0][1:]
+                if not str(servo_num).isdigit():
+                    continue
+                action = parts[1]
+                axis_letter = AXIS_LETTERS[int(servo_num)-1]
+                ELEMENTS['DEBUG_LOG'].print(f'Button clicked: S{servo_num}_{action} (Axis {axis_letter})')
+                # Reuse the unified handler (handles jog scaling to pulses)
+                handle_servo_event(event, values)
+            continue
+
+
+if __name__ == "__main__":
+    run_event_loop(window, comm)
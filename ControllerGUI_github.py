@@ -16,7 +16,7 @@ KEY FEATURES:
     - Tabbed interface for 8 servos (A-H)
     - Modular numeric keypad popup for value entry (see numeric_keypad.py)
     - Min/max validation for all numeric fields
-    - Dynamic command mapping for Galil and ClearCore controllers
+    - Command templates for Galil and ClearCore controllers, selected once at startup
     - Periodic status polling and indicator lights for each servo
     - Debug log window for sent/received commands and errors
     - Zero Position button for each axis
@@ -29,34 +29,30 @@ MAIN FUNCTIONS:
     build_servo_tab(servo_num):
         Builds the tab layout for a single servo, including status indicator, value fields, and control buttons.
 
-    poll_and_update_indicator(axis_index):
-        Polls the controller for the enable/disable status of the given axis and updates the indicator and status text.
+    update_status_indicator(axis_index, enabled):
+        Updates the indicator and status text for one axis from a -AXIS-STATUS- event.
 
     handle_servo_event(event, values):
         Handles all servo-related button events (enable, disable, jog, set values).
 
-    poll_active_servo_indicator(window, comm, values=None):
-        Polls the currently active servo tab and updates its indicator.
-
     show_numeric_keypad(...):
         Numeric keypad popup for value entry (now in numeric_keypad.py).
 
 ================================================================================
 """
 
-# ============================================================================
-# Imports and Configuration
-# ============================================================================
-
 # ============================================================================
 # Imports and Configuration
 # ============================================================================
 import FreeSimpleGUI as sg
-import threading  # For future use if needed
 import platform                            # Cross-platform OS detection and adaptation
+import collections
 import configparser
+import functools
 import os
-from communications import ControllerComm
+import re
+import threading
+import time
 from numeric_keypad import NumericKeypad
 
 # ============================================================================
@@ -83,8 +79,10 @@ AXIS_UNITS = {
 # ============================================================================
 
 # Cross-platform compatibility flags
-IS_WINDOWS = platform.system() == "Windows"      # Windows development environment
-IS_RASPBERRY_PI = platform.system() == "Linux" and platform.machine().startswith('arm')  # Pi deployment
+# [CHANGE 2026-10-15 13:55:00 -04:00] Query platform.system() once; downstream code uses SYSTEM.
+SYSTEM = platform.system()
+IS_WINDOWS = SYSTEM == "Windows"      # Windows development environment
+IS_RASPBERRY_PI = SYSTEM == "Linux" and platform.machine().startswith('arm')  # Pi deployment
 
 
 GLOBAL_FONT = ('Courier New', 10)
@@ -98,97 +96,189 @@ NUMERIC_LIMITS = {
     'abs_pos': (0, 54000),
     'rel_pos': (-150000, 150000)
 }
-# Automatically generate command mappings for all 8 servos
 
+# [CHANGE 2026-10-15 12:50:00 -04:00] Regex-gated numeric parsing: no exception on bad keypad/field input.
+_NUM_RE = re.compile(r'^-?(?:\d+(?:\.\d*)?|\.\d+)$')
+# [CHANGE 2026-10-15 18:15:00 -04:00] Total budget for one position reply (was 3 x 0.3 s attempts).
+POSITION_REPLY_TIMEOUT = 0.5
+
+def parse_numeric(text):
+    """Return float(text) for a signed decimal string, else None."""
+    text = str(text).strip() if text is not None else ''
+    return float(text) if _NUM_RE.match(text) else None
+
+def validate_numeric(text, lo, hi):
+    """True if text is a signed decimal within [lo, hi]."""
+    value = parse_numeric(text)
+    return value is not None and lo <= value <= hi
 # -----------------------------
-# Command Mapping Dictionaries
+# Command Templates
 # -----------------------------
-# GALIL_COMMAND_MAP: Maps GUI actions to Galil controller commands (A-H axes)
-# CLEARCORE_COMMAND_MAP: Maps GUI actions to ClearCore controller commands (1-8 axes)
-GALIL_COMMAND_MAP = {}
-AXIS_LETTERS = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
-for i in range(1, 9):
-    axis_letter = AXIS_LETTERS[i-1]
-    GALIL_COMMAND_MAP[f'S{i}_enable'] = f'SH{axis_letter}'
-    GALIL_COMMAND_MAP[f'S{i}_disable'] = f'MO{axis_letter}'
-    GALIL_COMMAND_MAP[f'S{i}_start'] = f'BG{axis_letter}'
-    GALIL_COMMAND_MAP[f'S{i}_stop'] = f'ST{axis_letter}'
-    GALIL_COMMAND_MAP[f'S{i}_jog'] = (lambda speed, axis=axis_letter: f'JG{axis}={speed};BG{axis}')
-    GALIL_COMMAND_MAP[f'S{i}_speed'] = (lambda value, axis=axis_letter: f'SP{axis}={value}')
-    GALIL_COMMAND_MAP[f'S{i}_accel'] = (lambda value, axis=axis_letter: f'AC{axis}={value}')
-    GALIL_COMMAND_MAP[f'S{i}_decel'] = (lambda value, axis=axis_letter: f'DC{axis}={value}')
-    GALIL_COMMAND_MAP[f'S{i}_abs_pos'] = (lambda value, axis=axis_letter: f'PA{axis}={value}')
-    GALIL_COMMAND_MAP[f'S{i}_rel_pos'] = (lambda value, axis=axis_letter: f'PR{axis}={value}')
-
-CLEARCORE_COMMAND_MAP = {}
-for i in range(1, 9):
-    CLEARCORE_COMMAND_MAP[f'S{i}_enable'] = f'ENABLE_SERVO_{i}'
-    CLEARCORE_COMMAND_MAP[f'S{i}_disable'] = f'DISABLE_SERVO_{i}'
-    CLEARCORE_COMMAND_MAP[f'S{i}_start'] = f'START_MOTION_{i}'
-    CLEARCORE_COMMAND_MAP[f'S{i}_stop'] = f'STOP_MOTION_{i}'
-    CLEARCORE_COMMAND_MAP[f'S{i}_jog'] = (lambda speed, axis=i: f'JOG_SERVO_{axis}_{speed}')
-    CLEARCORE_COMMAND_MAP[f'S{i}_speed'] = (lambda value, axis=i: f'SET_SPEED_{axis}_{value}')
-    CLEARCORE_COMMAND_MAP[f'S{i}_accel'] = (lambda value, axis=i: f'SET_ACCEL_{axis}_{value}')
-    CLEARCORE_COMMAND_MAP[f'S{i}_decel'] = (lambda value, axis=i: f'SET_DECEL_{axis}_{value}')
-    CLEARCORE_COMMAND_MAP[f'S{i}_abs_pos'] = (lambda value, axis=i: f'SET_ABS_POS_{axis}_{value}')
-    CLEARCORE_COMMAND_MAP[f'S{i}_rel_pos'] = (lambda value, axis=i: f'SET_REL_POS_{axis}_{value}')
+# [CHANGE 2026-10-15 12:30:00 -04:00] One template per action instead of per-servo lambda maps.
+# [CHANGE 2026-10-15 17:05:00 -04:00] Positional fields so dispatch passes args without building a kwargs dict:
+# '{0}' = axis letter (A-H), '{1}' = servo number (1-8), '{2}' = pulses/speed.
+# GALIL_COMMAND_TEMPLATES: GUI actions -> Galil controller commands
+# CLEARCORE_COMMAND_TEMPLATES: GUI actions -> ClearCore controller commands
+# [CHANGE 2026-10-15 16:05:00 -04:00] Constant axis tables: index -> letter, letter -> index.
+AXIS_LETTERS = ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H')
+AXIS_IDX = {axis: idx for idx, axis in enumerate(AXIS_LETTERS)}
+AXES_STR = ''.join(AXIS_LETTERS)
+GALIL_COMMAND_TEMPLATES = {
+    'enable': 'SH{0}',
+    'disable': 'MO{0}',
+    'start': 'BG{0}',
+    'stop': 'ST{0}',
+    'jog': 'JG{0}={2};BG{0}',
+    'speed': 'SP{0}={2}',
+    'accel': 'AC{0}={2}',
+    'decel': 'DC{0}={2}',
+    'abs_pos': 'PA{0}={2}',
+    'rel_pos': 'PR{0}={2}',
+}
+CLEARCORE_COMMAND_TEMPLATES = {
+    'enable': 'ENABLE_SERVO_{1}',
+    'disable': 'DISABLE_SERVO_{1}',
+    'start': 'START_MOTION_{1}',
+    'stop': 'STOP_MOTION_{1}',
+    'jog': 'JOG_SERVO_{1}_{2}',
+    'speed': 'SET_SPEED_{1}_{2}',
+    'accel': 'SET_ACCEL_{1}_{2}',
+    'decel': 'SET_DECEL_{1}_{2}',
+    'abs_pos': 'SET_ABS_POS_{1}_{2}',
+    'rel_pos': 'SET_REL_POS_{1}_{2}',
+}
 
 # ===================== CONTROLLER TYPE SELECTION FROM INI =====================
 ###############################################################################
-def get_controller_type_from_ini(ini_path='controller_config.ini'):
+# [CHANGE 2026-10-15 13:40:00 -04:00] INI discovery over an explicit root list with one os.scandir pass each.
+INI_FILENAME = 'controller_config.ini'
+INI_SEARCH_ROOTS = (os.getcwd(), os.path.dirname(os.path.abspath(__file__)))
+
+@functools.lru_cache(maxsize=1)
+def find_ini_path(filename=INI_FILENAME, roots=INI_SEARCH_ROOTS):
     """
-    Reads the controller type from the INI file.
-    Returns: 'CommMode1', 'CommMode2', 'CommMode3', or None
+    Return the path of the first `filename` found in `roots`, else `filename` unchanged.
+    os.scandir yields DirEntry objects with cached type info, so no extra stat per entry.
+    """
+    target = filename.lower()
+    for root in roots:
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.name.lower() == target and entry.is_file():
+                        return entry.path
+        except OSError:
+            continue
+    return filename
+
+# [CHANGE 2026-10-15 16:20:00 -04:00] One parse of the INI shared by the type lookup and ControllerComm init.
+# (path, st_mtime_ns, st_size) -> ConfigParser; edits to the file invalidate the entry.
+_INI_CACHE = {}
+
+def get_controller_config(ini_path=None):
     """
-    config = configparser.ConfigParser()
-    if not os.path.exists(ini_path):
+    Return the parsed ConfigParser for the INI file, reusing the cached parse while
+    the file is unchanged. Returns None if the file does not exist.
+    """
+    if ini_path is None:
+        ini_path = find_ini_path()
+    try:
+        st = os.stat(ini_path)
+    except OSError:
         return None
-    config.read(ini_path)
+    key = (ini_path, st.st_mtime_ns, st.st_size)
+    config = _INI_CACHE.get(key)
+    if config is None:
+        config = configparser.ConfigParser()
+        config.read(ini_path)
+        _INI_CACHE.clear()
+        _INI_CACHE[key] = config
+        _SECTION_CACHE.clear()
+    return config
+
+# [CHANGE 2026-10-15 18:45:00 -04:00] Typed section loader: values are coerced once per parse,
+# so callers never re-run int()/float() on INI strings. Keys not listed stay str.
+_TYPED_KEYS = {
+    'CommMode2': {'baudrate': int, 'timeout': float},
+    'CommMode3': {'port1': int, 'local_port': int},
+}
+_SECTION_CACHE = {}
+
+def get_config_section(section, ini_path=None):
+    """
+    Return a dict of one INI section with known numeric keys already converted.
+    Returns an empty dict if the file or section is missing.
+    """
+    config = get_controller_config(ini_path)
+    if config is None or not config.has_section(section):
+        return {}
+    cache_key = (ini_path, section)
+    values = _SECTION_CACHE.get(cache_key)
+    if values is None:
+        casters = _TYPED_KEYS.get(section, {})
+        values = {k: casters.get(k, str)(v) for k, v in config.items(section)}
+        _SECTION_CACHE[cache_key] = values
+    return dict(values)
+
+# [CHANGE 2026-10-15 20:00:00 -04:00] Memoized per (path, mtime, size): repeat lookups are a stat plus
+# a dict hit, and an edited INI still yields a fresh answer.
+@functools.lru_cache(maxsize=4)
+def _controller_type_for(ini_path, mtime_ns, size):
+    config = get_controller_config(ini_path)
     try:
-        return config['Controller']['type'].strip()
+        return config['Controller']['type'].split(';')[0].strip()
     except Exception:
         return None
 
-# Select command map based on ini file
+def get_controller_type_from_ini(ini_path=None):
+    """
+    Reads the controller type from the INI file.
+    Returns: 'CommMode1', 'CommMode2', 'CommMode3', or None
+    """
+    if ini_path is None:
+        ini_path = find_ini_path()
+    try:
+        st = os.stat(ini_path)
+    except OSError:
+        return None
+    return _controller_type_for(ini_path, st.st_mtime_ns, st.st_size)
+
 # -----------------------------
-# Select command map based on controller type from INI file
+# Select command templates based on controller type from INI file
 # -----------------------------
+# Bound str.format methods, specialized once here: CMDS['speed']('A', 1, 100)
 controller_type = get_controller_type_from_ini()
-if controller_type in ('CommMode1', 'CommMode2'):
-    COMMAND_MAP = GALIL_COMMAND_MAP
-elif controller_type == 'CommMode3':
-    COMMAND_MAP = CLEARCORE_COMMAND_MAP
+if controller_type == 'CommMode3':
+    CMDS = {action: template.format for action, template in CLEARCORE_COMMAND_TEMPLATES.items()}
 else:
-    COMMAND_MAP = GALIL_COMMAND_MAP  # Default fallback
+    CMDS = {action: template.format for action, template in GALIL_COMMAND_TEMPLATES.items()}  # CommMode1/2 and default
 
 # Parse INI and initialize ControllerComm with correct config
 ###############################################################################
 # -----------------------------
 # Initialize ControllerComm with correct config from INI file
 # -----------------------------
+# [CHANGE 2026-10-15 12:10:00 -04:00] Deferred until the window is shown (see '-INIT-' in the main loop)
+# so the layout appears before sockets/serial ports are opened.
 comm = None
-try:
-    config = configparser.ConfigParser()
-    config.read('controller_config.ini')
+
+def init_controller_comm():
+    """
+    Import communications and open the controller link described by the INI file.
+    make_comm picks the mode-specific ControllerComm subclass once, here.
+    Returns: ControllerComm instance, or None on failure.
+    """
+    from communications import make_comm
+    comm = None
     try:
         if controller_type == 'CommMode1':
-            galil_config = dict(config.items('CommMode1')) if config.has_section('CommMode1') else {}
-            comm = ControllerComm(mode='CommMode1', galil_config=galil_config)
+            galil_config = get_config_section('CommMode1')
+            # TCP connect runs in the background; first command waits for it
+            comm = make_comm('CommMode1', galil_config=galil_config, connect_async=True)
         elif controller_type == 'CommMode2':
-            serial_config = dict(config.items('CommMode2')) if config.has_section('CommMode2') else {}
-            # Convert numeric values
-            if 'baudrate' in serial_config:
-                serial_config['baudrate'] = int(serial_config['baudrate'])
-            if 'timeout' in serial_config:
-                serial_config['timeout'] = float(serial_config['timeout'])
-            comm = ControllerComm(mode='CommMode2', serial_config=serial_config)
+            comm = make_comm('CommMode2', serial_config=get_config_section('CommMode2'))
         elif controller_type == 'CommMode3':
-            udp_config = dict(config.items('CommMode3')) if config.has_section('CommMode3') else {}
-            if 'port1' in udp_config:
-                udp_config['port1'] = int(udp_config['port1'])
-            if 'local_port' in udp_config:
-                udp_config['local_port'] = int(udp_config['local_port'])
-            comm = ControllerComm(mode='CommMode3', udp_config=udp_config)
+            comm = make_comm('CommMode3', udp_config=get_config_section('CommMode3'))
         else:
             comm = None
             sg.popup_error('Unknown controller type in INI file.', keep_on_top=True)
@@ -199,9 +289,30 @@ try:
         error_details = f'{comm_error}\n' + traceback.format_exc()
         sg.popup_error(f'Failed to initialize controller communications:\n{comm_error}', keep_on_top=True)
         print(f'[ERROR] Failed to initialize controller communications: {error_details}')
-except Exception as e:
-    comm = None
-    sg.popup_error(f'Failed to initialize controller communications: {e}', keep_on_top=True)
+    return comm
+
+# [CHANGE 2026-10-15 10:30:00 -04:00] Servo tab rows are generated from one template.
+# (label, field, unit) descriptors for the numeric entry rows shared by every servo tab.
+_TAB_TEMPLATE = (
+    ('Speed:', 'speed', 'DPS '),
+    ('Acceleration:', 'accel', 'DPS²'),
+    ('Deceleration:', 'decel', 'DPS²'),
+    ('Absolute Position (DEG):', 'abs_pos', 'DEG '),
+    ('Relative Position (DEG):', 'rel_pos', 'DEG '),
+)
+
+# [CHANGE 2026-10-15 18:35:00 -04:00] Shared element sizes/colors, built once instead of per widget.
+_INPUT_SIZE = (10, 1)
+_LABEL_SIZE = (18, 1)
+_KP_SIZE = (2, 1)
+_OK_SIZE = (4, 1)
+_OK_COLOR = ('white', 'green')
+_BTN_SIZE = (12, 2)
+_CLEAR_BTN_SIZE = (14, 2)
+_STATUS_LIGHT_FONT = ('Courier New', 16)
+
+# Per-servo element references: AXIS_ELEMENTS[servo_num][role] -> Element
+AXIS_ELEMENTS = {}
 
 def build_servo_tab(servo_num):
 ###############################################################################
@@ -213,46 +324,36 @@ def build_servo_tab(servo_num):
     Returns:
         List: PySimpleGUI layout for the tab
     """
+    elements = {
+        'status_light': sg.Text('●', key=f'S{servo_num}_status_light', font=_STATUS_LIGHT_FONT, text_color='gray'),
+        'status_text': sg.Text('Disabled', key=f'S{servo_num}_status_text', font=GLOBAL_FONT, text_color='gray'),
+        'actual_pos': sg.Text('0', key=f'S{servo_num}_actual_pos', size=_INPUT_SIZE, font=GLOBAL_FONT),
+    }
+    field_rows = []
+    for label, field, unit in _TAB_TEMPLATE:
+        elements[field] = sg.Input(key=f'S{servo_num}_{field}', size=_INPUT_SIZE, font=GLOBAL_FONT, enable_events=True)
+        field_rows.append([
+            sg.Text(label, size=_LABEL_SIZE, font=GLOBAL_FONT),
+            elements[field],
+            sg.Text(unit, font=GLOBAL_FONT),
+            sg.Button('⌨', key=f'S{servo_num}_{field}_keypad', size=_KP_SIZE, font=GLOBAL_FONT),
+            sg.Button('OK', key=f'S{servo_num}_{field}_ok', size=_OK_SIZE, font=GLOBAL_FONT, button_color=_OK_COLOR),
+        ])
+    AXIS_ELEMENTS[servo_num] = elements
     layout = [
-        [sg.Text(f'Servo {servo_num}', font=POSITION_LABEL_FONT),
-         sg.Text('●', key=f'S{servo_num}_status_light', font=('Courier New', 16), text_color='gray'),
-         sg.Text('Disabled', key=f'S{servo_num}_status_text', font=GLOBAL_FONT, text_color='gray')],
-        [sg.Button('Clear Faults', key=f'S{servo_num}_clear_faults', size=(14,2), font=GLOBAL_FONT)],
-        [sg.Text('Speed:', size=(18,1), font=GLOBAL_FONT),
-         sg.Input(key=f'S{servo_num}_speed', size=(10,1), font=GLOBAL_FONT, enable_events=True),
-            sg.Text('DPS ', font=GLOBAL_FONT),
-         sg.Button('⌨', key=f'S{servo_num}_speed_keypad', size=(2,1), font=GLOBAL_FONT),
-         sg.Button('OK', key=f'S{servo_num}_speed_ok', size=(4,1), font=GLOBAL_FONT, button_color=('white', 'green'))],
-        [sg.Text('Acceleration:', size=(18,1), font=GLOBAL_FONT),
-         sg.Input(key=f'S{servo_num}_accel', size=(10,1), font=GLOBAL_FONT, enable_events=True),
-            sg.Text('DPS²', font=GLOBAL_FONT),
-         sg.Button('⌨', key=f'S{servo_num}_accel_keypad', size=(2,1), font=GLOBAL_FONT),
-         sg.Button('OK', key=f'S{servo_num}_accel_ok', size=(4,1), font=GLOBAL_FONT, button_color=('white', 'green'))],
-        [sg.Text('Deceleration:', size=(18,1), font=GLOBAL_FONT),
-         sg.Input(key=f'S{servo_num}_decel', size=(10,1), font=GLOBAL_FONT, enable_events=True),
-            sg.Text('DPS²', font=GLOBAL_FONT),
-         sg.Button('⌨', key=f'S{servo_num}_decel_keypad', size=(2,1), font=GLOBAL_FONT),
-         sg.Button('OK', key=f'S{servo_num}_decel_ok', size=(4,1), font=GLOBAL_FONT, button_color=('white', 'green'))],
-        [sg.Text('Absolute Position (DEG):', size=(18,1), font=GLOBAL_FONT),
-         sg.Input(key=f'S{servo_num}_abs_pos', size=(10,1), font=GLOBAL_FONT, enable_events=True),
-            sg.Text('DEG ', font=GLOBAL_FONT),
-         sg.Button('⌨', key=f'S{servo_num}_abs_pos_keypad', size=(2,1), font=GLOBAL_FONT),
-         sg.Button('OK', key=f'S{servo_num}_abs_pos_ok', size=(4,1), font=GLOBAL_FONT, button_color=('white', 'green'))],
-        [sg.Text('Relative Position (DEG):', size=(18,1), font=GLOBAL_FONT),
-         sg.Input(key=f'S{servo_num}_rel_pos', size=(10,1), font=GLOBAL_FONT, enable_events=True),
-            sg.Text('DEG ', font=GLOBAL_FONT),
-         sg.Button('⌨', key=f'S{servo_num}_rel_pos_keypad', size=(2,1), font=GLOBAL_FONT),
-         sg.Button('OK', key=f'S{servo_num}_rel_pos_ok', size=(4,1), font=GLOBAL_FONT, button_color=('white', 'green'))],
-        [sg.Text('Actual Position:', size=(18,1), font=GLOBAL_FONT), sg.Text('0', key=f'S{servo_num}_actual_pos', size=(10,1), font=GLOBAL_FONT), sg.Text('DEG', font=GLOBAL_FONT)],
+        [sg.Text(f'Servo {servo_num}', font=POSITION_LABEL_FONT), elements['status_light'], elements['status_text']],
+        [sg.Button('Clear Faults', key=f'S{servo_num}_clear_faults', size=_CLEAR_BTN_SIZE, font=GLOBAL_FONT)],
+        *field_rows,
+        [sg.Text('Actual Position:', size=_LABEL_SIZE, font=GLOBAL_FONT), elements['actual_pos'], sg.Text('DEG', font=GLOBAL_FONT)],
         [
-            sg.Button('Servo Enable', key=f'S{servo_num}_enable', size=(12,2), font=GLOBAL_FONT),
-            sg.Button('Servo Disable', key=f'S{servo_num}_disable', size=(12,2), font=GLOBAL_FONT),
-            sg.Button('Zero Position', key=f'S{servo_num}_zero_pos', size=(12,2), font=GLOBAL_FONT)  # Default color (same as Jog)
+            sg.Button('Servo Enable', key=f'S{servo_num}_enable', size=_BTN_SIZE, font=GLOBAL_FONT),
+            sg.Button('Servo Disable', key=f'S{servo_num}_disable', size=_BTN_SIZE, font=GLOBAL_FONT),
+            sg.Button('Zero Position', key=f'S{servo_num}_zero_pos', size=_BTN_SIZE, font=GLOBAL_FONT)  # Default color (same as Jog)
         ],
         [
-            sg.Button('Start Motion', key=f'S{servo_num}_start', size=(12,2), font=GLOBAL_FONT),
-            sg.Button('Stop Motion', key=f'S{servo_num}_stop', size=(12,2), font=GLOBAL_FONT),
-            sg.Button('Jog', key=f'S{servo_num}_jog', size=(12,2), font=GLOBAL_FONT)
+            sg.Button('Start Motion', key=f'S{servo_num}_start', size=_BTN_SIZE, font=GLOBAL_FONT),
+            sg.Button('Stop Motion', key=f'S{servo_num}_stop', size=_BTN_SIZE, font=GLOBAL_FONT),
+            sg.Button('Jog', key=f'S{servo_num}_jog', size=_BTN_SIZE, font=GLOBAL_FONT)
         ]
     ]
     return layout
@@ -274,12 +375,19 @@ servo_tabs = [sg.Tab(f'Servo {i}', build_servo_tab(i), key=f'TAB{i}') for i in r
 # -----------------------------
 # Main window layout
 # -----------------------------
+# [CHANGE 2026-10-15 19:00:00 -04:00] All per-servo keys are formatted here once; event paths only index.
+# FIELD_KEYS[(servo_num, field)] -> input key, ACTUAL_POS_KEYS[servo_num] -> actual position key,
+# NUMERIC_KEYPAD_BUTTONS[keypad key] -> (input key, field).
 NUMERIC_INPUT_KEYS = []
-NUMERIC_KEYPAD_BUTTONS = []
+NUMERIC_KEYPAD_BUTTONS = {}
+FIELD_KEYS = {}
+ACTUAL_POS_KEYS = {i: f'S{i}_actual_pos' for i in range(1, 9)}
 for i in range(1, 9):
-    for field in ['speed', 'accel', 'decel', 'abs_pos', 'rel_pos']:
-        NUMERIC_INPUT_KEYS.append(f'S{i}_{field}')
-        NUMERIC_KEYPAD_BUTTONS.append(f'S{i}_{field}_keypad')
+    for _label, field, _unit in _TAB_TEMPLATE:
+        input_key = f'S{i}_{field}'
+        FIELD_KEYS[(i, field)] = input_key
+        NUMERIC_INPUT_KEYS.append(input_key)
+        NUMERIC_KEYPAD_BUTTONS[f'{input_key}_keypad'] = (input_key, field)
 
 ###############################################################################
 # GUI Layout
@@ -290,102 +398,165 @@ layout = [
         sg.Push(),
         sg.Button('Shutdown', key='SHUTDOWN', size=(8,1), button_color=('white', 'red'), font=GLOBAL_FONT)
     ],
-    [sg.Multiline('', key='DEBUG_LOG', size=(80, 8), font=('Courier New', 9), autoscroll=True, disabled=False, text_color='black', border_width=0)],
+    # [CHANGE 2026-10-15 17:20:00 -04:00] Append-only log: nothing reads it back, so make it write-only
+    # (matches ControllerGUI.py) and keep the O(n) get()+update() rewrite pattern from creeping back in.
+    [sg.Multiline('', key='DEBUG_LOG', size=(80, 8), font=('Courier New', 9), autoscroll=True, disabled=False, write_only=True, text_color='black', border_width=0)],
 ]
 window = sg.Window("Controller GUI", layout, size=(700, 460), font=GLOBAL_FONT, finalize=True, return_keyboard_events=True)
-###############################################################################
-# Show popup if communications not initialized
-###############################################################################
-if comm is None:
-    sg.popup_error('Controller communications not initialized. Check INI file and hardware connection.', keep_on_top=True)
+# [CHANGE 2026-10-15 14:50:00 -04:00] Debug log lines are buffered and flushed to the Multiline
+# in one append every LOG_FLUSH_MS, instead of a get()+update() rewrite of the whole log per line.
+LOG_FLUSH_MS = 250
+LOG_MAX_LINES = 1000
+_pending_log = collections.deque(maxlen=LOG_MAX_LINES)
+
+def log_debug(text):
+    """Queue text for the DEBUG_LOG window; shown on the next flush."""
+    _pending_log.append(text.rstrip('\n'))
+
+def _flush_debug_log():
+    """Push pending log lines in one append, trim the widget to LOG_MAX_LINES, re-arm the timer."""
+    if _pending_log:
+        lines = list(_pending_log)
+        _pending_log.clear()
+        try:
+            window['DEBUG_LOG'].update('\n'.join(lines) + '\n', append=True)
+            text_widget = window['DEBUG_LOG'].Widget
+            excess = int(text_widget.index('end-1c').split('.')[0]) - LOG_MAX_LINES
+            if excess > 0:
+                text_widget.delete('1.0', f'{excess + 1}.0')
+        except Exception:
+            return  # Window closed
+    window.TKroot.after(LOG_FLUSH_MS, _flush_debug_log)
 
+window.TKroot.after(LOG_FLUSH_MS, _flush_debug_log)
+
+# Window is realized; open the controller link from the first event-loop pass
+window.write_event_value('-INIT-', None)
+
+
+# [CHANGE 2026-10-15 09:10:00 -04:00] Indicator updates are event-driven: ControllerComm's
+# status reader posts -AXIS-STATUS-{axis}- only when an axis changes state.
+# Last state drawn per axis; unchanged states skip Element.update() entirely.
+_last_indicator_state = {}
+
+# [CHANGE 2026-10-15 13:25:00 -04:00] Indicator looks built once; updates just swap the preset.
+# enabled state -> (indicator color, status text)
+INDICATOR_STYLES = {
+    True: ('#00FF00', 'Enabled'),    # Bright green for enabled
+    False: ('#FFFF00', 'Disabled'),  # Bright yellow for disabled
+    None: ('gray', 'Disabled'),      # Unknown / no reply
+}
 
-# --- Define poll_and_update_indicator before it is called ---
-def poll_and_update_indicator(axis_index):
+# [CHANGE 2026-10-15 13:10:00 -04:00] Dirty-flag cache for other periodic redraws (e.g. actual position).
+_rendered_text = {}
+
+def update_text_if_changed(key, text):
+    """Update a Text element only when its displayed value differs from the last render."""
+    if _rendered_text.get(key) == text:
+        return
+    _rendered_text[key] = text
+    window[key].update(text)
+
+def update_status_indicator(axis_index, enabled):
 ###############################################################################
-    axis_letter = AXIS_LETTERS[axis_index]
-    status_cmd = f'MG _MO{axis_letter}'
-    raw_resp = None
+    """
+    Update the status indicator and text for one axis.
+    Args:
+        axis_index (int): Axis index (0-7)
+        enabled (bool | None): True = enabled, False = disabled, None = unknown
+    """
+    if axis_index in _last_indicator_state and _last_indicator_state[axis_index] is enabled:
+        return
+    _last_indicator_state[axis_index] = enabled
+    indicator_color, status_text = INDICATOR_STYLES.get(enabled, INDICATOR_STYLES[None])
+    elements = AXIS_ELEMENTS[axis_index + 1]
+    elements['status_light'].update('●', text_color=indicator_color)
+    elements['status_text'].update(status_text, text_color='white')
+
+def _queue_servo_command(cmd, coalesce_key=None):
+    """Queue a command on the ControllerComm worker; the reply is logged by the -CMD-REPLY- handler."""
     if comm:
         try:
-            # Clear out any old responses in the message queue before sending the status command
-            if hasattr(comm, 'message_queue'):
-                import queue
-                try:
-                    while True:
-                        comm.message_queue.get_nowait()
-                except queue.Empty:
-                    pass
-            comm.send_command(status_cmd)
-            import re
-            found_valid = False
-            if hasattr(comm, 'mode') and comm.mode == 'CommMode2':
-                for attempt in range(10):
-                    resp = comm.receive_response(timeout=0.5)
-                    if resp is None:
-                        continue
-                    resp = str(resp).strip()
-                    if resp == ':' or not resp:
-                        continue
-                    # Look for a float (0.0 or 1.0) in the response
-                    float_matches = re.findall(r'-?\d+\.\d+', resp)
-                    if float_matches:
-                        val = float(float_matches[0])
-                        if abs(val) < 0.01 or abs(val - 1.0) < 0.01:
-                            raw_resp = resp
-                            found_valid = True
-                            break
-                if not found_valid:
-                    raw_resp = None
-            else:
-                if hasattr(comm, 'message_queue'):
-                    import queue
-                    try:
-                        for _ in range(10):
-                            resp = str(comm.message_queue.get(timeout=0.5)).strip()
-                            if resp == ':' or not resp:
-                                continue
-                            float_matches = re.findall(r'-?\d+\.\d+', resp)
-                            if float_matches:
-                                val = float(float_matches[0])
-                                if abs(val) < 0.01 or abs(val - 1.0) < 0.01:
-                                    raw_resp = resp
-                                    found_valid = True
-                                    break
-                        if not found_valid:
-                            raw_resp = None
-                    except queue.Empty:
-                        raw_resp = None
-        except Exception:
-            raw_resp = None
-    indicator_text = '●'
-    indicator_color = 'gray'
-    status_text = 'Disabled'
-    status_color = 'white'
-    if raw_resp:
-        import re
-        float_matches = re.findall(r'-?\d+\.\d+', raw_resp)
-        if float_matches:
-            try:
-                val = float(float_matches[0])
-                if abs(val) < 0.01:
-                    indicator_color = '#00FF00'  # Bright green for enabled
-                    status_text = 'Enabled'
-                    status_color = 'white'
-                elif abs(val - 1.0) < 0.01:
-                    indicator_color = '#FFFF00'  # Bright yellow for disabled
-                    status_text = 'Disabled'
-                    status_color = 'white'
-                else:
-                    indicator_color = 'gray'
-                    status_text = 'Disabled'
-                    status_color = 'white'
-            except Exception:
-                indicator_color = 'gray'
-                status_text = 'Disabled'
-                status_color = 'white'
-    window[f'S{axis_index+1}_status_light'].update('●', text_color=indicator_color)
-    window[f'S{axis_index+1}_status_text'].update(status_text, text_color=status_color)
+            comm.send_async(cmd, '-CMD-REPLY-', window, coalesce_key=coalesce_key)
+        except Exception as e:
+            sg.popup_error(f'Error sending command: {e}', keep_on_top=True)
+    else:
+        sg.popup_error('Controller communications not initialized.', keep_on_top=True)
+
+def handle_setpoint_ok(servo_num, field, values):
+    """Validate one setpoint field (degrees), convert to pulses, and send it."""
+    axis_letter = AXIS_LETTERS[servo_num-1]
+    value = values.get(FIELD_KEYS[(servo_num, field)], None)
+    if value is None or value == '':
+        sg.popup_error(f'Please enter a value for {field}', keep_on_top=True)
+        return
+    value_deg = parse_numeric(value)
+    if value_deg is None:
+        sg.popup_error(f'Invalid value for {field}', keep_on_top=True)
+        return
+    # Validate min/max for this field (in degrees)
+    min_val, max_val = NUMERIC_LIMITS.get(field, (0, 54000))
+    if not (min_val <= value_deg <= max_val):
+        sg.popup_error(f'Value for {field} must be between {min_val} and {max_val}', keep_on_top=True)
+        return
+    # Convert degrees to pulses for controller
+    scaling = AXIS_UNITS[axis_letter]['scaling']
+    gearbox = AXIS_UNITS[axis_letter]['gearbox']
+    value_pulses = int(round(value_deg * scaling * gearbox))
+    cmd = CMDS[field](axis_letter, servo_num, value_pulses)
+    _queue_servo_command(cmd, coalesce_key=(axis_letter, field))
+
+def handle_servo_action(servo_num, action, values):
+    """Send a direct motor button command (enable, disable, start, stop, jog)."""
+    axis_letter = AXIS_LETTERS[servo_num-1]
+    if action == 'jog':
+        speed_val = values.get(FIELD_KEYS[(servo_num, 'speed')], None)
+        if speed_val is None or speed_val == '':
+            sg.popup_error('Please enter a speed value for Jog', keep_on_top=True)
+            return
+        try:
+            speed_val = int(speed_val)
+        except ValueError:
+            sg.popup_error('Invalid speed value for Jog', keep_on_top=True)
+            return
+        # Repeated jog taps collapse to the latest speed
+        _queue_servo_command(CMDS['jog'](axis_letter, servo_num, speed_val),
+                             coalesce_key=(axis_letter, action))
+    else:
+        # Enable/disable/start/stop always send
+        _queue_servo_command(CMDS[action](axis_letter, servo_num))
+
+# [CHANGE 2026-10-15 18:05:00 -04:00] Only 8 DP strings exist; build them once.
+# DP command for single axis: DP n (n is the value for the axis, others omitted)
+# For axis A=1, DP 0,,,,,,,
+_DP_ZERO_CMDS = {i: 'DP ' + ''.join('0' if j == i - 1 else ',' for j in range(8)) for i in range(1, 9)}
+
+def handle_zero_pos(servo_num, values):
+    """Send DP for one axis so its current position reads as zero."""
+    # [CHANGE 2026-10-15 18:30:00 -04:00] Queued like the other buttons; the reply is log-only.
+    _queue_servo_command(_DP_ZERO_CMDS[servo_num])
+
+# [CHANGE 2026-10-15 14:10:00 -04:00] Event key -> handler table built once; one dict lookup per event.
+# [CHANGE 2026-10-15 17:50:00 -04:00] EVENT_TABLE describes each servo event as (kind, servo_num, field);
+# kind is 'ok' for setpoint OK buttons, otherwise the button action. Handlers are derived from it.
+EVENT_TABLE = {}
+for i in range(1, 9):
+    for _label, field, _unit in _TAB_TEMPLATE:
+        EVENT_TABLE[f'S{i}_{field}_ok'] = ('ok', i, field)
+    for action in ('enable', 'disable', 'start', 'stop', 'jog'):
+        if action in CMDS:
+            EVENT_TABLE[f'S{i}_{action}'] = (action, i, None)
+    # [CHANGE 2026-10-15 18:00:00 -04:00] Zero Position dispatches from the table too (no event re-parsing)
+    EVENT_TABLE[f'S{i}_zero_pos'] = ('zero_pos', i, None)
+
+SERVO_HANDLERS = {
+    event_key: (functools.partial(handle_setpoint_ok, servo_num, field) if kind == 'ok'
+                else functools.partial(handle_zero_pos, servo_num) if kind == 'zero_pos'
+                else functools.partial(handle_servo_action, servo_num, kind))
+    for event_key, (kind, servo_num, field) in EVENT_TABLE.items()
+}
+# [CHANGE 2026-10-15 17:55:00 -04:00] Main-loop prefilter: one hash lookup instead of prefix/suffix scans
+SERVO_EVENTS = frozenset(EVENT_TABLE)
 
 def handle_servo_event(event, values):
     """
@@ -394,126 +565,128 @@ def handle_servo_event(event, values):
         event (str): Event key from PySimpleGUI
         values (dict): Current values from the GUI
     """
-    for i in range(1, 9):
-        prefix = f'S{i}_'
-        axis_letter = AXIS_LETTERS[i-1]
-        # Handle OK buttons for each field
-        for field in ['speed', 'accel', 'decel', 'abs_pos', 'rel_pos']:
-            if event == f'S{i}_{field}_ok':
-                map_key = f'S{i}_{field}'
-                value = values.get(f'S{i}_{field}', None)
-                if value is None or value == '':
-                    sg.popup_error(f'Please enter a value for {field}', keep_on_top=True)
-                    return
-                try:
-                    value_deg = float(value)
-                except ValueError:
-                    sg.popup_error(f'Invalid value for {field}', keep_on_top=True)
-                    return
-                # Validate min/max for this field (in degrees)
-                min_val, max_val = NUMERIC_LIMITS.get(field, (0, 54000))
-                if not (min_val <= value_deg <= max_val):
-                    sg.popup_error(f'Value for {field} must be between {min_val} and {max_val}', keep_on_top=True)
-                    return
-                # Convert degrees to pulses for controller
-                scaling = AXIS_UNITS[axis_letter]['scaling']
-                gearbox = AXIS_UNITS[axis_letter]['gearbox']
-                value_pulses = int(round(value_deg * scaling * gearbox))
-                cmd_func = COMMAND_MAP[map_key]
-                if callable(cmd_func):
-                    cmd = cmd_func(value_pulses)
-                else:
-                    cmd = cmd_func
-                # Send command to controller
-                if comm:
-                    try:
-                        response = comm.send_command(cmd)
-                        # Log request and reply in DEBUG_LOG
-                        prev_log = window['DEBUG_LOG'].get()
-                        new_log = f"Sent: {cmd}\nReply: {response}"
-                        window['DEBUG_LOG'].update(prev_log + new_log + "\n")
-                        # Popup only for data entry OK, not for motor control buttons
-                    except Exception as e:
-                        sg.popup_error(f'Error sending command: {e}', keep_on_top=True)
-                else:
-                    sg.popup_error('Controller communications not initialized.', keep_on_top=True)
-                return
-        # Handle other direct button events (Enable, Disable, Start, Stop, Jog)
-        if event.startswith(prefix) and event[len(prefix):] in ['enable', 'disable', 'start', 'stop', 'jog']:
-            action = event[len(prefix):]
-            map_key = f'S{i}_{action}'
-            if map_key in COMMAND_MAP:
-                cmd = None
-                if action == 'jog':
-                    speed_val = values.get(f'S{i}_speed', None)
-                    if speed_val is None or speed_val == '':
-                        sg.popup_error('Please enter a speed value for Jog', keep_on_top=True)
-                        return
-                    try:
-                        speed_val = int(speed_val)
-                    except ValueError:
-                        sg.popup_error('Invalid speed value for Jog', keep_on_top=True)
-                        return
-                    cmd_func = COMMAND_MAP[map_key]
-                    if callable(cmd_func):
-                        cmd = cmd_func(speed_val)
-                    else:
-                        cmd = cmd_func
-                else:
-                    cmd = COMMAND_MAP[map_key] if not callable(COMMAND_MAP[map_key]) else None
-                if cmd:
-                    # Send command to controller
-                    if comm:
-                        try:
-                            response = comm.send_command(cmd)
-                            # Log request and reply in DEBUG_LOG
-                            prev_log = window['DEBUG_LOG'].get()
-                            new_log = f"Sent: {cmd}\nReply: {response}"
-                            window['DEBUG_LOG'].update(prev_log + new_log + "\n")
-                            # Popup only for data entry OK, not for motor control buttons
-                            if action in ['enable', 'disable']:
-                                poll_and_update_indicator(i-1)
-                        except Exception as e:
-                            sg.popup_error(f'Error sending command: {e}', keep_on_top=True)
-                    else:
-                        sg.popup_error('Controller communications not initialized.', keep_on_top=True)
-            return
+    handler = SERVO_HANDLERS.get(event)
+    if handler:
+        handler(values)
 
-# Helper function to poll and update the currently active servo indicator
-def poll_active_servo_indicator(window, comm, values=None):
+def start_controller_status(comm):
     """
-    Polls the currently active servo tab and updates its indicator.
-    Args:
-        window: The PySimpleGUI window object
-        comm: The controller communication object
-        values: The current values dict (optional, for tab selection)
+    Start the event-driven status reader (one batched MG _MOx query per second).
+    Its first pass posts every axis, which seeds all indicators off the UI thread.
+    Returns: the status reader's stop event, or None.
     """
-    active_tab = None
-    if values and 'TABGROUP' in values:
-        active_tab = values['TABGROUP']
-    elif 'TABGROUP' in window.AllKeysDict:
-        active_tab = window['TABGROUP'].get()
-    active_servo = 1
-    if active_tab:
+    if comm and hasattr(comm, 'start_status_reader'):
         try:
-            active_servo = int(active_tab.replace('TAB', ''))
-        except Exception:
-            active_servo = 1
-    poll_and_update_indicator(active_servo - 1)
+            return comm.start_status_reader(window, axes=AXES_STR, interval=1.0)
+        except Exception as e:
+            log_debug(f'Error starting status reader: {e}')
+    return None
 
+status_reader_stop = None
 
-# --- Update status indicator for the active servo on startup ---
-try:
-    poll_active_servo_indicator(window, comm)
-except Exception as e:
-    window['DEBUG_LOG'].update(f'Error updating indicator on startup: {e}')
 
+# -----------------------------
+# Position polling (worker thread)
+# -----------------------------
+# [CHANGE 2026-10-15 18:20:00 -04:00] Controller round-trips for the active servo's position run on a
+# daemon thread; the GUI thread only applies the -POSITION- events it posts, so a slow reply never
+# stalls the window. Replaces the TKroot.after/-POLL- piggyback on the event loop.
+POSITION_POLL_INTERVAL = 1.0
+active_servo = 1                      # Written by the GUI thread on TABGROUP, read by the worker
+TAB_SERVOS = {f'TAB{i}': i for i in range(1, 9)}
+_position_poll_wakeup = threading.Event()
+_invalid_resp_counters = [0] * 8      # Consecutive invalid replies, one per axis
+_last_valid_pos = [''] * 8            # Last displayed position, one per axis
+
+# [CHANGE 2026-10-16 00:40:00 -04:00] The worker reads only _RPx: enable state comes from the status
+# reader's per-second MG _MOA.._MOH query, so the active axis is not asked for _MO twice.
+def read_position(axis_letter):
+    """Send MG _RPx and return (pos_cmd, numeric reply string or None). Worker thread only."""
+    pos_cmd = f'MG _RP{axis_letter}'
+    send_result = comm.send_command(pos_cmd)
+    # Query replies come back from send_command; only wait for a late reply
+    # when the transport exposes receive_response, and then within one deadline.
+    # [CHANGE 2026-10-15 18:55:00 -04:00] One parser for every reply: ControllerComm.parse_position_reply
+    pos_resp = comm.parse_position_reply(send_result) if isinstance(send_result, str) else None
+    if pos_resp is None and hasattr(comm, 'receive_response'):
+        deadline = time.monotonic() + POSITION_REPLY_TIMEOUT
+        remaining = POSITION_REPLY_TIMEOUT
+        while pos_resp is None and remaining > 0:
+            try:
+                pos_resp = comm.parse_position_reply(comm.receive_response(timeout=remaining))
+            except Exception:
+                break
+            remaining = deadline - time.monotonic()
+    return pos_cmd, pos_resp
+
+def _position_poll_worker(stop_event):
+    """Poll the active servo's position and post ('-POSITION-', (servo, cmd, reply, error))."""
+    while not stop_event.is_set():
+        servo_num = active_servo
+        axis_letter = AXIS_LETTERS[servo_num-1]
+        pos_cmd, pos_resp, error = f'MG _RP{axis_letter}', None, None
+        try:
+            pos_cmd, pos_resp = read_position(axis_letter)
+        except Exception as e:
+            error = e
+        try:
+            window.write_event_value('-POSITION-', (servo_num, pos_cmd, pos_resp, error))
+        except Exception:
+            break  # Window closed
+        # Sleep until the next tick, or until a tab change asks for an immediate read
+        _position_poll_wakeup.wait(POSITION_POLL_INTERVAL)
+        _position_poll_wakeup.clear()
+
+def start_position_poll():
+    """Start the position worker. Returns: its stop event."""
+    stop_event = threading.Event()
+    threading.Thread(target=_position_poll_worker, args=(stop_event,), daemon=True).start()
+    return stop_event
+
+def apply_position_reply(i, pos_cmd, pos_resp, error=None):
+    """Show one polled position on the GUI thread; 'N/A' only after 5 consecutive invalid replies."""
+    axis_letter = AXIS_LETTERS[i-1]
+    if error is not None:
+        update_text_if_changed(ACTUAL_POS_KEYS[i], 'N/A')
+        log_debug(f'Axis {axis_letter}: ERROR {error}')
+        return
+    log_debug(f'[POLL] Sent: {pos_cmd}\n[POLL] Response: {repr(pos_resp)}')
+    valid = False
+    if pos_resp is not None:
+        try:
+            pos_val_pulses = float(pos_resp)
+            # Convert pulses to degrees for display
+            scaling = AXIS_UNITS[axis_letter]['scaling']
+            gearbox = AXIS_UNITS[axis_letter]['gearbox']
+            pos_val_deg = pos_val_pulses / (scaling * gearbox)
+            # Show '0' if response is 0.0000
+            if abs(pos_val_deg) < 1e-6:
+                pos_val_disp = 0
+            else:
+                pos_val_disp = round(pos_val_deg, 2)
+            update_text_if_changed(ACTUAL_POS_KEYS[i], str(pos_val_disp))
+            _last_valid_pos[i-1] = str(pos_val_disp)
+            _invalid_resp_counters[i-1] = 0
+            valid = True
+        except Exception:
+            pass
+    if not valid:
+        _invalid_resp_counters[i-1] += 1
+        if _invalid_resp_counters[i-1] >= 5:
+            update_text_if_changed(ACTUAL_POS_KEYS[i], 'N/A')
+            log_val = 'N/A'
+        else:
+            # Show last valid value, or blank if none
+            last_val = _last_valid_pos[i-1]
+            update_text_if_changed(ACTUAL_POS_KEYS[i], last_val)
+            log_val = last_val if last_val else 'N/A'
+    else:
+        log_val = _last_valid_pos[i-1]
+    log_debug(f'Axis {axis_letter}: {pos_cmd} -> {log_val}')
 
-# --- Update status indicator for the active servo on startup ---
-try:
-    poll_active_servo_indicator(window, comm)
-except Exception as e:
-    window['DEBUG_LOG'].update(f'Error updating indicator on startup: {e}')
+position_poll_stop = None
+POLL_MODES = ('CommMode1', 'CommMode2')   # Controller types that understand MG _MOx/_RPx
+_POLL_ENABLED = False
 
 
 # -----------------------------
@@ -521,123 +694,60 @@ except Exception as e:
 # -----------------------------
 while True:
     print('[DEBUG] Main event loop running')
-    event, values = window.read(timeout=1000)
-    poll_now = False
-    if event is None or event == '__TIMEOUT__':
-        poll_now = True
-    elif event == 'TABGROUP':
-        poll_now = True
-    print(f'[DEBUG] event={event}, poll_now={poll_now}')
+    event, values = window.read()
+    print(f'[DEBUG] event={event}')
     if event == sg.WIN_CLOSED:
         break
-    if poll_now:
-        print('[POLL] Entered poll_now block')
-        print('[POLL] Polling only the active servo for actual position...')
-        # --- Add counters for consecutive invalid responses ---
-        if not hasattr(window, '_invalid_resp_counters'):
-            window._invalid_resp_counters = [0]*8  # One for each axis
-        if not hasattr(window, '_last_valid_pos'):
-            window._last_valid_pos = ['']*8
+    # Deferred controller startup (posted right after the window is realized)
+    if event == '-INIT-':
+        comm = init_controller_comm()
+        if comm is None:
+            sg.popup_error('Controller communications not initialized. Check INI file and hardware connection.', keep_on_top=True)
+        # [CHANGE 2026-10-15 18:50:00 -04:00] MG _MO/_RP polling is Galil-only; ClearCore (CommMode3)
+        # and a failed init start no polling threads at all.
+        _POLL_ENABLED = comm is not None and controller_type in POLL_MODES
+        if _POLL_ENABLED:
+            status_reader_stop = start_controller_status(comm)
+            position_poll_stop = start_position_poll()
+        continue
+    # Reply to a command queued with comm.send_async
+    if event == '-CMD-REPLY-':
+        cmd, response = values[event]
+        log_debug(f"Sent: {cmd}\nReply: {response}")
+        # [CHANGE 2026-10-15 18:30:00 -04:00] Success is log-only; a failed send still raises a popup.
+        if response is False:
+            sg.popup_error(f'Error sending command: {cmd}', keep_on_top=True)
+            continue
+        # Enable/disable changes state; wake the status reader instead of waiting for its next tick
+        if str(cmd).upper().startswith(('SH', 'MO')) and hasattr(comm, 'refresh_status'):
+            comm.refresh_status()
+        continue
+    # Enable/disable state change pushed by the ControllerComm status reader
+    if isinstance(event, str) and event.startswith('-AXIS-STATUS-'):
+        axis_letter = event[len('-AXIS-STATUS-'):-1]
+        if axis_letter in AXIS_IDX:
+            update_status_indicator(AXIS_IDX[axis_letter], values[event])
+        continue
+    # Position reply posted by the polling worker
+    if event == '-POSITION-':
         try:
-            try:
-                poll_active_servo_indicator(window, comm, values)
-            except Exception as e:
-                print(f'[POLL] Exception in poll_active_servo_indicator: {e}')
-            print('[POLL] After poll_active_servo_indicator, before MG _RPx for active tab')
-            # Determine active tab/servo
-            active_tab = None
-            if values and 'TABGROUP' in values:
-                active_tab = values['TABGROUP']
-            elif 'TABGROUP' in window.AllKeysDict:
-                active_tab = window['TABGROUP'].get()
-            active_servo = 1
-            if active_tab:
-                try:
-                    active_servo = int(str(active_tab).replace('TAB', ''))
-                except Exception:
-                    active_servo = 1
-            i = active_servo
-            axis_letter = chr(64 + i)
-            try:
-                pos_cmd = f'MG _RP{axis_letter}'
-                print(f'[POLL] Sending: {pos_cmd}')
-                send_result = comm.send_command(pos_cmd)
-                print(f'[POLL] send_command result: {send_result}')
-                pos_resp = None
-                for attempt in range(3):
-                    try:
-                        resp = comm.receive_response(timeout=0.3)
-                        resp_str = str(resp).strip() if resp is not None else ''
-                        # Ignore echoed command responses and empty/colon responses
-                        if resp_str and resp_str != ':' and not resp_str.startswith('SENT:'):
-                            # Only accept numeric responses
-                            import re
-                            match = re.search(r'(-?\d+(?:\.\d+)?)', resp_str)
-                            if match:
-                                pos_resp = match.group(1)
-                                break
-                    except Exception as ex:
-                        print(f'[POLL] Exception in receive_response (attempt {attempt+1}): {ex}')
-                print(f'[POLL] {pos_cmd} response: {pos_resp}')
-                prev_log = window['DEBUG_LOG'].get()
-                window['DEBUG_LOG'].update(prev_log + f'[POLL] Sent: {pos_cmd}\n[POLL] Response: {repr(pos_resp)}\n')
-                # --- Only show 'N/A' after 5 consecutive invalid responses ---
-                import re
-                pos_val = None
-                valid = False
-                if pos_resp is not None and str(pos_resp).strip() != ':' and str(pos_resp).strip() != '':
-                    try:
-                        pos_val_pulses = float(pos_resp)
-                        # Convert pulses to degrees for display
-                        scaling = AXIS_UNITS[axis_letter]['scaling']
-                        gearbox = AXIS_UNITS[axis_letter]['gearbox']
-                        pos_val_deg = pos_val_pulses / (scaling * gearbox)
-                        # Show '0' if response is 0.0000
-                        if abs(pos_val_deg) < 1e-6:
-                            pos_val_disp = 0
-                        else:
-                            pos_val_disp = round(pos_val_deg, 2)
-                        window[f'S{i}_actual_pos'].update(str(pos_val_disp))
-                        window._last_valid_pos[i-1] = str(pos_val_disp)
-                        window._invalid_resp_counters[i-1] = 0
-                        valid = True
-                    except Exception:
-                        pass
-                if not valid:
-                    window._invalid_resp_counters[i-1] += 1
-                    if window._invalid_resp_counters[i-1] >= 5:
-                        window[f'S{i}_actual_pos'].update('N/A')
-                        log_val = 'N/A'
-                    else:
-                        # Show last valid value, or blank if none
-                        last_val = window._last_valid_pos[i-1] if window._last_valid_pos[i-1] else ''
-                        window[f'S{i}_actual_pos'].update(last_val)
-                        log_val = last_val if last_val else 'N/A'
-                else:
-                    log_val = window._last_valid_pos[i-1]
-                prev_log = window['DEBUG_LOG'].get()
-                window['DEBUG_LOG'].update(prev_log + f'Axis {axis_letter}: {pos_cmd} -> {log_val}\n')
-            except Exception as e:
-                print(f'[POLL] Exception in polling loop for axis {axis_letter}: {e}')
-                window[f'S{i}_actual_pos'].update('N/A')
-                prev_log = window['DEBUG_LOG'].get()
-                window['DEBUG_LOG'].update(prev_log + f'Axis {axis_letter}: ERROR {e}\n')
+            apply_position_reply(*values[event])
         except Exception as e:
-            print(f'[POLL] Exception in poll_now block: {e}')
-            window['DEBUG_LOG'].update(f'Error polling indicator/position: {e}')
+            log_debug(f'Error polling indicator/position: {e}')
+        continue
+    # Tab change: point the worker at the new servo and poll it right away
+    if event == 'TABGROUP':
+        # [CHANGE 2026-10-15 18:40:00 -04:00] Tab key -> servo via table; re-poll only on a real change
+        new_servo = TAB_SERVOS.get(values.get('TABGROUP'), 1)
+        if new_servo != active_servo:
+            active_servo = new_servo
+            _position_poll_wakeup.set()
         continue
     # Show numeric keypad when keypad button is clicked
     if event in NUMERIC_KEYPAD_BUTTONS:
-        # event is like 'S1_speed_keypad', extract field and servo
-        parts = event.split('_')
-        servo = parts[0]
-        field = '_'.join(parts[1:-1])
-        input_key = f'{servo}_{field}'
-        current_val = values.get(input_key, '')
-        try:
-            current_val = int(current_val)
-        except (ValueError, TypeError):
-            current_val = 0
+        input_key, field = NUMERIC_KEYPAD_BUTTONS[event]
+        current_val = parse_numeric(values.get(input_key, ''))
+        current_val = int(current_val) if current_val is not None else 0
         # Lookup min and max for this field from NUMERIC_LIMITS
         min_val, max_val = NUMERIC_LIMITS.get(field, (0, 54000))
         keypad = NumericKeypad(
@@ -651,31 +761,12 @@ while True:
         if result is not None:
             window[input_key].update(str(result))
         continue
-    # Handle Zero Position button
-    if isinstance(event, str) and event.endswith('_zero_pos'):
-        # event is like 'S1_zero_pos', extract servo number
-        try:
-            servo_num = int(event[1:event.index('_')])
-            # DP command for single axis: DP n (n is the value for the axis, others omitted)
-            # For axis A=1, DP 0,,,,,,,
-            dp_args = [','] * 8
-            dp_args[servo_num - 1] = '0'
-            dp_cmd = f"DP {''.join(dp_args)}"
-            if comm:
-                try:
-                    response = comm.send_command(dp_cmd)
-                    prev_log = window['DEBUG_LOG'].get()
-                    window['DEBUG_LOG'].update(prev_log + f'Sent: {dp_cmd}\nReply: {response}\n')
-                    # Popup disabled for Zero Position button
-                except Exception as e:
-                    sg.popup_error(f'Error sending DP command: {e}', keep_on_top=True)
-            else:
-                sg.popup_error('Controller communications not initialized.', keep_on_top=True)
-        except Exception as e:
-            sg.popup_error(f'Error parsing servo number: {e}', keep_on_top=True)
-        continue
     # Handle all servo button events (but not input field changes)
-    if isinstance(event, str) and event.startswith('S') and '_' in event and not event.endswith(tuple(['speed','accel','decel','abs_pos','rel_pos'])):
+    if isinstance(event, str) and event in SERVO_EVENTS:
         handle_servo_event(event, values)
     # ...existing code for other events...
-window.close()
\ No newline at end of file
+window.close()
+if status_reader_stop is not None:
+    status_reader_stop.set()
+if position_poll_stop is not None:
+    position_poll_stop.set()
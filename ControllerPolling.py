@@ -5,19 +5,118 @@ Background polling thread for servo position, torque, and enable/disable status.
 Intended for use with ControllerGUI.py.
 
 Exports:
-    start_polling_thread(window, comm, comm_e=None, comm_h=None)
+    start_polling_thread(window, comm, comm_e=None, comm_h=None, limit_pulses=None)
         - Starts the polling thread and returns the thread object.
+    POLL_SAMPLES
+        - Ring of poll samples; drain it (or drain_latest() for one per servo) when a 'POSITION_POLL' event arrives.
+    set_poll_interval(ms)
+        - Changes the delay between poll cycles (clamped to POLL_INTERVAL_MIN_MS..MAX_MS).
     start_comm_health_thread(window, comm, comm_e=None, comm_h=None, interval=5.0)
         - Starts comm-link health polling and returns (thread, stop_event).
 """
+import queue
 import threading
 import time
 import re
-import queue
 import subprocess
 import os
 
 
+# [CHANGE 2026-10-16 00:30:00 -04:00] Drain through the public API rather than Queue internals;
+# the queue holds at most a few stale replies, so the loop is short.
+def _clear_queue(q):
+    """Discard everything currently in a queue.Queue."""
+    try:
+        while True:
+            q.get_nowait()
+    except queue.Empty:
+        pass
+
+
+# [CHANGE 2026-10-15 19:35:00 -04:00] Poll samples travel through a single-producer/single-consumer
+# ring instead of riding on each write_event_value. The poller only posts a 'POSITION_POLL' wakeup
+# when none is already pending, so a busy GUI drains several samples per Tk event.
+class _SampleRing:
+    """
+    Fixed-size ring for one producer (polling thread) and one consumer (GUI thread).
+    Each index is written by only one side and plain attribute stores are atomic
+    under the GIL, so the data path takes no lock.
+    """
+    def __init__(self, capacity=64):
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._mask = size - 1
+        self._slots = [None] * size
+        self._head = 0  # written only by the producer
+        self._tail = 0  # written only by the consumer
+        self._wake_pending = False
+
+    def push(self, item):
+        """Producer side. Returns True if the consumer needs a wakeup; drops the sample if full."""
+        if self._head - self._tail > self._mask:
+            return False
+        self._slots[self._head & self._mask] = item
+        self._head += 1
+        if self._wake_pending:
+            return False
+        self._wake_pending = True
+        return True
+
+    def drain(self):
+        """Consumer side. Returns every available sample, oldest first."""
+        # Clear the flag before reading so a sample pushed during the drain re-arms the wakeup
+        self._wake_pending = False
+        items = []
+        head = self._head
+        while self._tail != head:
+            slot = self._tail & self._mask
+            items.append(self._slots[slot])
+            self._slots[slot] = None
+            self._tail += 1
+        return items
+
+    # [CHANGE 2026-10-15 22:55:00 -04:00] Coalescing drain: a backlog of several rounds collapses to
+    # one sample per servo (the newest) without building the intermediate list.
+    def drain_latest(self, key='servo'):
+        """Consumer side. Returns {sample[key]: newest sample} for every available sample."""
+        self._wake_pending = False
+        latest = {}
+        head = self._head
+        while self._tail != head:
+            slot = self._tail & self._mask
+            item = self._slots[slot]
+            latest[item[key]] = item
+            self._slots[slot] = None
+            self._tail += 1
+        return latest
+
+
+POLL_SAMPLES = _SampleRing()
+
+# [CHANGE 2026-10-15 21:15:00 -04:00] Tunable poll period, and change-only delivery: a sample identical
+# to the last one sent for that servo is dropped unless POLL_HEARTBEAT_S has passed, so the GUI's
+# 1.5 s position-freshness check (jog limits) still sees regular updates while the axis is at rest.
+# [CHANGE 2026-10-16 00:35:00 -04:00] Limit trips are counted here, per poll, before change-only
+# suppression and the GUI's coalescing: each sample carries 'limit_count' (consecutive polls outside
+# the servo's pulse bounds), and out-of-bounds samples are always delivered. Other GUI counters
+# (invalid/zero replies) count delivered samples, so an unchanged reply at rest advances them only
+# once per POLL_HEARTBEAT_S.
+POLL_INTERVAL_DEFAULT_MS = 500
+POLL_INTERVAL_MIN_MS = 100
+POLL_INTERVAL_MAX_MS = 1000
+POLL_HEARTBEAT_S = 1.0
+_poll_interval_s = POLL_INTERVAL_DEFAULT_MS / 1000.0
+
+
+def set_poll_interval(ms):
+    """Set the delay between poll cycles in milliseconds; returns the value actually applied."""
+    global _poll_interval_s
+    ms = max(POLL_INTERVAL_MIN_MS, min(POLL_INTERVAL_MAX_MS, int(ms)))
+    _poll_interval_s = ms / 1000.0
+    return ms
+
+
 def _extract_numeric_response(resp_str):
     if not isinstance(resp_str, str):
         return None
@@ -28,6 +127,46 @@ def _extract_numeric_response(resp_str):
     return None
 
 
+# [CHANGE 2026-10-15 23:50:00 -04:00] Batching is turned off only after this many bad replies in a row,
+# so a single timeout or partial read (which comes back as "0") does not end it for the session.
+POLL_BATCH_FAIL_LIMIT = 3
+
+
+def _batch_reply_failed(comm, resp):
+    """Count one bad compound reply; disables batching for comm after POLL_BATCH_FAIL_LIMIT in a row."""
+    fails = getattr(comm, '_poll_batch_fails', 0) + 1
+    comm._poll_batch_fails = fails
+    if fails >= POLL_BATCH_FAIL_LIMIT:
+        comm._poll_batch_ok = False
+        print(f'[POLL] Compound MG disabled after {fails} bad replies (last: {resp!r}); using per-metric queries')
+    return None
+
+
+def _query_axis_batch(comm, axis_letter):
+    """
+    Send 'MG _RPx, _TCx, _MOx, _SPx' in one round-trip.
+    Returns (pos, torque, status, speed) numeric strings, or None if the reply is not four numbers.
+    POLL_BATCH_FAIL_LIMIT bad replies in a row mean the far end does not batch; later polls skip the attempt.
+    """
+    if not getattr(comm, '_poll_batch_ok', True):
+        return None
+    resp = comm.send_command(f'MG _RP{axis_letter}, _TC{axis_letter}, _MO{axis_letter}, _SP{axis_letter}')
+    if not isinstance(resp, str):
+        return _batch_reply_failed(comm, resp)
+    # [CHANGE 2026-10-15 20:35:00 -04:00] One strip + whitespace split (C level) instead of a regex scan;
+    # the tokens are checked with float() but handed on as the original strings.
+    values = resp.strip(' \t\r\n:').split()
+    if len(values) != 4:
+        return _batch_reply_failed(comm, resp)
+    try:
+        for value in values:
+            float(value)
+    except ValueError:
+        return _batch_reply_failed(comm, resp)
+    comm._poll_batch_fails = 0
+    return tuple(values)
+
+
 def _extract_clearcore_position(resp_str):
     """Best-effort extract of Axis E position from ClearCore payload variants."""
     if not isinstance(resp_str, str):
@@ -56,7 +195,15 @@ def _extract_clearcore_position(resp_str):
             return m.group(1)
     return None
 
-def polling_thread_func(window, comm, comm_e, comm_h, stop_event):
+def _parse_pulses(pos_text):
+    """Position reply as a float, or None if it is not a number."""
+    try:
+        return float(pos_text)
+    except (TypeError, ValueError):
+        return None
+
+
+def polling_thread_func(window, comm, comm_e, comm_h, stop_event, limit_pulses=None):
     """
     Polls servo position, torque, and enable/disable status in the background.
     Sends updates to the GUI using window.write_event_value.
@@ -67,7 +214,10 @@ def polling_thread_func(window, comm, comm_e, comm_h, stop_event):
         comm_e: ClearCore comm object (axis E)
         comm_h: MyActuator comm object (axis H)
         stop_event: Threading event to stop the polling loop
+        limit_pulses: optional {servo: (lo, hi)} position bounds in pulses used for 'limit_count'
     """
+    last_sent = {}  # servo -> ((pos, torque, status, speed), monotonic time sent)
+    limit_counts = {}  # servo -> consecutive polls outside limit_pulses
     while not stop_event.is_set():
         # 2. Get active servo and axis
         active_tab = window['TABGROUP'].get() if 'TABGROUP' in window.AllKeysDict else 'TAB1'
@@ -89,11 +239,7 @@ def polling_thread_func(window, comm, comm_e, comm_h, stop_event):
         
         # 1. Flush the buffer before sending the position command
         if active_comm and hasattr(active_comm, 'message_queue'):
-            try:
-                while True:
-                    active_comm.message_queue.get_nowait()
-            except queue.Empty:
-                pass
+            _clear_queue(active_comm.message_queue)
         
         # --- Commands and response variables for this poll cycle ---
         pos_cmd    = f'MG _RP{axis_letter}'
@@ -110,129 +256,151 @@ def polling_thread_func(window, comm, comm_e, comm_h, stop_event):
                 # Check if this is MyActuator (CommMode5) - it returns responses directly, no retries needed
                 is_myactuator = (active_comm.mode == 'CommMode5') if hasattr(active_comm, 'mode') else False
 
-                # Position
-                resp_direct = active_comm.send_command(pos_cmd)
-                if isinstance(resp_direct, str):
-                    resp_str = resp_direct.strip()
-
-                    raw_resp_str = resp_str
-                    pos_resp = _extract_numeric_response(resp_str)
-                    if pos_resp is None and axis_letter == 'E':
-                        pos_resp = _extract_clearcore_position(resp_str)
-                # Only retry for non-MyActuator controllers (Galil serial, etc.)
-                if pos_resp is None and not is_myactuator:
-                    time.sleep(0.05)  # Reduced from 0.2s
-                    for _ in range(3):  # Reduced from 5 retries
-                        if stop_event.is_set():
-                            break
-                        try:
-                            resp = active_comm.receive_response(timeout=0.1)  # Reduced from 0.2s
-                            resp_str = str(resp).strip() if resp is not None else ''
-                            parsed = _extract_numeric_response(resp_str)
-                            if parsed is None and axis_letter == 'E':
-                                parsed = _extract_clearcore_position(resp_str)
-                            if parsed is not None:
-                                pos_resp = parsed
-                                raw_resp_str = resp_str
-                            if pos_resp is not None:
-                                break
-                        except Exception:
-                            pass
-                # [CHANGE 2026-03-24 10:55:00 -04:00] Axis E fallback: prefer commanded target, then tracked position cache.
-                if pos_resp is None and axis_letter == 'E':
-                    try:
-                        cached_pos = getattr(active_comm, 'clearcore_commanded_position', None)
-                        if cached_pos is None:
-                            cached_pos = getattr(active_comm, 'clearcore_last_position', None)
-                        if cached_pos is not None:
-                            pos_resp = str(cached_pos)
-                            if not raw_resp_str:
-                                raw_resp_str = f'CACHE:{cached_pos}'
-                    except Exception:
-                        pass
-                if not is_clearcore_axis:
-                    # Torque
-                    resp_direct = active_comm.send_command(torque_cmd)
+                # [CHANGE 2026-10-15 19:40:00 -04:00] One compound MG for position/torque/status/speed on
+                # RSI axes; the per-metric queries below remain the fallback (ClearCore, MyActuator,
+                # or a service that does not answer compound queries).
+                batched = None
+                if not is_clearcore_axis and not is_myactuator:
+                    batched = _query_axis_batch(active_comm, axis_letter)
+                if batched is not None:
+                    pos_resp, torque_resp, status_resp, speed_resp = batched
+                    raw_resp_str = pos_resp
+                else:
+                    # Position
+                    resp_direct = active_comm.send_command(pos_cmd)
                     if isinstance(resp_direct, str):
                         resp_str = resp_direct.strip()
-                        torque_resp = _extract_numeric_response(resp_str)
-                    if torque_resp is None and not is_myactuator:
-                        time.sleep(0.05)
-                        for _ in range(2):  # Reduced from 3
+
+                        raw_resp_str = resp_str
+                        pos_resp = _extract_numeric_response(resp_str)
+                        if pos_resp is None and axis_letter == 'E':
+                            pos_resp = _extract_clearcore_position(resp_str)
+                    # Only retry for non-MyActuator controllers (Galil serial, etc.)
+                    if pos_resp is None and not is_myactuator:
+                        time.sleep(0.05)  # Reduced from 0.2s
+                        for _ in range(3):  # Reduced from 5 retries
                             if stop_event.is_set():
                                 break
                             try:
-                                resp = active_comm.receive_response(timeout=0.1)
+                                resp = active_comm.receive_response(timeout=0.1)  # Reduced from 0.2s
                                 resp_str = str(resp).strip() if resp is not None else ''
-                                torque_resp = _extract_numeric_response(resp_str)
-                                if torque_resp is not None:
+                                parsed = _extract_numeric_response(resp_str)
+                                if parsed is None and axis_letter == 'E':
+                                    parsed = _extract_clearcore_position(resp_str)
+                                if parsed is not None:
+                                    pos_resp = parsed
+                                    raw_resp_str = resp_str
+                                if pos_resp is not None:
                                     break
                             except Exception:
                                 pass
-                    # Status
-                    resp_direct = active_comm.send_command(status_cmd)
-                    if isinstance(resp_direct, str):
-                        resp_str = resp_direct.strip()
-                        status_resp = _extract_numeric_response(resp_str)
-                    if status_resp is None and not is_myactuator:
-                        time.sleep(0.05)
-                        for _ in range(2):  # Reduced from 3
-                            if stop_event.is_set():
-                                break
-                            try:
-                                resp = active_comm.receive_response(timeout=0.1)
-                                resp_str = str(resp).strip() if resp is not None else ''
-                                status_resp = _extract_numeric_response(resp_str)
-                                if status_resp is not None:
+                    # [CHANGE 2026-03-24 10:55:00 -04:00] Axis E fallback: prefer commanded target, then tracked position cache.
+                    if pos_resp is None and axis_letter == 'E':
+                        try:
+                            cached_pos = getattr(active_comm, 'clearcore_commanded_position', None)
+                            if cached_pos is None:
+                                cached_pos = getattr(active_comm, 'clearcore_last_position', None)
+                            if cached_pos is not None:
+                                pos_resp = str(cached_pos)
+                                if not raw_resp_str:
+                                    raw_resp_str = f'CACHE:{cached_pos}'
+                        except Exception:
+                            pass
+                    if not is_clearcore_axis:
+                        # Torque
+                        resp_direct = active_comm.send_command(torque_cmd)
+                        if isinstance(resp_direct, str):
+                            resp_str = resp_direct.strip()
+                            torque_resp = _extract_numeric_response(resp_str)
+                        if torque_resp is None and not is_myactuator:
+                            time.sleep(0.05)
+                            for _ in range(2):  # Reduced from 3
+                                if stop_event.is_set():
                                     break
-                            except Exception:
-                                pass
-                    # Speed (Galil only; CommMode1)
-                    resp_direct = active_comm.send_command(speed_cmd)
-                    if isinstance(resp_direct, str):
-                        resp_str = resp_direct.strip()
-                        speed_resp = _extract_numeric_response(resp_str)
-                    if speed_resp is None and not is_myactuator:
-                        time.sleep(0.05)
-                        for _ in range(2):  # Reduced from 3
-                            if stop_event.is_set():
-                                break
-                            try:
-                                resp = active_comm.receive_response(timeout=0.1)
-                                resp_str = str(resp).strip() if resp is not None else ''
-                                speed_resp = _extract_numeric_response(resp_str)
-                                if speed_resp is not None:
+                                try:
+                                    resp = active_comm.receive_response(timeout=0.1)
+                                    resp_str = str(resp).strip() if resp is not None else ''
+                                    torque_resp = _extract_numeric_response(resp_str)
+                                    if torque_resp is not None:
+                                        break
+                                except Exception:
+                                    pass
+                        # Status
+                        resp_direct = active_comm.send_command(status_cmd)
+                        if isinstance(resp_direct, str):
+                            resp_str = resp_direct.strip()
+                            status_resp = _extract_numeric_response(resp_str)
+                        if status_resp is None and not is_myactuator:
+                            time.sleep(0.05)
+                            for _ in range(2):  # Reduced from 3
+                                if stop_event.is_set():
                                     break
-                            except Exception:
-                                pass
+                                try:
+                                    resp = active_comm.receive_response(timeout=0.1)
+                                    resp_str = str(resp).strip() if resp is not None else ''
+                                    status_resp = _extract_numeric_response(resp_str)
+                                    if status_resp is not None:
+                                        break
+                                except Exception:
+                                    pass
+                        # Speed (Galil only; CommMode1)
+                        resp_direct = active_comm.send_command(speed_cmd)
+                        if isinstance(resp_direct, str):
+                            resp_str = resp_direct.strip()
+                            speed_resp = _extract_numeric_response(resp_str)
+                        if speed_resp is None and not is_myactuator:
+                            time.sleep(0.05)
+                            for _ in range(2):  # Reduced from 3
+                                if stop_event.is_set():
+                                    break
+                                try:
+                                    resp = active_comm.receive_response(timeout=0.1)
+                                    resp_str = str(resp).strip() if resp is not None else ''
+                                    speed_resp = _extract_numeric_response(resp_str)
+                                    if speed_resp is not None:
+                                        break
+                                except Exception:
+                                    pass
             except Exception:
                 pass
         # 4. Send result to GUI
-        if pos_resp is not None or torque_resp is not None or status_resp is not None or speed_resp is not None:
-
-            window.write_event_value(
-                'POSITION_POLL',
-                {
-                    'servo': active_servo,
-                    'axis_letter': axis_letter,
-                    'pos_resp': pos_resp,
-                    'raw_resp': raw_resp_str,
-                    'torque_resp': torque_resp,
-                    'status_resp': status_resp,
-                    'speed_resp': speed_resp
-                }
-            )
+        values = (pos_resp, torque_resp, status_resp, speed_resp)
+        # [CHANGE 2026-10-15 23:20:00 -04:00] Position text is stripped once here; an empty or bare ':'
+        # reply goes out as None so the GUI tests one condition instead of re-stripping per check.
+        pos_text = str(pos_resp).strip() if pos_resp is not None else None
+        if pos_text in ('', ':'):
+            pos_text = None
+        limit_count = limit_counts.get(active_servo, 0)
+        bounds = limit_pulses.get(active_servo) if limit_pulses else None
+        pulses = _parse_pulses(pos_text) if bounds is not None else None
+        if pulses is not None:
+            # A reply that is not a number leaves the count as it was (the GUI skips its limit check too).
+            limit_count = 0 if bounds[0] <= pulses <= bounds[1] else limit_count + 1
+            limit_counts[active_servo] = limit_count
+        prev_values, prev_sent = last_sent.get(active_servo, (None, 0.0))
+        now = time.monotonic()
+        changed = values != prev_values or now - prev_sent >= POLL_HEARTBEAT_S or limit_count > 0
+        if changed and values != (None, None, None, None):
+            last_sent[active_servo] = (values, now)
+            sample = {
+                'servo': active_servo,
+                'axis_letter': axis_letter,
+                'pos_resp': pos_text,
+                'limit_count': limit_count,
+                'raw_resp': raw_resp_str,
+                'torque_resp': torque_resp,
+                'status_resp': status_resp,
+                'speed_resp': speed_resp
+            }
+            if POLL_SAMPLES.push(sample):
+                window.write_event_value('POSITION_POLL', None)
         # 5. Flush the buffer after processing
         if active_comm and hasattr(active_comm, 'message_queue'):
-            try:
-                while True:
-                    active_comm.message_queue.get_nowait()
-            except queue.Empty:
-                pass
-        # 6. Wait before next cycle
-        time.sleep(0.5)  # 500ms = 2 polls per second
+            _clear_queue(active_comm.message_queue)
+        # 6. Wait before next cycle (default 500ms = 2 polls per second; see set_poll_interval)
+        time.sleep(_poll_interval_s)
 
-def start_polling_thread(window, comm, comm_e=None, comm_h=None):
+def start_polling_thread(window, comm, comm_e=None, comm_h=None, limit_pulses=None):
     """
     Starts the polling thread. Returns (thread, stop_event).
     
@@ -241,9 +409,10 @@ def start_polling_thread(window, comm, comm_e=None, comm_h=None):
         comm: Primary TCP controller comm object (TIM/RSI path for A-D)
         comm_e: ClearCore comm object (axis E), optional
         comm_h: MyActuator comm object (axis H), optional
+        limit_pulses: {servo: (lo, hi)} position bounds in pulses for limit-trip counting, optional
     """
     stop_event = threading.Event()
-    thread = threading.Thread(target=polling_thread_func, args=(window, comm, comm_e, comm_h, stop_event), daemon=True)
+    thread = threading.Thread(target=polling_thread_func, args=(window, comm, comm_e, comm_h, stop_event, limit_pulses), daemon=True)
     thread.start()
     return thread, stop_event
 
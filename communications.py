@@ -1,8 +1,10 @@
 import logging
+import re
 import socket
 import queue
 import threading
 import time
+import concurrent.futures
 
 logging.basicConfig(filename='controller_comm.log',
                     level=logging.INFO,
@@ -44,9 +46,30 @@ Rev 1.3.0 - March 22, 2026 - Add ClearCore Board 1 support
 
 logging.info('ControllerComm module loaded. Logging initialized.')
 
+
+# Leading byte of a Galil _MO reply -> enabled. _MO == 0 means motor ON (enabled).
+# [CHANGE 2026-10-15 18:55:00 -04:00] str keys too, so bytes and decoded replies share one classifier.
+_MO_STATE = {b'0': True, b'1': False, '0': True, '1': False}
+_REPLY_NUMBER_RE = re.compile(r'-?\d+(?:\.\d+)?')
+
+def classify_mo(token):
+    """Classify one _MO reply token (bytes or str): True = enabled, False = disabled, None = unknown."""
+    return _MO_STATE.get(token[:1])
+
+_CONNECT_EXECUTOR = None
+
+def _connect_executor():
+    """Shared single-worker executor for background connects (created on first use)."""
+    global _CONNECT_EXECUTOR
+    if _CONNECT_EXECUTOR is None:
+        _CONNECT_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='comm-connect')
+    return _CONNECT_EXECUTOR
+
+
 class ControllerComm:
     def __init__(self, mode='CommMode1', udp_config=None, serial_config=None, galil_config=None, 
-                 rmp_config=None, myactuator_config=None, clearcore_config=None, rsi_config=None):
+                 rmp_config=None, myactuator_config=None, clearcore_config=None, rsi_config=None,
+                 connect_async=False):
         """
         Initialize the ControllerComm class for various communication modes.
         Args:
@@ -55,6 +78,8 @@ class ControllerComm:
             rsi_config (dict): RSI configuration (ip_address, port) - CommMode1
             clearcore_config (dict): ClearCore Board 1 configuration (ip_address, port) - CommMode6
             myactuator_config (dict): MyActuator configuration (ip, port, motor_id) - CommMode5
+            connect_async (bool): CommMode1 only - open the TCP link on a background thread;
+                       the first use of rsi_sock waits for it to finish.
         """
         self.mode = mode if mode in ['CommMode1', 'CommMode5', 'CommMode6'] else 'CommMode1'
         self.rsi_config = rsi_config or {}
@@ -62,14 +87,41 @@ class ControllerComm:
         self.myactuator_config = myactuator_config or {}
         self.message_queue = queue.Queue()
         self._lock = threading.Lock()
+        # [CHANGE 2026-10-15 11:00:00 -04:00] Outbound command queue drained by one long-lived worker thread.
+        # [CHANGE 2026-10-15 23:55:00 -04:00] queue.Queue: the idle worker blocks on its condition instead of polling.
+        self._tx = queue.Queue()
+        # [CHANGE 2026-10-15 11:50:00 -04:00] Latest payload per coalesce key (e.g. ('A', 'speed')) not yet sent.
+        # [CHANGE 2026-10-16 00:50:00 -04:00] Values are queue slots [cmd, reply_key, barrier]; _tx_barrier counts
+        # uncoalesced sends, and a slot only absorbs a newer payload while no such send is queued behind it.
+        self._pending = {}
+        self._tx_barrier = 0
+        self._pending_lock = threading.Lock()
+        self._tx_thread = None
+        self._window = None
         
+        self._connect_future = None
         if self.mode == 'CommMode1':
-            self._init_rsi()
+            if connect_async:
+                self._connect_future = _connect_executor().submit(self._init_rsi)
+            else:
+                self._init_rsi()
         elif self.mode == 'CommMode6':
             self._init_clearcore()
         elif self.mode == 'CommMode5':
             self._init_myactuator()
 
+    # [CHANGE 2026-10-15 15:10:00 -04:00] rsi_sock resolves a pending background connect on first use.
+    @property
+    def rsi_sock(self):
+        future = self.__dict__.get('_connect_future')
+        if future is not None and not future.done():
+            future.result()
+        return self.__dict__.get('_rsi_sock')
+
+    @rsi_sock.setter
+    def rsi_sock(self, sock):
+        self._rsi_sock = sock
+
     # [CHANGE 2026-03-22] NEW METHOD: Initialize RSI Software TCP connection
     def _init_rsi(self):
         """
@@ -81,9 +133,11 @@ class ControllerComm:
         port = int(self.rsi_config.get('port', 503))
 
         try:
-            self.rsi_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.rsi_sock.settimeout(2.0)
-            self.rsi_sock.connect((ip, port))
+            # Build on a local so a background connect never reads rsi_sock (which waits on it)
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(2.0)
+            sock.connect((ip, port))
+            self.rsi_sock = sock
             logging.info(f"RSI Software connected: {ip}:{port}")
         except Exception as e:
             msg = f"[ERROR] Communications Error (RSI): {e}"
@@ -105,6 +159,35 @@ class ControllerComm:
         except Exception:
             return False
 
+    # [CHANGE 2026-10-15 14:30:00 -04:00] Bytes-level RSI exchange; callers decode only when they need text.
+    def _rsi_transact(self, frame):
+        """
+        Send one framed command (bytes, with \r\n) over the RSI socket and return the
+        stripped raw reply bytes, b"0" on read timeout, or None if the link failed.
+        """
+        if getattr(self, 'rsi_sock', None) is None:
+            return None
+        # Lock ensures each send+recv pair is atomic across threads (polling
+        # thread and GUI event loop share the same socket).  The TIM service
+        # always sends a response for every command, so we always recv to
+        # prevent stale responses from accumulating in the TCP buffer.
+        for _attempt in range(2):
+            with self._lock:
+                try:
+                    self.rsi_sock.sendall(frame)
+                    try:
+                        response = self.rsi_sock.recv(1024).strip()
+                        logging.info('RECV (RSI): %s', response)
+                    except socket.timeout:
+                        response = b"0"
+                    return response
+                except OSError as _sock_err:
+                    logging.warning(f'RSI socket error ({_sock_err}), reconnecting…')
+                    if _attempt == 0 and self._reconnect_rsi():
+                        continue  # retry once on fresh socket
+                    return None
+        return None
+
     def _init_clearcore(self):
         """
         Initialize ClearCore Board 1 via UDP for Axis E (Servo 5).
@@ -420,142 +503,291 @@ class ControllerComm:
             logging.error(msg)
             self.myact_sock = None
 
+    # Query commands whose replies are returned to the caller as text.
+    QUERY_PREFIXES = ('MG', 'TP', 'RP', 'QR', 'QA', 'QZ', 'QM', 'QH', 'QX')
+    # [CHANGE 2026-03-23 16:32:24 -04:00] Treat REQUEST_BUTTON_STATES as a query command in CommMode6.
+    CLEARCORE_QUERY_CMDS = ('GET_BUTTON_STATES', 'REQUEST_BUTTON_STATES')
+
     def send_command(self, cmd):
         """Send a command to the controller."""
         logging.info(f'SENT: {cmd}')
         try:
-            query_prefixes = ('MG', 'TP', 'RP', 'QR', 'QA', 'QZ', 'QM', 'QH', 'QX')
-            cmd_upper = cmd.strip().upper()
-            # [CHANGE 2026-03-23 16:32:24 -04:00] Treat REQUEST_BUTTON_STATES as a query command in CommMode6.
-            clearcore_query_cmds = ('GET_BUTTON_STATES', 'REQUEST_BUTTON_STATES')
-            
-            # [CHANGE 2026-03-22] RSI Software TCP communication (CommMode1)
+            # [CHANGE 2026-10-15 15:30:00 -04:00] Per-mode transports split out; subclasses bind one directly.
             if self.mode == 'CommMode1':
-                if not hasattr(self, 'rsi_sock') or self.rsi_sock is None:
-                    return False
-
-                # Lock ensures each send+recv pair is atomic across threads (polling
-                # thread and GUI event loop share the same socket).  The TIM service
-                # always sends a response for every command, so we always recv to
-                # prevent stale responses from accumulating in the TCP buffer.
-                for _attempt in range(2):
-                    with self._lock:
-                        try:
-                            rsi_cmd = cmd.strip() + '\r\n'
-                            self.rsi_sock.sendall(rsi_cmd.encode())
-                            try:
-                                response = self.rsi_sock.recv(1024).decode().strip()
-                                logging.info(f'RECV (RSI): {response}')
-                            except socket.timeout:
-                                response = "0"
-                            break  # success — exit retry loop
-                        except OSError as _sock_err:
-                            logging.warning(f'RSI socket error ({_sock_err}), reconnecting…')
-                            if _attempt == 0 and self._reconnect_rsi():
-                                continue  # retry once on fresh socket
-                            return False
-                else:
-                    return False
-
-                if cmd_upper.startswith(query_prefixes):
-                    return response
-                return True
-            
-            # ClearCore Board 1 (Axis E)
+                return self._send_rsi(cmd)
             elif self.mode == 'CommMode6':
-                if not hasattr(self, 'clearcore_sock') or self.clearcore_sock is None:
-                    return False
-                
-                clearcore_cmd = self._clearcore_translate(cmd)
-                if isinstance(clearcore_cmd, str) and clearcore_cmd.startswith("__UNSUPPORTED__"):
-                    return "UNSUPPORTED"
-                is_clearcore_query = cmd_upper.startswith(query_prefixes) or cmd_upper in clearcore_query_cmds
-                if not is_clearcore_query:
-                    return self._clearcore_try_send_with_fallback(clearcore_cmd)
-
-                if not clearcore_cmd:
-                    return True
-
-                if is_clearcore_query:
-                    try:
-                        # [CHANGE 2026-03-24 16:14:00 -04:00] Read a short burst of packets; position may arrive after first UDP frame.
-                        original_timeout = self.clearcore_sock.gettimeout()
-                        latest_text = ""
-                        latest_values_text = ""
-                        best_position = None
-
-                        query_cmds = clearcore_cmd if isinstance(clearcore_cmd, (list, tuple)) else [clearcore_cmd]
-                        for query_cmd in query_cmds:
-                            self.clearcore_sock.sendto(query_cmd.encode(), (self.clearcore_ip, self.clearcore_port))
-                            self.clearcore_sock.settimeout(0.06)
-                            deadline = time.time() + 0.18
-
-                            while time.time() < deadline:
-                                try:
-                                    response, addr = self.clearcore_sock.recvfrom(1024)
-                                except socket.timeout:
-                                    continue
-                                response_str = response.decode(errors='ignore').strip()
-                                if response_str:
-                                    latest_text = response_str
-                                    if 'VALUES:' in response_str.upper():
-                                        latest_values_text = response_str
-                                    extracted = self._clearcore_extract_position_token(response_str)
-                                    if extracted is not None:
-                                        best_position = extracted
-
-                        self.clearcore_sock.settimeout(original_timeout)
-
-                        if best_position is not None:
-                            try:
-                                parsed_pos = int(float(str(best_position).strip()))
-                                self.clearcore_last_position = parsed_pos
-                                self.clearcore_commanded_position = parsed_pos
-                            except Exception:
-                                pass
-
-                        # [CHANGE 2026-03-24 10:44:00 -04:00] Prefer VALUES payload because it carries live velocity/position.
-                        if latest_values_text:
-                            logging.info(f'RECV (ClearCore): {latest_values_text}')
-                            return latest_values_text
-
-                        # Fall back to any last payload when VALUES is unavailable.
-                        if latest_text:
-                            logging.info(f'RECV (ClearCore): {latest_text}')
-                            return latest_text
-
-                        if best_position is not None:
-                            logging.info(f'RECV (ClearCore): {best_position}')
-                            return str(best_position)
-                        return "0"
-                    except socket.timeout:
-                        return "0"
-                    finally:
-                        try:
-                            self.clearcore_sock.settimeout(original_timeout)
-                        except Exception:
-                            pass
-                
-                return True
-            
-            # MyActuator (Axis H)
+                return self._send_clearcore(cmd)
             elif self.mode == 'CommMode5':
-                if not hasattr(self, '_myact_send_command'):
-                    if not getattr(self, '_missing_myactuator_handler_logged', False):
-                        logging.error('CommMode5 unavailable: _myact_send_command is not implemented on ControllerComm')
-                        self._missing_myactuator_handler_logged = True
-                    return False
-                return self._myact_send_command(cmd)
-            
+                return self._send_myactuator(cmd)
             else:
                 raise ValueError(f"Unknown mode: {self.mode}")
-        
         except Exception as e:
             print(f"Communications Error: {e}")
             return False
 
+    # [CHANGE 2026-03-22] RSI Software TCP communication (CommMode1)
+    def _send_rsi(self, cmd):
+        """CommMode1 transport: RSI/TIM TCP."""
+        cmd_upper = cmd.strip().upper()
+        query_prefixes = self.QUERY_PREFIXES
+        if not hasattr(self, 'rsi_sock') or self.rsi_sock is None:
+            return False
+
+        response = self._rsi_transact(cmd.strip().encode() + b'\r\n')
+        if response is None:
+            return False
+        # Only query replies are surfaced, so only they are decoded
+        if cmd_upper.startswith(query_prefixes):
+            return response.decode()
+        return True
+
+    def _send_clearcore(self, cmd):
+        """CommMode6 transport: ClearCore Board 1 UDP (Axis E)."""
+        cmd_upper = cmd.strip().upper()
+        query_prefixes = self.QUERY_PREFIXES
+        clearcore_query_cmds = self.CLEARCORE_QUERY_CMDS
+        if not hasattr(self, 'clearcore_sock') or self.clearcore_sock is None:
+            return False
+
+        clearcore_cmd = self._clearcore_translate(cmd)
+        if isinstance(clearcore_cmd, str) and clearcore_cmd.startswith("__UNSUPPORTED__"):
+            return "UNSUPPORTED"
+        is_clearcore_query = cmd_upper.startswith(query_prefixes) or cmd_upper in clearcore_query_cmds
+        if not is_clearcore_query:
+            return self._clearcore_try_send_with_fallback(clearcore_cmd)
+
+        if not clearcore_cmd:
+            return True
+
+        if is_clearcore_query:
+            try:
+                # [CHANGE 2026-03-24 16:14:00 -04:00] Read a short burst of packets; position may arrive after first UDP frame.
+                original_timeout = self.clearcore_sock.gettimeout()
+                latest_text = ""
+                latest_values_text = ""
+                best_position = None
+
+                query_cmds = clearcore_cmd if isinstance(clearcore_cmd, (list, tuple)) else [clearcore_cmd]
+                for query_cmd in query_cmds:
+                    self.clearcore_sock.sendto(query_cmd.encode(), (self.clearcore_ip, self.clearcore_port))
+                    self.clearcore_sock.settimeout(0.06)
+                    deadline = time.time() + 0.18
+
+                    while time.time() < deadline:
+                        try:
+                            response, addr = self.clearcore_sock.recvfrom(1024)
+                        except socket.timeout:
+                            continue
+                        response_str = response.decode(errors='ignore').strip()
+                        if response_str:
+                            latest_text = response_str
+                            if 'VALUES:' in response_str.upper():
+                                latest_values_text = response_str
+                            extracted = self._clearcore_extract_position_token(response_str)
+                            if extracted is not None:
+                                best_position = extracted
+
+                self.clearcore_sock.settimeout(original_timeout)
+
+                if best_position is not None:
+                    try:
+                        parsed_pos = int(float(str(best_position).strip()))
+                        self.clearcore_last_position = parsed_pos
+                        self.clearcore_commanded_position = parsed_pos
+                    except Exception:
+                        pass
+
+                # [CHANGE 2026-03-24 10:44:00 -04:00] Prefer VALUES payload because it carries live velocity/position.
+                if latest_values_text:
+                    logging.info(f'RECV (ClearCore): {latest_values_text}')
+                    return latest_values_text
+
+                # Fall back to any last payload when VALUES is unavailable.
+                if latest_text:
+                    logging.info(f'RECV (ClearCore): {latest_text}')
+                    return latest_text
+
+                if best_position is not None:
+                    logging.info(f'RECV (ClearCore): {best_position}')
+                    return str(best_position)
+                return "0"
+            except socket.timeout:
+                return "0"
+            finally:
+                try:
+                    self.clearcore_sock.settimeout(original_timeout)
+                except Exception:
+                    pass
+
+        return True
+
+    def _send_myactuator(self, cmd):
+        """CommMode5 transport: MyActuator CAN-to-ETH TCP (Axis H)."""
+        if not hasattr(self, '_myact_send_command'):
+            if not getattr(self, '_missing_myactuator_handler_logged', False):
+                logging.error('CommMode5 unavailable: _myact_send_command is not implemented on ControllerComm')
+                self._missing_myactuator_handler_logged = True
+            return False
+        return self._myact_send_command(cmd)
+
+    # [CHANGE 2026-10-15 09:10:00 -04:00] Event-driven enable/disable status reader.
+    # One background thread issues a single batched MG _MOx query per interval and
+    # posts only CHANGED axis states to the GUI, replacing per-tab timer polling.
+    def start_status_reader(self, window, axes='ABCDEFGH', interval=1.0):
+        """
+        Start the background status reader thread.
+        Posts '-AXIS-STATUS-{axis}-' events with value True (enabled) / False (disabled).
+        Returns the threading.Event used to stop the reader.
+        """
+        # [CHANGE 2026-10-15 18:10:00 -04:00] Only one reader per connection; a second start
+        # would double the status round-trips, so hand back the running reader's stop event.
+        running = getattr(self, '_status_stop', None)
+        if running is not None and not running.is_set():
+            self._window = window
+            return running
+        self._window = window
+        self._status_axes = str(axes)
+        self._last_state = {}
+        self._status_wakeup = threading.Event()
+        stop_event = threading.Event()
+        self._status_stop = stop_event
+        thread = threading.Thread(target=self._status_reader, args=(interval, stop_event), daemon=True)
+        thread.start()
+        return stop_event
+
+    def refresh_status(self):
+        """Wake the status reader so the next query runs immediately (e.g. after SH/MO)."""
+        wakeup = getattr(self, '_status_wakeup', None)
+        if wakeup is not None:
+            wakeup.set()
+
+    # [CHANGE 2026-10-15 09:40:00 -04:00] Batched status read: all axes in one round-trip.
+    def get_all_motor_status(self, axes='ABCDEFGH'):
+        """
+        Query enable state for every axis with a single compound command.
+        Sends 'MG _MOA, _MOB, ...' and parses the reply in one pass.
+        Returns: dict {axis_letter: enabled_bool}; empty dict if the reply is unusable.
+        """
+        axes = str(axes)
+        if not axes:
+            return {}
+        cmd = 'MG ' + ', '.join(f'_MO{axis}' for axis in axes)
+        if self.mode == 'CommMode1':
+            # Parse the raw reply bytes directly; no decode needed
+            logging.info(f'SENT: {cmd}')
+            resp = self._rsi_transact(cmd.encode() + b'\r\n')
+            if resp is None:
+                return {}
+        else:
+            resp = self.send_command(cmd)
+            if not isinstance(resp, str):
+                return {}
+            resp = resp.encode()
+        # Galil prints MG arguments space-separated; accept comma-separated replies too.
+        values = resp.replace(b',', b' ').split()
+        if len(values) != len(axes):
+            return {}
+        status = {}
+        for axis, value in zip(axes, values):
+            # [CHANGE 2026-10-15 16:50:00 -04:00] _MO replies are exactly 0.0000 / 1.0000; classify on the
+            # leading digit with one table lookup instead of float() + abs() comparisons.
+            enabled = classify_mo(value)
+            if enabled is None:
+                return {}
+            status[axis] = enabled
+        return status
+
+    @staticmethod
+    def parse_position_reply(resp):
+        """
+        Parse an 'MG _RPx' reply (bytes or str).
+        Returns: the position as a numeric string, or None.
+        """
+        if isinstance(resp, bytes):
+            resp = resp.decode(errors='replace')
+        resp_str = str(resp).strip() if resp is not None else ''
+        # Ignore echoed command responses and empty/colon responses
+        if not resp_str or resp_str == ':' or resp_str.startswith('SENT:'):
+            return None
+        match = _REPLY_NUMBER_RE.search(resp_str)
+        return match.group(0) if match else None
+
+    def _status_reader(self, interval, stop_event):
+        """Reader loop: query all axes once per interval, post only state changes."""
+        while not stop_event.is_set():
+            try:
+                states = self.get_all_motor_status(self._status_axes)
+            except Exception as e:
+                logging.warning(f'Status reader query failed: {e}')
+                states = {}
+            for axis, enabled in states.items():
+                if self._last_state.get(axis) is enabled:
+                    continue
+                self._last_state[axis] = enabled
+                try:
+                    self._window.write_event_value(f'-AXIS-STATUS-{axis}-', enabled)
+                except Exception:
+                    # Window closed; stop posting.
+                    stop_event.set()
+                    break
+            self._status_wakeup.wait(interval)
+            self._status_wakeup.clear()
+
+    # [CHANGE 2026-10-15 11:00:00 -04:00] Non-blocking send for the GUI thread.
+    def send_async(self, cmd, reply_key=None, window=None, coalesce_key=None):
+        """
+        Queue a command for the background worker instead of blocking the caller.
+        When reply_key is given, the worker posts (cmd, response) to the GUI via
+        window.write_event_value(reply_key, ...).
+        When coalesce_key is given (e.g. (axis, 'speed')) and a command with the same
+        key is still waiting, it is replaced in place so only the freshest value is sent.
+        Commands without a coalesce_key are barriers: once one is queued behind the
+        waiting command, a newer payload gets its own slot so it cannot jump ahead of it.
+        """
+        if window is not None:
+            self._window = window
+        if self._tx_thread is None or not self._tx_thread.is_alive():
+            self._tx_thread = threading.Thread(target=self._tx_worker, daemon=True)
+            self._tx_thread.start()
+        with self._pending_lock:
+            if coalesce_key is None:
+                self._tx_barrier += 1
+                self._tx.put((cmd, reply_key, None, None))
+                return
+            slot = self._pending.get(coalesce_key)
+            if slot is not None and slot[2] == self._tx_barrier:
+                slot[0], slot[1] = cmd, reply_key
+                return
+            slot = [cmd, reply_key, self._tx_barrier]
+            self._pending[coalesce_key] = slot
+            self._tx.put((cmd, reply_key, coalesce_key, slot))
+
+    def _tx_worker(self):
+        """Single writer thread: drain the outbound queue in order, post replies to the GUI."""
+        while True:
+            cmd, reply_key, coalesce_key, slot = self._tx.get()
+            if slot is not None:
+                # Slot keeps its original queue position but carries the latest payload
+                with self._pending_lock:
+                    cmd, reply_key = slot[0], slot[1]
+                    if self._pending.get(coalesce_key) is slot:
+                        del self._pending[coalesce_key]
+            if cmd is None:
+                break
+            response = self.send_command(cmd)
+            if reply_key and self._window is not None:
+                try:
+                    self._window.write_event_value(reply_key, (cmd, response))
+                except Exception:
+                    pass
+
     def close(self):
         """Cleanly close the communications channel."""
+        if self._tx_thread is not None and self._tx_thread.is_alive():
+            self._tx.put((None, None, None, None))
+        if getattr(self, '_status_stop', None) is not None:
+            self._status_stop.set()
+            self._status_wakeup.set()
         if self.mode == 'CommMode1':
             if hasattr(self, 'rsi_sock') and self.rsi_sock:
                 self.rsi_sock.close()
@@ -566,4 +798,63 @@ class ControllerComm:
             if hasattr(self, 'myact_sock') and self.myact_sock:
                 self.myact_sock.close()
 
-    # ... (keep all existing MyActuator methods unchanged)
\ No newline at end of file
+    # ... (keep all existing MyActuator methods unchanged)
+
+
+# [CHANGE 2026-10-15 15:30:00 -04:00] Mode-specific subclasses: transport chosen once at construction,
+# so send_command skips the per-call mode branch.
+class RsiComm(ControllerComm):
+    """CommMode1: RSI/TIM TCP for Axes A-D."""
+    def __init__(self, **kwargs):
+        super().__init__(mode='CommMode1', **kwargs)
+
+    def send_command(self, cmd):
+        logging.info(f'SENT: {cmd}')
+        try:
+            return self._send_rsi(cmd)
+        except Exception as e:
+            print(f"Communications Error: {e}")
+            return False
+
+
+class ClearCoreComm(ControllerComm):
+    """CommMode6: ClearCore Board 1 UDP for Axis E."""
+    def __init__(self, **kwargs):
+        super().__init__(mode='CommMode6', **kwargs)
+
+    def send_command(self, cmd):
+        logging.info(f'SENT: {cmd}')
+        try:
+            return self._send_clearcore(cmd)
+        except Exception as e:
+            print(f"Communications Error: {e}")
+            return False
+
+
+class MyActuatorComm(ControllerComm):
+    """CommMode5: MyActuator CAN-to-ETH TCP for Axis H."""
+    def __init__(self, **kwargs):
+        super().__init__(mode='CommMode5', **kwargs)
+
+    def send_command(self, cmd):
+        logging.info(f'SENT: {cmd}')
+        try:
+            return self._send_myactuator(cmd)
+        except Exception as e:
+            print(f"Communications Error: {e}")
+            return False
+
+
+COMM_CLASSES = {
+    'CommMode1': RsiComm,
+    'CommMode5': MyActuatorComm,
+    'CommMode6': ClearCoreComm,
+}
+
+
+def make_comm(mode, **kwargs):
+    """Return the ControllerComm subclass instance for `mode` (plain ControllerComm if unknown)."""
+    cls = COMM_CLASSES.get(mode)
+    if cls is None:
+        return ControllerComm(mode=mode, **kwargs)
+    return cls(**kwargs)
@@ -0,0 +1,53 @@
+"""
+numba_kernels.py
+
+Unit-conversion kernel for the servo position path (controller pulses -> degrees).
+Intended for use with ControllerGUI.py.
+
+The functions are compiled with Numba when it is installed and the environment
+variable CONTROLLER_USE_NUMBA is set to 1/true/yes. Otherwise the same functions
+run as plain Python, so the GUI has no hard dependency on it and small targets
+skip the one-time JIT warmup.
+
+Exports:
+    HAS_NUMBA
+        - True when the kernels are JIT-compiled (Numba installed and enabled).
+    poll_pipeline(raw, inv_arr, lo_arr, hi_arr, out)
+        - out[i] = raw[i] * inv_arr[i] plus a range check; returns a bitmask with bit i set when lo <= out[i] <= hi.
+"""
+
+import os
+
+# [CHANGE 2026-10-15 19:15:00 -04:00] Optional Numba JIT for the per-sample conversion math.
+# [CHANGE 2026-10-15 20:40:00 -04:00] Opt-in via CONTROLLER_USE_NUMBA so cold start stays cheap by default.
+try:
+    if os.environ.get('CONTROLLER_USE_NUMBA', '').strip().lower() not in ('1', 'true', 'yes'):
+        raise ImportError('CONTROLLER_USE_NUMBA not set')
+    from numba import njit
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when Numba is not installed: returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# [CHANGE 2026-10-15 20:30:00 -04:00] Conversion and limit check fused into one pass over the axes.
+# No fastmath here: unpolled axes are NaN and the comparisons must stay IEEE-correct.
+@njit(cache=True)
+def poll_pipeline(raw, inv_arr, lo_arr, hi_arr, out):
+    """
+    Convert raw pulses to degrees into out and range-check each axis in the same loop.
+    Returns an int bitmask: bit i is set when lo_arr[i] <= out[i] <= hi_arr[i]
+    (NaN inputs leave their bit clear).
+    """
+    bits = 0
+    for i in range(len(raw)):
+        d = raw[i] * inv_arr[i]
+        out[i] = d
+        if lo_arr[i] <= d <= hi_arr[i]:
+            bits |= 1 << i
+    return bits
@@ -1,5 +1,10 @@
 # Utility: display ints without decimals, otherwise round to 1 decimal place
+# [CHANGE 2026-10-16 00:20:00 -04:00] Single shared implementation (ControllerGUI imports it from here).
+# Ints skip the float round-trip; everything else keeps round()'s half-even result.
 def format_display_value(val):
+    """Display ints without decimals; otherwise one decimal place."""
+    if isinstance(val, int):
+        return str(int(val))
     try:
         fval = round(float(val), 1)
         if fval.is_integer():
@@ -39,22 +44,53 @@ CLASS:
 import FreeSimpleGUI as sg
 
 # Read axis parameters from controller_config.ini
-import configparser
+import functools
 import os
-AXIS_UNITS = {}
-axis_ini = configparser.ConfigParser()
-axis_ini.read(os.path.join(os.path.dirname(__file__), 'controller_config.ini'))
-for axis in 'ABCDEFGH':
-    section = f'AXIS_{axis}'
-    if section in axis_ini:
-        AXIS_UNITS[axis] = {
-            'min': float(axis_ini[section]['min']),
-            'max': float(axis_ini[section]['max']),
-            'pulses': float(axis_ini[section]['pulses']),
-            'degrees': float(axis_ini[section]['degrees']),
-            'scaling': float(axis_ini[section]['scaling']),
-            'gearbox': float(axis_ini[section]['gearbox'])
-        }
+import re
+import types
+
+AXIS_INI_PATH = os.path.join(os.path.dirname(__file__), 'controller_config.ini')
+
+# [CHANGE 2026-10-15 19:50:00 -04:00] One regex pass over the file instead of configparser: the keypad
+# only needs the numeric limits/scaling of the [AXIS_x] sections.
+_AXIS_FIELDS = ('min', 'max', 'pulses', 'degrees', 'scaling', 'gearbox')
+_AXIS_SECTION_RE = re.compile(r'^\[AXIS_([A-H])\][ \t]*$(.*?)(?=^\[|\Z)', re.M | re.S)
+_AXIS_NUMBER_RE = re.compile(r'^[ \t]*(\w+)[ \t]*[=:][ \t]*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)[ \t]*$', re.M)
+
+# [CHANGE 2026-10-15 19:05:00 -04:00] Parse the INI once per (path, mtime); the result is read-only
+# so every caller can share it. Edits to the file change mtime and are picked up on the next load.
+@functools.lru_cache(maxsize=None)
+def _load_axis_units(path, mtime):
+    """Scan the AXIS_x sections of `path` into a read-only {axis: {field: float}} mapping."""
+    # [CHANGE 2026-10-16 00:25:00 -04:00] The GUI rewrites the INI in the locale encoding (descriptions may
+    # be non-ASCII); only the ASCII numeric fields matter here, so undecodable bytes are replaced.
+    # A section missing a field simply omits it.
+    try:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            text = f.read()
+    except (OSError, ValueError):
+        text = ''
+    units = {}
+    for section in _AXIS_SECTION_RE.finditer(text):
+        fields = {key.lower(): value for key, value in _AXIS_NUMBER_RE.findall(section.group(2))}
+        units[section.group(1)] = types.MappingProxyType(
+            {key: float(fields[key]) for key in _AXIS_FIELDS if fields.get(key) is not None})
+    return types.MappingProxyType(units)
+
+def load_axis_units(path=AXIS_INI_PATH):
+    """Return the cached axis table for `path`, re-parsing only if the file changed."""
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        mtime = None
+    return _load_axis_units(path, mtime)
+
+# [CHANGE 2026-10-15 20:05:00 -04:00] AXIS_UNITS is resolved on first access (PEP 562) so importing
+# NumericKeypad does not read the INI; callers that pass explicit limits never read it at all.
+def __getattr__(name):
+    if name == 'AXIS_UNITS':
+        return load_axis_units()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class NumericKeypad:
     def __init__(self, title, current_value, axis_letter, font=None, unit_label='', min_val=None, max_val=None):
@@ -68,11 +104,13 @@ class NumericKeypad:
         if min_val is not None and max_val is not None:
             self.min_val = min_val
             self.max_val = max_val
-        elif axis_letter in AXIS_UNITS:
-            self.min_val = AXIS_UNITS[axis_letter]['min']
-            self.max_val = AXIS_UNITS[axis_letter]['max']
         else:
-            raise ValueError(f"Axis letter '{axis_letter}' not found in AXIS_UNITS.")
+            axis_units = load_axis_units()
+            limits = axis_units.get(axis_letter)
+            if limits is None or limits.get('min') is None or limits.get('max') is None:
+                raise ValueError(f"Axis letter '{axis_letter}' has no min/max in AXIS_UNITS.")
+            self.min_val = limits['min']
+            self.max_val = limits['max']
         self.font = font if font else ('Courier New', 10)
         self.unit_label = unit_label
 
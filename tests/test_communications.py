@@ -0,0 +1,65 @@
+"""
+ControllerComm - Test Outbound Queue
+====================================
+
+Unit tests for send_async ordering and coalescing.
+"""
+
+import threading
+
+import pytest
+from communications import ControllerComm
+
+
+class TestSendAsync:
+    """Test the send_async writer queue."""
+
+    @pytest.fixture
+    def comm(self):
+        """ControllerComm with no transport; the writer is held on its first command."""
+        comm = ControllerComm(mode='none')
+        comm.sent = []
+        comm.started = threading.Event()
+        comm.release = threading.Event()
+
+        def send_command(cmd):
+            comm.sent.append(cmd)
+            if cmd == 'HOLD':
+                comm.started.set()
+                comm.release.wait(2)
+            return ':'
+
+        comm.send_command = send_command
+        comm.send_async('HOLD')
+        assert comm.started.wait(2)
+        yield comm
+        comm.release.set()
+        comm.close()
+        comm._tx_thread.join(2)
+
+    def _drain(self, comm):
+        comm.release.set()
+        comm.close()
+        comm._tx_thread.join(2)
+        return comm.sent[1:]
+
+    def test_coalesce_same_key(self, comm):
+        """Back-to-back writes with one key send only the latest payload."""
+        comm.send_async('PA A=1000', coalesce_key=('A', 'abs_pos'))
+        comm.send_async('PA A=5000', coalesce_key=('A', 'abs_pos'))
+        assert self._drain(comm) == ['PA A=5000']
+
+    def test_coalesce_does_not_pass_barrier(self, comm):
+        """A newer payload must not jump ahead of an uncoalesced command queued after the first."""
+        comm.send_async('PA A=1000', coalesce_key=('A', 'abs_pos'))
+        comm.send_async('BGA')
+        comm.send_async('PA A=5000', coalesce_key=('A', 'abs_pos'))
+        assert self._drain(comm) == ['PA A=1000', 'BGA', 'PA A=5000']
+
+    def test_coalesce_after_barrier_slot(self, comm):
+        """Writes behind a barrier still coalesce into the slot queued after it."""
+        comm.send_async('PA A=1000', coalesce_key=('A', 'abs_pos'))
+        comm.send_async('STA')
+        comm.send_async('PA A=5000', coalesce_key=('A', 'abs_pos'))
+        comm.send_async('PA A=7000', coalesce_key=('A', 'abs_pos'))
+        assert self._drain(comm) == ['PA A=1000', 'STA', 'PA A=7000']
@@ -93,6 +93,15 @@ class TestAxisRouter:
         assert enabled == "1"
         assert disabled == "0"
 
+    # [CHANGE 2026-10-15 19:40:00 -04:00] Compound MG queries batch several operands per round-trip.
+    def test_dispatch_compound_mg_query(self, router, monkeypatch):
+        """Compound MG query should answer each operand, space-separated, in order."""
+        # Stub the adapter so the test covers the router's split/join, not RapidCode availability.
+        replies = {"MG _SPA": "123.0", "MG _TCA": "0"}
+        monkeypatch.setattr(router.rapidcode, "handle_command", lambda command, axis: replies[command])
+        response = router.dispatch("MG _SPA, _TCA")
+        assert response == "123.0 0"
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
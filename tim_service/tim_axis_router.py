@@ -64,6 +64,12 @@ class AxisRouter:
         
         if not command:
             return "0"
+
+        # [CHANGE 2026-10-15 19:40:00 -04:00] Compound query: "MG _RPA, _TCA, _MOA" is answered in one
+        # reply with the operand values space-separated, as a Galil controller prints them.
+        if command.startswith('MG ') and ',' in command:
+            operands = [op.strip() for op in command[3:].split(',')]
+            return ' '.join(str(self.dispatch(f'MG {op}')) for op in operands if op)
         
         # Handle broadcast commands (no axis)
         # [CHANGE 2026-04-17 16:45:00 -04:00] Support MG _GN and other broadcast queries.